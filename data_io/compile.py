@@ -1,6 +1,6 @@
 """Functions and classes for compilation of data to write to targets.
 """
-from typing import Dict, List, Tuple
+from typing import List, Mapping, Sequence, Tuple
 from model.system import CompBeamModel
 from pandas import DataFrame
 from model.elements import Node
@@ -49,11 +49,11 @@ def df_comp_beam_model(model: CompBeamModel) -> DataFrame:
     )
 
 
-def df_node_masses(node_masses: Dict[Node, List[Mass]]) -> DataFrame:
+def df_node_masses(node_masses: Mapping[Node, Sequence[Mass]]) -> DataFrame:
     """Compiles a DataFrame form a dict of mass lists.
 
     :param node_masses: dict of list of mass per node
-    :type node_masses: Dict[Node, List[Mass]]
+    :type node_masses: Mapping[Node, Sequence[Mass]]
 
     :return: DataFrame with flatmapped node.x, dof, mass_value
     :rtype: DataFrame
@@ -75,6 +75,26 @@ def df_node_masses(node_masses: Dict[Node, List[Mass]]) -> DataFrame:
     )
 
 
+def df_line_masses(line_masses: Sequence[Tuple[float, float, float]]) -> DataFrame:
+    """Compiles a DataFrame from line masses, see CompBeamModel.line_masses.
+
+    :param line_masses: x_start, x_end and mass per length of each line mass
+    :type line_masses: Sequence[Tuple[float, float, float]]
+
+    :return: DataFrame with x_start, x_end, mass_per_length
+    :rtype: DataFrame
+
+    :raises ValueError: if line_masses is empty
+    """
+    if len(line_masses) == 0:
+        raise ValueError("Empty sequence of line masses")
+
+    return DataFrame(
+        [list(line_mass) for line_mass in line_masses],
+        columns=[f"{AXIS.X.lower}_start", f"{AXIS.X.lower}_end", "mass_per_length"],
+    )
+
+
 def df_dofs(nodes: List[Node]) -> DataFrame:
     """Compiles a list of DOF for a list of nodes.
 
@@ -100,11 +120,11 @@ def df_dofs(nodes: List[Node]) -> DataFrame:
     )
 
 
-def df_springs(springs: Dict[Node, Spring]) -> DataFrame:
+def df_springs(springs: Mapping[Node, Spring]) -> DataFrame:
     """Compiles a DataFrame of springs.
 
     :param springs: dictionary of springs
-    :type springs: Dict[Node, Spring]
+    :type springs: Mapping[Node, Spring]
 
     :return: DataFrame of springs
     :rtype: DataFrame
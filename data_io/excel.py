@@ -3,7 +3,11 @@
 from pandas import DataFrame
 from pandas import ExcelWriter as PExcelWriter  # type: ignore
 from data_io.base import BaseWriter
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple, Set
+
+# maximum length of sheet names and characters not allowed in sheet names of Excel
+_MAX_SHEET_NAME_LENGTH: int = 31
+_INVALID_SHEET_NAME_CHARS: str = "[]:*?/\\"
 
 
 class ExcelWriter(BaseWriter):
@@ -41,44 +45,119 @@ class ExcelWriter(BaseWriter):
 
         :freq: [DataFrame] -- Frequency data
         :msv: [DataFrame] -- Mode shape values
+        :planes: [Dict[str, Tuple[DataFrame, DataFrame]]] -- Frequency data and mode shape values by bending plane
         :details: [Dict[str, DataFrame]] -- Information to the data saved
 
-        :raises ValueError: If file_name is not set or freq or msv is None
+        Sheet names are made valid for Excel and unique, names of planes are truncated to 31 characters, see
+        get_sheet_name().
+
+        :raises ValueError: If file_name is not set or freq or msv is None and no planes are provided
         """
         freq: Optional[DataFrame] = kwargs.get("freq", None)
         msv: Optional[DataFrame] = kwargs.get("msv", None)
+        planes: Dict[str, Tuple[DataFrame, DataFrame]] = kwargs.get("planes", {})
         details: Optional[Dict[str, DataFrame]] = kwargs.get("details", None)
 
         if self.file_name == "":
             raise ValueError("File name not set")
-        if freq is None:
+        if freq is None and len(planes) == 0:
             raise ValueError("Frequency data undefined")
-        if msv is None:
+        if msv is None and len(planes) == 0:
             raise ValueError("Mode shape values undefined")
 
         with PExcelWriter(  # pylint: disable=abstract-class-instantiated
             self._file_name
         ) as ew:
 
+            sheet_names: Set[str] = set()
             if details is not None:
                 for key, detail in details.items():
-                    detail.to_excel(ew, sheet_name=key)     # type: ignore
-            freq.to_excel(ew, sheet_name="frequencies")     # type: ignore
-            msv.to_excel(ew, sheet_name="modes", engine="xlsxwriter")   # type: ignore
-
-            sheet = ew.sheets["modes"]
-            chart = ew.book.add_chart({"type": "scatter", "subtype": "straight"})
-            chart.set_title({"name": "Mode Shapes"})
-            sheet.insert_chart("G4", chart)
-            num_msv: int = msv.shape[0]
-
-            for col_idx in range(0, freq.shape[0]):
-                chart.add_series(
-                    {
-                        "name": freq.index[col_idx],
-                        "categories": ["modes", 1, 1, num_msv, 1],
-                        "values": ["modes", 1, 2 + col_idx, num_msv, 2 + col_idx],
-                        "line": {"width": 1},
-                        "marker": {"type": "none"},
-                    }
+                    sheet_name: str = ExcelWriter.get_sheet_name(key, sheet_names)
+                    detail.to_excel(ew, sheet_name=sheet_name)     # type: ignore
+            if freq is not None and msv is not None:
+                ExcelWriter._write_results(
+                    ew,
+                    freq,
+                    msv,
+                    ExcelWriter.get_sheet_name("frequencies", sheet_names),
+                    ExcelWriter.get_sheet_name("modes", sheet_names),
+                    "Mode Shapes",
+                )
+            for name, (plane_freq, plane_msv) in planes.items():
+                ExcelWriter._write_results(
+                    ew,
+                    plane_freq,
+                    plane_msv,
+                    ExcelWriter.get_sheet_name(f"frequencies {name}", sheet_names),
+                    ExcelWriter.get_sheet_name(f"modes {name}", sheet_names),
+                    f"Mode Shapes {name}",
                 )
+
+    @staticmethod
+    def get_sheet_name(name: str, used: Set[str]) -> str:
+        """Returns a valid sheet name of Excel for the name that is not used yet and adds it to used.
+
+        Characters not allowed by Excel are replaced by '_', names are truncated to 31 characters. A name that is
+        used already, ignoring case like Excel, is made unique by a suffix ' (<n>)'.
+
+        :param name: name of the sheet
+        :type name: str
+        :param used: lower case sheet names used already, extended by the returned name
+        :type used: Set[str]
+
+        :return: valid and unique sheet name
+        :rtype: str
+        """
+        name = "".join("_" if c in _INVALID_SHEET_NAME_CHARS else c for c in name)
+        sheet_name: str = name[:_MAX_SHEET_NAME_LENGTH].rstrip()
+        count: int = 1
+        while sheet_name.lower() in used:
+            count += 1
+            suffix: str = f" ({count})"
+            sheet_name = name[: _MAX_SHEET_NAME_LENGTH - len(suffix)].rstrip() + suffix
+        used.add(sheet_name.lower())
+        return sheet_name
+
+    @staticmethod
+    def _write_results(
+        ew: PExcelWriter,
+        freq: DataFrame,
+        msv: DataFrame,
+        sheet_freq: str,
+        sheet_modes: str,
+        title: str,
+    ) -> None:
+        """Writes frequencies and mode shape values to sheets and adds a chart of the mode shapes.
+
+        :param ew: pandas excel writer
+        :type ew: PExcelWriter
+        :param freq: Frequency data
+        :type freq: DataFrame
+        :param msv: Mode shape values
+        :type msv: DataFrame
+        :param sheet_freq: name of the sheet of frequencies
+        :type sheet_freq: str
+        :param sheet_modes: name of the sheet of mode shape values
+        :type sheet_modes: str
+        :param title: title of the chart
+        :type title: str
+        """
+        freq.to_excel(ew, sheet_name=sheet_freq)     # type: ignore
+        msv.to_excel(ew, sheet_name=sheet_modes, engine="xlsxwriter")   # type: ignore
+
+        sheet = ew.sheets[sheet_modes]
+        chart = ew.book.add_chart({"type": "scatter", "subtype": "straight"})
+        chart.set_title({"name": title})
+        sheet.insert_chart("G4", chart)
+        num_msv: int = msv.shape[0]
+
+        for col_idx in range(0, freq.shape[0]):
+            chart.add_series(
+                {
+                    "name": freq.index[col_idx],
+                    "categories": [sheet_modes, 1, 1, num_msv, 1],
+                    "values": [sheet_modes, 1, 2 + col_idx, num_msv, 2 + col_idx],
+                    "line": {"width": 1},
+                    "marker": {"type": "none"},
+                }
+            )
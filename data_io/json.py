@@ -16,6 +16,11 @@ from model.core import DOF_TYPE
 from model.beams import ABeam
 from model.beams import BeamB_2DOF
 from model.beams import BeamB_2DOF_II
+from model.beams import BeamBT_2DOF
+from model.beams import BeamBT_2DOF_II
+from model.beams import BeamBQ_3DOF
+from model.beams import BeamBQ_3DOF_II
+from model.beams import BeamB_3DOF
 from json import load
 from copy import deepcopy
 
@@ -58,6 +63,16 @@ class JsonReader(BaseReader):
             return BeamB_2DOF
         elif id_upper == "B_2DOF_II" or id_upper == "B_2DOF_pDelta":
             return BeamB_2DOF_II
+        elif id_upper == "B_3DOF":
+            return BeamB_3DOF
+        elif id_upper == "BT_2DOF":
+            return BeamBT_2DOF
+        elif id_upper == "BT_2DOF_II":
+            return BeamBT_2DOF_II
+        elif id_upper == "BQ_3DOF":
+            return BeamBQ_3DOF
+        elif id_upper == "BQ_3DOF_II":
+            return BeamBQ_3DOF_II
         else:
             raise TypeError(f'Unsupported beam type "{identifier}"')
 
@@ -88,6 +103,24 @@ class JsonReader(BaseReader):
 
         return mass
 
+    @staticmethod
+    def _get_spring(definition: Dict[str, float]) -> Spring:
+        """Creates a spring from a dictionary.
+
+        :param definition: dictionary to create spring from, entry "x" is ignored
+        :type definition: Dict[str, float]
+
+        :return: spring created from dictionary
+        :rtype: Spring
+
+        :raises KeyError: if entries (keys) are not supported
+        """
+        spring: Spring = Spring()
+        for key, value in definition.items():
+            if key != "x":
+                spring.set_value(JsonReader._get_dof(key), value)
+        return spring
+
     @staticmethod
     def _to_model(model_data: Dict[str, Any]) -> CompBeamModel:
         """Extracts the beam model from the read json data.
@@ -120,9 +153,15 @@ class JsonReader(BaseReader):
                 model.append(**beam)
 
         if "masses" in model_data and len(model_data["masses"]) > 0:
-            for mass_dict in model_data["masses"]:
-                mass: Mass = JsonReader._get_mass(mass_dict)
-                model.assign_mass(mass, mass_dict["x"])
+            model.assign_masses(
+                [mass_dict["x"] for mass_dict in model_data["masses"]],
+                [JsonReader._get_mass(mass_dict) for mass_dict in model_data["masses"]],
+            )
+
+        for line_mass in model_data.get("line_masses", []):
+            model.add_line_mass(
+                line_mass["x_start"], line_mass["x_end"], line_mass["mass_per_length"]
+            )
 
         if "dofs" in model_data and len(model_data["dofs"]) > 0:
             for dof in model_data["dofs"]:
@@ -134,11 +173,20 @@ class JsonReader(BaseReader):
         if "springs" in model_data and len(model_data["springs"]) > 0:
             for spring in model_data["springs"]:
                 spring_node: Node = model.get_node_by_height(spring["x"])
-                new_spring: Spring = Spring()
-                for key, value in spring.items():
-                    if key != "x":
-                        new_spring.set_value(JsonReader._get_dof(key), value)
-                model.attach_spring(spring_node, new_spring)
+                model.attach_spring(spring_node, JsonReader._get_spring(spring))
+
+        if "planes" in model_data:
+            for name, plane_data in model_data["planes"].items():
+                for mass_dict in plane_data.get("masses", []):
+                    model.assign_plane_mass(
+                        name, JsonReader._get_mass(mass_dict), mass_dict["x"]
+                    )
+                for spring in plane_data.get("springs", []):
+                    model.attach_plane_spring(
+                        name,
+                        model.get_node_by_height(spring["x"]),
+                        JsonReader._get_spring(spring),
+                    )
 
         return model
 
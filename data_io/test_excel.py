@@ -0,0 +1,77 @@
+from unittest import TestCase
+from data_io.excel import ExcelWriter
+from pandas import DataFrame
+from pandas import ExcelFile
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import List, Set
+
+
+class TestExcelWriter(TestCase):
+    def test_get_sheet_name(self) -> None:
+        """
+        < Test sheet names are valid for Excel and unique
+        """
+        print(TestExcelWriter.test_get_sheet_name.__doc__.strip())  # type: ignore
+
+        used: Set[str] = {"modes"}
+        names: List[str] = [
+            ExcelWriter.get_sheet_name(name, used)
+            for name in (
+                "frequencies fore-aft",
+                "Modes",
+                "frequencies side-side with rotor",
+                "frequencies side-side with rotor mass",
+                "modes a/b [1]",
+            )
+        ]
+        print(f"     {names}")
+        self.assertEqual(
+            [
+                "frequencies fore-aft",
+                "Modes (2)",
+                "frequencies side-side with roto",
+                "frequencies side-side with (2)",
+                "modes a_b _1_",
+            ],
+            names,
+        )
+        self.assertTrue(all(len(name) <= 31 for name in names))
+        self.assertEqual(6, len(used))
+
+        print("> OK")
+
+    def test_write_long_plane_names(self) -> None:
+        """
+        < Test writing results of planes with names exceeding the length of sheet names of Excel
+        """
+        print(TestExcelWriter.test_write_long_plane_names.__doc__.strip())  # type: ignore
+
+        freq: DataFrame = DataFrame(
+            {"frequency": [0.3, 2.1]}, index=["mode 1", "mode 2"]
+        )
+        msv: DataFrame = DataFrame(
+            {"x": [0.0, 10.0], "mode 1": [0.0, 1.0], "mode 2": [0.0, -1.0]}
+        )
+        with TemporaryDirectory() as directory:
+            file_name: str = str(Path(directory) / "planes.xlsx")
+            ExcelWriter().set_file_name(file_name).write(
+                planes={
+                    "fore-aft with rotor mass A": (freq, msv),
+                    "fore-aft with rotor mass B": (freq, msv),
+                }
+            )
+            with ExcelFile(file_name) as excel_file:
+                sheet_names: List[str] = list(excel_file.sheet_names)  # type: ignore
+        print(f"     {sheet_names}")
+        self.assertEqual(
+            [
+                "frequencies fore-aft with rotor",
+                "modes fore-aft with rotor mass",
+                "frequencies fore-aft with r (2)",
+                "modes fore-aft with rotor m (2)",
+            ],
+            sheet_names,
+        )
+
+        print("> OK")
@@ -2,11 +2,15 @@ from unittest import TestCase
 from data_io.json import JsonReader
 from model.system import CompBeamModel
 from model.beams import BeamB_2DOF
+from model.beams import BeamB_3DOF
+from model.beams import BeamBT_2DOF_II
+from model.beams import BeamBQ_3DOF_II
 from model.entry import Mass
 from model.core import DOF
 from model.core import DOF_TYPE
 from pathlib import Path
 from typing import Dict, Any, List
+import json
 
 
 class TestJsonReader(TestCase):
@@ -81,3 +85,113 @@ class TestJsonReader(TestCase):
         self.assertEqual(parameters, file_content["parameters"])
 
         print("> OK")
+
+    def test_read_3DOF(self) -> None:
+        """
+        < Reads model with beam type B_3DOF from JSON data.
+        """
+        print(TestJsonReader.test_read_3DOF.__doc__.strip())  # type: ignore
+
+        json_file: Path = (
+            Path(__file__).parent.absolute() / "ut" / "model_definition.json"
+        )
+        with open(json_file, "r") as file:
+            model_data: Dict[str, Any] = json.load(file)["model"]
+        model_data["beam_type"] = "B_3DOF"
+        model_data["dofs"][0]["u"] = 0.0
+
+        model: CompBeamModel = JsonReader._to_model(model_data)
+        print(f"    beam type = {model.beam_type}")
+        self.assertTrue(isinstance(model.start_beam, BeamB_3DOF))
+        self.assertEqual((DOF.U, DOF.W, DOF.PHI), model.dofs)
+        assert model.start_node is not None
+        self.assertEqual(0.0, model.start_node.get_dof(DOF.U))
+
+        print("> OK")
+
+    def test_read_tapered(self) -> None:
+        """
+        < Reads model with beam type BT_2DOF_II of conical cans from JSON data.
+        """
+        print(TestJsonReader.test_read_tapered.__doc__.strip())  # type: ignore
+
+        json_file: Path = (
+            Path(__file__).parent.absolute() / "ut" / "model_definition.json"
+        )
+        with open(json_file, "r") as file:
+            model_data: Dict[str, Any] = json.load(file)["model"]
+        model_data["beam_type"] = "BT_2DOF_II"
+        model_data["beams"] = [
+            {
+                "length": 25.0,
+                "diameter_1": 6.0 - idx * 0.5,
+                "diameter_2": 5.5 - idx * 0.5,
+                "thickness_1": 0.05 - idx * 0.005,
+                "thickness_2": 0.045 - idx * 0.005,
+                "e_modul": 2.1e11,
+                "mass": 1.5e5 - idx * 2.0e4,
+            }
+            for idx in range(4)
+        ]
+
+        model: CompBeamModel = JsonReader._to_model(model_data)
+        print(f"    beam type = {model.beam_type}")
+        self.assertTrue(isinstance(model.start_beam, BeamBT_2DOF_II))
+        self.assertEqual(4, model.count)
+        self.assertEqual(2, model.order)
+        self.assertEqual((5.0, 4.5), model.get(2).diameters)  # type: ignore
+        self.assertEqual(3, model.mass_count())
+
+        print("> OK")
+
+    def test_read_quintic(self) -> None:
+        """
+        < Reads model with beam type BQ_3DOF_II from JSON data.
+        """
+        print(TestJsonReader.test_read_quintic.__doc__.strip())  # type: ignore
+
+        json_file: Path = (
+            Path(__file__).parent.absolute() / "ut" / "model_definition.json"
+        )
+        with open(json_file, "r") as file:
+            model_data: Dict[str, Any] = json.load(file)["model"]
+        model_data["beam_type"] = "BQ_3DOF_II"
+
+        model: CompBeamModel = JsonReader._to_model(model_data)
+        print(f"    beam type = {model.beam_type}")
+        self.assertTrue(isinstance(model.start_beam, BeamBQ_3DOF_II))
+        self.assertEqual((DOF.W, DOF.PHI, DOF.KAPPA), model.dofs)
+        self.assertEqual(2, model.order)
+
+        print("> OK")
+
+    def test_read_line_masses(self) -> None:
+        """
+        < Reads model with line masses from JSON data.
+        """
+        print(TestJsonReader.test_read_line_masses.__doc__.strip())  # type: ignore
+
+        json_file: Path = (
+            Path(__file__).parent.absolute() / "ut" / "model_definition.json"
+        )
+        with open(json_file, "r") as file:
+            model_data: Dict[str, Any] = json.load(file)["model"]
+        model_data["line_masses"] = [
+            {"x_start": 10.0, "x_end": 60.0, "mass_per_length": 20.0},
+            {"x_start": 0.0, "x_end": 200.0, "mass_per_length": 5.0},
+        ]
+
+        model: CompBeamModel = JsonReader._to_model(model_data)
+        print(f"    line masses = {model.line_masses}")
+        self.assertEqual(2, model.line_mass_count)
+        self.assertEqual((10.0, 60.0, 20.0), model.line_masses[0])
+        self.assertAlmostEqual(
+            1000.0 + 5.0 * model.length, model.total_line_masses, delta=1.0e-9
+        )
+
+        model_data["line_masses"] = [{"x_start": 10.0, "mass_per_length": 20.0}]
+        with self.assertRaises(KeyError) as context:
+            JsonReader._to_model(model_data)
+        print(f"   EXPECTED: {str(context.exception)}")
+
+        print("> OK")
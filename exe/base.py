@@ -17,11 +17,13 @@ from data_io.base import BaseReader
 from data_io.json import JsonReader
 from data_io.excel import ExcelWriter
 from solve.eigen import FlexEigenSolver
+from solve.eigen import ModalSolution
 from model.system import CompBeamModel
 from numpy import ndarray
 from pandas import DataFrame
 from data_io.compile import df_comp_beam_model
 from data_io.compile import df_node_masses
+from data_io.compile import df_line_masses
 from data_io.compile import df_dofs
 from data_io.compile import df_springs
 
@@ -168,6 +170,7 @@ class SingleRunFlexEigen(BaseRun):
         self._config: Dict[str, Any] = {}
         self._model: Optional[CompBeamModel] = None
         self._results: Optional[Tuple[ndarray, ndarray]] = None
+        self._plane_results: Dict[str, Tuple[ndarray, ndarray]] = {}
 
     def set_reader(self, reader: BaseReader) -> "SingleRunFlexEigen":
         """Setting the reader is not supported for this run.
@@ -246,6 +249,7 @@ class SingleRunFlexEigen(BaseRun):
             "normalize_mode_shapes": True,
             "number_of_modes": 2,
             "prefer_positive_lateral_mode_shape_values": False,
+            "precision": "float64",
         }
 
         parameters: Dict[str, Any] = read_data.get("parameters", default_parameters)
@@ -260,15 +264,27 @@ class SingleRunFlexEigen(BaseRun):
         self._solver.set_normalize_shapes(parameters.get("normalize_mode_shapes", True))
         self._solver.set_mode_count(parameters.get("number_of_modes", 2))
         self._solver.set_gravity(parameters.get("gravity", 9.81))
+        self._solver.set_precision(parameters.get("precision", "float64"))
 
         # save config and detailed data
         self._config["model"] = df_comp_beam_model(model)
         if model.mass_count() > 0:
             self._config["masses"] = df_node_masses(model.node_masses)
+        if model.line_mass_count > 0:
+            self._config["line masses"] = df_line_masses(model.line_masses)
         if any(n.has_set_dofs for n in model.nodes):
             self._config["bc"] = df_dofs(model.nodes)
         if model.spring_count > 0:
             self._config["springs"] = df_springs(model.springs)
+        for name in model.plane_names:
+            if model.get_plane(name).mass_count > 0:
+                self._config[f"masses {name}"] = df_node_masses(
+                    model.get_plane(name).node_masses
+                )
+            if model.get_plane(name).spring_count > 0:
+                self._config[f"springs {name}"] = df_springs(
+                    model.get_plane(name).springs
+                )
         self._config["parameters"] = DataFrame.from_dict(
             parameters, orient="index", columns=["value"]
         )
@@ -278,13 +294,28 @@ class SingleRunFlexEigen(BaseRun):
             )
 
     def run_execute(self) -> None:
-        """Computes the frequencies and modes shapes."""
+        """Computes the frequencies and modes shapes, for each bending plane if the model defines planes."""
         self._send_msg(f"Computing frequencies and mode shapes")
-        self._results = self._solver.solve()
+        assert self._model is not None
+        if len(self._model.plane_names) > 0:
+            solutions: Dict[str, ModalSolution] = self._solver.solve_planes()
+            self._plane_results = {
+                name: self._solver.to_mode_shapes(solution)
+                for name, solution in solutions.items()
+            }
+        else:
+            self._results = self._solver.solve()
 
     def write_execute(self) -> None:
         """Writes the results to Excel file."""
         self._send_msg(f'Writing "{self.file_out}"')
-        assert self._results is not None
-        freq, msv = FlexEigenSolver.to_dataframe(*self._results)
-        self.writer.write(freq=freq, msv=msv, details=self._config)
+        assert self._results is not None or len(self._plane_results) > 0
+        planes: Dict[str, Tuple[DataFrame, DataFrame]] = {
+            name: FlexEigenSolver.to_dataframe(*results)
+            for name, results in self._plane_results.items()
+        }
+        if self._results is not None:
+            freq, msv = FlexEigenSolver.to_dataframe(*self._results)
+            self.writer.write(freq=freq, msv=msv, planes=planes, details=self._config)
+        else:
+            self.writer.write(planes=planes, details=self._config)
@@ -1,6 +1,10 @@
 from unittest import TestCase
 from exe.base import SingleRunFlexEigen
 from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, Dict
+from pandas import ExcelFile
+import json
 
 
 class TestSingleRunFlexEigen(TestCase):
@@ -23,3 +27,47 @@ class TestSingleRunFlexEigen(TestCase):
         run.execute()
 
         print("> OK")
+
+    def test_run_planes(self) -> None:
+        """
+        < Test of single run computing frequencies and mode shapes of bending planes. Read from JSON write to EXCEL.
+        """
+        print(TestSingleRunFlexEigen.test_run_planes.__doc__.strip())  # type: ignore
+
+        file_model: Path = (
+            Path(__file__).parent.absolute() / "ut" / "wind_tower_2.json"
+        )
+        with open(file_model, "r") as file:
+            content: Dict[str, Any] = json.load(file)
+        content["model"]["planes"] = {
+            "fore_aft": {
+                "masses": [{"x": content["model"]["masses"][-1]["x"], "phi": 2.0e6}]
+            },
+            "side_side": {
+                "springs": [
+                    {**content["model"]["springs"][0], "w": 2.0e9, "phi": 1.0e11}
+                ]
+            },
+        }
+
+        with TemporaryDirectory() as tmp_dir:
+            file_in: Path = Path(tmp_dir) / "wind_tower_2_planes.json"
+            file_out: Path = Path(tmp_dir) / "test_out_planes.xlsx"
+            with open(file_in, "w") as file:
+                json.dump(content, file)
+
+            print(f'    in : "{str(file_in)}"')
+            print(f'    out: "{str(file_out)}"')
+            SingleRunFlexEigen(str(file_in), str(file_out)).execute()
+
+            with ExcelFile(file_out) as excel:
+                sheets = excel.sheet_names
+            print(f"    sheets: {sheets}")
+            for name in ("fore_aft", "side_side"):
+                self.assertIn(f"frequencies {name}", sheets)
+                self.assertIn(f"modes {name}", sheets)
+            self.assertIn("masses fore_aft", sheets)
+            self.assertIn("springs side_side", sheets)
+            self.assertNotIn("frequencies", sheets)
+
+        print("> OK")
@@ -1,34 +1,191 @@
 """Structural beam elements with different DOF (degree of freedom).
 
 Classes with 2DOF and 3DOF are available. The 2DOF version does not consider axial DOF - v, phi; the 3DOF version
-considers the 3 major DOF: u, v, phi. Beams are Bernoulli beams.
+considers the 3 major DOF: u, v, phi. Beams are Bernoulli beams. Quintic beams (BQ) interpolate w by quintic
+Hermite polynomials of w, phi and kappa (curvature).
 """
 
 from model.core import DOF
 from model.core import AXIS
 from model.elements import Node
+from model.utils import ModelObject
+from model.utils import get_problems
 
 from dataclasses import dataclass
 from dataclasses import field
 
 from typing import List
 from typing import Optional
+from typing import Callable
 from typing import Tuple
 from typing import Any
 from typing import Type
 from typing import Set
+from typing import Sequence
 from typing import Protocol
 from typing import runtime_checkable
 
 from numpy import array
+from numpy import einsum
 from numpy import ndarray
+from numpy import outer
+from numpy.polynomial.legendre import leggauss
 from abc import ABC
 from abc import abstractmethod
 from enum import Enum
 from copy import deepcopy
+from collections import OrderedDict
+from functools import wraps
+from inspect import BoundArguments
+from inspect import Signature
+from inspect import signature
+from threading import Lock
+from math import pi
 
 
-class ABeam(ABC):
+class ElementMatrixCache:
+    """Bounded cache of element matrixes, shared by all beams with the same type and properties.
+
+    Entries are evicted in least recently used order once the maximum size is reached. Cached matrixes are
+    read-only, a maximum size of 0 disables caching. The cache is thread-safe, a matrix computed concurrently
+    by several threads is cached once.
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        """Creates a new cache.
+
+        :param max_size: maximum number of cached matrixes
+        :type max_size: int
+
+        :raises ValueError: if max_size < 0
+        """
+        self._entries: "OrderedDict[Tuple[Any, ...], ndarray]" = OrderedDict()
+        self._lock: Lock = Lock()
+        self._max_size: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self.set_max_size(max_size)
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    def set_max_size(self, max_size: int) -> "ElementMatrixCache":
+        """Sets the maximum number of cached matrixes and evicts entries exceeding it.
+
+        :param max_size: maximum number of cached matrixes, 0 disables caching
+        :type max_size: int
+
+        :return: self for chaining of calls
+        :rtype: ElementMatrixCache
+
+        :raises ValueError: if max_size < 0
+        """
+        if max_size < 0:
+            raise ValueError(f"Invalid maximum cache size {max_size} < 0")
+        with self._lock:
+            self._max_size = max_size
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+        return self
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def size(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> "ElementMatrixCache":
+        """Removes all cached matrixes and resets the hit and miss counters.
+
+        :return: self for chaining of calls
+        :rtype: ElementMatrixCache
+        """
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+        return self
+
+    def get(self, key: Tuple[Any, ...], compute: Callable[[], ndarray]) -> ndarray:
+        """Returns the cached matrix of the key or computes and caches it.
+
+        :param key: key of the matrix
+        :type key: Tuple[Any, ...]
+        :param compute: computes the matrix if not cached
+        :type compute: Callable[[], ndarray]
+
+        :return: read-only matrix
+        :rtype: ndarray
+        """
+        with self._lock:
+            matrix: Optional[ndarray] = self._entries.get(key)
+            if matrix is not None:
+                self._hits += 1
+                self._entries.move_to_end(key)
+                return matrix
+            self._misses += 1
+
+        # computed without lock, concurrent misses of the same key keep the first matrix
+        matrix = compute()
+        with self._lock:
+            if self._max_size == 0:
+                return matrix
+            cached: Optional[ndarray] = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                return cached
+            matrix.setflags(write=False)
+            self._entries[key] = matrix
+            if len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+        return matrix
+
+
+# element matrix cache shared by all beams
+element_matrix_cache: ElementMatrixCache = ElementMatrixCache()
+
+
+def cached_element_matrix(kind: str) -> Callable[..., Any]:
+    """Decorator caching an element matrix method of a beam in the element_matrix_cache.
+
+    The key is the beam type, kind, method arguments and the properties of the beam the element matrixes depend
+    on, see ABeam._get_matrix_properties(). Arguments are bound to the parameters of the method with defaults
+    applied, so positional, keyword and default arguments of the same value share one entry.
+
+    :param kind: kind of matrix, e.g. "K" or "M"
+    :type kind: str
+    """
+
+    def decorator(method: Callable[..., ndarray]) -> Callable[..., ndarray]:
+        method_signature: Signature = signature(method)
+
+        @wraps(method)
+        def wrapper(self: "ABeam", *args: Any, **kwargs: Any) -> ndarray:
+            arguments: BoundArguments = method_signature.bind(self, *args, **kwargs)
+            arguments.apply_defaults()
+            key: Tuple[Any, ...] = (
+                self.__class__,
+                kind,
+                tuple(arguments.arguments.items())[1:],
+                self._get_matrix_properties(),
+            )
+            return element_matrix_cache.get(
+                key, lambda: method(*arguments.args, **arguments.kwargs)
+            )
+
+        return wrapper
+
+    return decorator
+
+
+class ABeam(ModelObject, ABC):
     """Abstract beam with 2 nodes at each end.
 
     Node1 is the start node, node 2 the end node.
@@ -51,6 +208,8 @@ class ABeam(ABC):
         # no value checks here, all done in verify()
         self._node1: Node = n1
         self._node2: Node = n2
+        # coordinate stamps of node1 and node2, length, length^2 and length^3
+        self._geometry: Tuple[int, int, float, float, float] = (-1, -1, 0.0, 0.0, 0.0)
         self._area: float = area
         self._area_moi: float = area_moi
         self._e_modul: float = e_modul
@@ -59,11 +218,45 @@ class ABeam(ABC):
 
     @property
     def length(self) -> float:
-        if self.node1 is None:
-            raise ValueError("Node1 of beam is None")
-        if self.node2 is None:
-            raise ValueError("Node2 of beam is None")
-        return self.node1.distance(self.node2)
+        """Length of the beam, the distance from node1 to node2.
+
+        :return: length
+        :rtype: float
+        """
+        return self._get_geometry()[2]
+
+    @property
+    def length_sq(self) -> float:
+        """Square of the length of the beam.
+
+        :return: length^2
+        :rtype: float
+        """
+        return self._get_geometry()[3]
+
+    @property
+    def length_cu(self) -> float:
+        """Cube of the length of the beam.
+
+        :return: length^3
+        :rtype: float
+        """
+        return self._get_geometry()[4]
+
+    def _get_geometry(self) -> Tuple[int, int, float, float, float]:
+        """Returns the length and its powers, computed again only if any node was moved since the last call.
+
+        :return: coordinate stamps of node1 and node2, length, length^2 and length^3
+        :rtype: Tuple[int, int, float, float, float]
+        """
+        geometry: Tuple[int, int, float, float, float] = self._geometry
+        stamp_1: int = self._node1.coords_stamp
+        stamp_2: int = self._node2.coords_stamp
+        if geometry[0] != stamp_1 or geometry[1] != stamp_2:
+            length: float = self._node1.distance(self._node2)
+            geometry = (stamp_1, stamp_2, length, length * length, length**3)
+            self._geometry = geometry
+        return geometry
 
     @property
     def node1(self) -> Node:
@@ -79,6 +272,7 @@ class ABeam(ABC):
 
     def set_mass(self, mass: float) -> "ABeam":
         self._mass = mass
+        self._stamp_modification()
         return self
 
     @property
@@ -87,6 +281,7 @@ class ABeam(ABC):
 
     def set_area(self, area: float) -> "ABeam":
         self._area = area
+        self._stamp_modification()
         return self
 
     @property
@@ -95,6 +290,7 @@ class ABeam(ABC):
 
     def set_area_moi(self, area_moi: float) -> "ABeam":
         self._area_moi = area_moi
+        self._stamp_modification()
         return self
 
     @property
@@ -103,6 +299,7 @@ class ABeam(ABC):
 
     def set_e_modul(self, e_modul: float) -> "ABeam":
         self._e_modul = e_modul
+        self._stamp_modification()
         return self
 
     @property
@@ -144,6 +341,110 @@ class ABeam(ABC):
         self.dof_num
         return self.node1.dofs
 
+    def _get_matrix_properties(self) -> Tuple[float, ...]:
+        """Returns the properties the element matrixes depend on, sub-classes with further properties must
+        extend these.
+
+        :return: length, area, area_moi, e_modul and mass
+        :rtype: Tuple[float, ...]
+        """
+        return self.length, self.area, self.area_moi, self.e_modul, self.mass
+
+    def get_state(self) -> Tuple[float, ...]:
+        """Returns the values defining the beam besides its nodes, see from_state().
+
+        The values are the arguments of the constructor after the nodes, followed by the axial force for beams
+        with p-Delta effects.
+
+        :return: area, area_moi, e_modul and mass
+        :rtype: Tuple[float, ...]
+        """
+        return self._area, self._area_moi, self._e_modul, self._mass
+
+    @classmethod
+    def from_state(cls, n1: Node, n2: Node, state: Sequence[float]) -> "ABeam":
+        """Creates a beam of this type from the values of get_state().
+
+        :param n1: start node
+        :type n1: Node
+        :param n2: end node
+        :type n2: Node
+        :param state: values of get_state()
+        :type state: Sequence[float]
+
+        :return: new beam
+        :rtype: ABeam
+        """
+        return cls(n1, n2, *state)  # type: ignore
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # nodes and values of get_state(), cached geometry and validation are not kept
+        return self.from_state, (self._node1, self._node2, self.get_state())
+
+    def get_segment(self, n1: Node, n2: Node, xi_1: float, xi_2: float) -> "ABeam":
+        """Returns a beam of the same type for the segment between two relative positions of this beam.
+
+        The segment has the properties of this beam and the mass of the segment.
+
+        :param n1: start node of the segment
+        :type n1: Node
+        :param n2: end node of the segment
+        :type n2: Node
+        :param xi_1: relative start position, 0.0 at node1 and 1.0 at node2
+        :type xi_1: float
+        :param xi_2: relative end position > xi_1
+        :type xi_2: float
+
+        :return: beam of the segment
+        :rtype: ABeam
+        """
+        return self.__class__(
+            n1,
+            n2,
+            area=self.area,
+            area_moi=self.area_moi,
+            e_modul=self.e_modul,
+            mass=self.mass * (xi_2 - xi_1),
+        )  # type: ignore
+
+    @classmethod
+    def merge(cls, n1: Node, n2: Node, beams: Sequence["ABeam"]) -> "ABeam":
+        """Returns a beam of this type replacing a sequence of beams.
+
+        The merged beam has the sum of length and mass, the length weighted mean of e_modul and the area and
+        area_moi of equal axial and bending flexibility.
+
+        :param n1: start node of the merged beam
+        :type n1: Node
+        :param n2: end node of the merged beam
+        :type n2: Node
+        :param beams: beams to merge in order
+        :type beams: Sequence[ABeam]
+
+        :return: merged beam
+        :rtype: ABeam
+        """
+        lengths: List[float] = [b.length for b in beams]
+        length: float = sum(lengths)
+        e_modul: float = sum(b.e_modul * l for b, l in zip(beams, lengths)) / length
+        # equal flexibility: length / (E I) = sum(length_i / (E_i I_i))
+        area_moi: float = (
+            length / sum(l / (b.e_modul * b.area_moi) for b, l in zip(beams, lengths))
+        ) / e_modul
+        area: float = sum(b.area * l for b, l in zip(beams, lengths)) / length
+        if all(b.area > 0.0 for b in beams):
+            area = (
+                length / sum(l / (b.e_modul * b.area) for b, l in zip(beams, lengths))
+            ) / e_modul
+        return cls(
+            n1,
+            n2,
+            area=area,
+            area_moi=area_moi,
+            e_modul=e_modul,
+            mass=sum(b.mass for b in beams),
+        )  # type: ignore
+
     def verify(self) -> None:
         """Verifies the beam and raises ValueError, if any invalid condition was detected.
 
@@ -153,8 +454,9 @@ class ABeam(ABC):
         """
         if self.e_modul <= 0.0:
             raise ValueError(f"Invalid elastic modulus: {self.e_modul} <= 0.0")
-        if self.length <= 0.0:
-            raise ValueError(f"Invalid length: {self.length} <= 0.0")
+        length: float = self.length
+        if length <= 0.0:
+            raise ValueError(f"Invalid length: {length} <= 0.0")
         # TODO: area = 0.0 ok?
         if self.area < 0.0:
             raise ValueError(f"Invalid cross section: {self.area} < 0.0")
@@ -163,11 +465,49 @@ class ABeam(ABC):
         if self.area_moi <= 0.0:
             raise ValueError(f"Invalid area moment of inertia: {self.area_moi} <= 0.0")
 
+    def _verify_unless_validated(self) -> None:
+        """Verifies the beam, unless any model of the beam is validated, see CompBeamModel.is_validated.
+
+        :raises ValueError: If any property is invalid
+        """
+        if self._models is None or not any(m.is_validated for m in self._models):
+            self.verify()
+
+    @classmethod
+    def get_problems(cls, beams: Sequence["ABeam"]) -> List[str]:
+        """Verifies a sequence of beams of this type at once, see verify().
+
+        Sub-classes with additional conditions in verify() must extend the problems of this method.
+
+        :param beams: beams to verify
+        :type beams: Sequence[ABeam]
+
+        :return: description of each problem with the indexes of the invalid beams, empty if all are valid
+        :rtype: List[str]
+        """
+        e_modul, length, area, mass, area_moi = (
+            array(
+                [(b.e_modul, b.length, b.area, b.mass, b.area_moi) for b in beams],
+                dtype=float,
+            )
+            .reshape(-1, 5)
+            .T
+        )
+        return get_problems(
+            [
+                (~(e_modul > 0.0), "Invalid elastic modulus <= 0.0"),
+                (~(length > 0.0), "Invalid length <= 0.0"),
+                (~(area >= 0.0), "Invalid cross section < 0.0"),
+                (~(mass > 0.0), "Invalid mass <= 0.0"),
+                (~(area_moi > 0.0), "Invalid area moment of inertia <= 0.0"),
+            ]
+        )
+
     @abstractmethod
     def get_K(self, order: int = 1) -> ndarray:
         """Returns the stiffness matrix of the beam (element matrix).
 
-        The method in the implementing class must call .verify() before returning.
+        The method in the implementing class must call ._verify_unless_validated() before returning.
 
         :param order: Order 1 or 2 (2 is with p-Delta effects)
         :type order: int
@@ -183,13 +523,41 @@ class ABeam(ABC):
     def get_M(self) -> ndarray:
         """Returns the mass matrix of the beam (element matrix).
 
-        The method in the implementing class must call .verify() before returning.
+        The method in the implementing class must call ._verify_unless_validated() before returning.
 
         :return: Element mass matrix
         :rtype: ndarray
         """
         raise NotImplementedError("get_M()")
 
+    def get_N(self, xi: float) -> ndarray:
+        """Returns the interpolation matrix of the shape functions at a relative position of the beam.
+
+        The DOF values at the position are the product of the matrix and the element DOF values. Rotations
+        are the derivative of the lateral displacement by x. Beam types without shape functions do not
+        implement this method, see has_shape_functions().
+
+        :param xi: relative position, 0.0 at node1 and 1.0 at node2
+        :type xi: float
+
+        :return: interpolation matrix [DOF x element DOF]
+        :rtype: ndarray
+
+        :raises NotImplementedError: if the beam type does not provide shape functions
+        """
+        raise NotImplementedError(
+            f"Beam type {self.__class__.__name__} does not provide shape functions, get_N()"
+        )
+
+    @classmethod
+    def has_shape_functions(cls) -> bool:
+        """Returns True if the beam type provides shape functions by get_N().
+
+        :return: True if get_N() is implemented, False otherwise
+        :rtype: bool
+        """
+        return cls.get_N is not ABeam.get_N
+
 
 class BeamB_2DOF(ABeam):
     """Structural beam element with 2 DOF: w (lateral), phi (rotational), no p-Delta effects."""
@@ -227,6 +595,7 @@ class BeamB_2DOF(ABeam):
         super().__init__(n1, n2, area, area_moi, e_modul, mass)
         self._beam_type = f"{self.__class__.__name__}: Bernoulli, 2DOF, no p-Delta"
 
+    @cached_element_matrix("K")
     def get_K(self, order: int = 1) -> ndarray:
         """Returns the [4x4] element stiffness matrix with oder: w1, phi1, w2, phi2
 
@@ -239,11 +608,12 @@ class BeamB_2DOF(ABeam):
             raise ValueError(
                 f"Unsupported order {order}, supported is only {self.order}"
             )
-        self.verify()
+        self._verify_unless_validated()
 
-        EI_o_L: float = self.e_modul * self.area_moi / self.length
-        EI_o_Lsq: float = EI_o_L / self.length
-        EI_o_Lqu: float = EI_o_Lsq / self.length
+        L: float = self.length
+        EI_o_L: float = self.e_modul * self.area_moi / L
+        EI_o_Lsq: float = EI_o_L / L
+        EI_o_Lqu: float = EI_o_Lsq / L
 
         return array(
             [
@@ -254,32 +624,64 @@ class BeamB_2DOF(ABeam):
             ]
         )
 
+    @cached_element_matrix("M")
     def get_M(self) -> ndarray:
         """Returns the [4x4] element mass matrix with order: w1, phi1, w2, phi2.
 
         :return: element stiffness matrix as 2D numpy array, rows are forces, columns are displacements
         :rtype: ndarray
         """
-        self.verify()
+        self._verify_unless_validated()
 
         f: float = self.mass / 420.0
         L: float = self.length
+        L_sq: float = self.length_sq
 
         return array(
             [
                 [156.0 * f, 22.0 * L * f, 54.0 * f, -13.0 * L * f],
                 [
                     22.0 * L * f,
-                    4.0 * pow(L, 2.0) * f,
+                    4.0 * L_sq * f,
                     13.0 * L * f,
-                    -3.0 * pow(L, 2.0) * f,
+                    -3.0 * L_sq * f,
                 ],
                 [54.0 * f, 13.0 * L * f, 156.0 * f, -22.0 * L * f],
                 [
                     -13.0 * L * f,
-                    -3.0 * pow(L, 2.0) * f,
+                    -3.0 * L_sq * f,
                     -22.0 * L * f,
-                    4.0 * pow(L, 2.0) * f,
+                    4.0 * L_sq * f,
+                ],
+            ]
+        )
+
+    def get_N(self, xi: float) -> ndarray:
+        """Returns the [2x4] interpolation matrix of the Hermite shape functions, order: w1, phi1, w2, phi2.
+
+        :param xi: relative position, 0.0 at node1 and 1.0 at node2
+        :type xi: float
+
+        :return: interpolation matrix, rows are w and phi at xi
+        :rtype: ndarray
+        """
+        L: float = self.length
+        xi_sq: float = xi * xi
+        xi_cu: float = xi_sq * xi
+
+        return array(
+            [
+                [
+                    1.0 - 3.0 * xi_sq + 2.0 * xi_cu,
+                    L * (xi - 2.0 * xi_sq + xi_cu),
+                    3.0 * xi_sq - 2.0 * xi_cu,
+                    L * (xi_cu - xi_sq),
+                ],
+                [
+                    (6.0 * xi_sq - 6.0 * xi) / L,
+                    1.0 - 4.0 * xi + 3.0 * xi_sq,
+                    (6.0 * xi - 6.0 * xi_sq) / L,
+                    3.0 * xi_sq - 2.0 * xi,
                 ],
             ]
         )
@@ -330,6 +732,14 @@ class BeamB_3DOF(ABeam):
         if self.area <= 0.0:
             raise ValueError(f"Invalid cross section: {self.area} <= 0.0")
 
+    @classmethod
+    def get_problems(cls, beams: Sequence["ABeam"]) -> List[str]:
+        area: ndarray = array([b.area for b in beams], dtype=float)
+        return super().get_problems(beams) + get_problems(
+            [(~(area > 0.0), "Invalid cross section <= 0.0")]
+        )
+
+    @cached_element_matrix("K")
     def get_K(self, order: int = 1) -> ndarray:
         """Returns the [6x6] element stiffness matrix with order: u1, v1, phi1, u2, v2, phi2.
 
@@ -342,12 +752,13 @@ class BeamB_3DOF(ABeam):
             raise ValueError(
                 f"Unsupported order {order}, supported is only {self.order}"
             )
-        self.verify()
+        self._verify_unless_validated()
 
-        EA_o_L: float = self.e_modul * self.area / self.length
-        EI_o_L: float = self.e_modul * self.area_moi / self.length
-        EI_o_Lsq: float = EI_o_L / self.length
-        EI_o_Lqu: float = EI_o_Lsq / self.length
+        L: float = self.length
+        EA_o_L: float = self.e_modul * self.area / L
+        EI_o_L: float = self.e_modul * self.area_moi / L
+        EI_o_Lsq: float = EI_o_L / L
+        EI_o_Lqu: float = EI_o_Lsq / L
 
         return array(
             [
@@ -374,16 +785,18 @@ class BeamB_3DOF(ABeam):
             ]
         )
 
+    @cached_element_matrix("M")
     def get_M(self) -> ndarray:
         """Returns the [6x6] element mass matrix with order: u1, v1, phi1, u2, v2, phi2.
 
         :return: element stiffness matrix as 2D numpy array, rows are forces, columns are displacements
         :rtype: ndarray
         """
-        self.verify()
+        self._verify_unless_validated()
 
         f: float = self.mass / 420.0
         L: float = self.length
+        L_sq: float = self.length_sq
 
         return array(
             [
@@ -392,20 +805,56 @@ class BeamB_3DOF(ABeam):
                 [
                     0.0,
                     22.0 * L * f,
-                    4.0 * pow(L, 2.0) * f,
+                    4.0 * L_sq * f,
                     0.0,
                     13.0 * L * f,
-                    -3.0 * pow(L, 2.0) * f,
+                    -3.0 * L_sq * f,
                 ],
                 [70.0 * f, 0.0, 0.0, 140.0 * f, 0.0, 0.0],
                 [0.0, 54.0 * f, 13.0 * L * f, 0.0, 156.0 * f, -22.0 * L * f],
                 [
                     0.0,
                     -13.0 * L * f,
-                    -3.0 * pow(L, 2.0) * f,
+                    -3.0 * L_sq * f,
                     0.0,
                     -22.0 * L * f,
-                    4.0 * pow(L, 2.0) * f,
+                    4.0 * L_sq * f,
+                ],
+            ]
+        )
+
+    def get_N(self, xi: float) -> ndarray:
+        """Returns the [3x6] interpolation matrix of linear (u) and Hermite (w, phi) shape functions, order: u1, w1,
+        phi1, u2, w2, phi2.
+
+        :param xi: relative position, 0.0 at node1 and 1.0 at node2
+        :type xi: float
+
+        :return: interpolation matrix, rows are u, w and phi at xi
+        :rtype: ndarray
+        """
+        L: float = self.length
+        xi_sq: float = xi * xi
+        xi_cu: float = xi_sq * xi
+
+        return array(
+            [
+                [1.0 - xi, 0.0, 0.0, xi, 0.0, 0.0],
+                [
+                    0.0,
+                    1.0 - 3.0 * xi_sq + 2.0 * xi_cu,
+                    L * (xi - 2.0 * xi_sq + xi_cu),
+                    0.0,
+                    3.0 * xi_sq - 2.0 * xi_cu,
+                    L * (xi_cu - xi_sq),
+                ],
+                [
+                    0.0,
+                    (6.0 * xi_sq - 6.0 * xi) / L,
+                    1.0 - 4.0 * xi + 3.0 * xi_sq,
+                    0.0,
+                    (6.0 * xi - 6.0 * xi_sq) / L,
+                    3.0 * xi_sq - 2.0 * xi,
                 ],
             ]
         )
@@ -464,25 +913,541 @@ class BeamB_2DOF_II(BeamB_2DOF):
         self._force_x = force_x
         return self
 
+    def get_state(self) -> Tuple[float, ...]:
+        return (*super().get_state(), self._force_x)
+
+    @classmethod
+    def from_state(cls, n1: Node, n2: Node, state: Sequence[float]) -> "ABeam":
+        return cls(n1, n2, *state[:-1]).set_force_x(state[-1])  # type: ignore
+
     def get_K2(self) -> ndarray:
-        return (self._force_x / (30.0 * self.length)) * array(
+        L: float = self.length
+        L_sq: float = self.length_sq
+        return (self._force_x / (30.0 * L)) * array(
             [
-                [36.0, 3.0 * self.length, -36.0, 3.0 * self.length],
-                [
-                    3.0 * self.length,
-                    4.0 * pow(self.length, 2.0),
-                    -3.0 * self.length,
-                    -1.0 * pow(self.length, 2.0),
-                ],
-                [-36.0, -3.0 * self.length, 36.0, -3.0 * self.length],
-                [
-                    3.0 * self.length,
-                    -1.0 * pow(self.length, 2.0),
-                    -3.0 * self.length,
-                    4.0 * pow(self.length, 2.0),
-                ],
+                [36.0, 3.0 * L, -36.0, 3.0 * L],
+                [3.0 * L, 4.0 * L_sq, -3.0 * L, -1.0 * L_sq],
+                [-36.0, -3.0 * L, 36.0, -3.0 * L],
+                [3.0 * L, -1.0 * L_sq, -3.0 * L, 4.0 * L_sq],
+            ]
+        )
+
+    def get_K1(self) -> ndarray:
+        return super().get_K()
+
+    def get_K(self, order: int = 2) -> ndarray:
+        if order != 1 and order != 2:
+            raise ValueError(f"Invalid order {order}, supported are 1 or 2")
+        if order == 1:
+            return self.get_K1()
+        else:
+            return self.get_K1() + self.get_K2()
+
+
+# Gauss-Legendre points and weights on [0, 1], exact for polynomials up to degree 9
+_GAUSS_XI, _GAUSS_WEIGHTS = leggauss(5)
+_GAUSS_XI = (_GAUSS_XI + 1.0) / 2.0
+_GAUSS_WEIGHTS = _GAUSS_WEIGHTS / 2.0
+
+
+class BeamBT_2DOF(BeamB_2DOF):
+    """Structural beam element with 2 DOF: w (lateral), phi (rotational) of a tapered circular tube, no p-Delta
+    effects.
+
+    Outer diameter and wall thickness vary linearly from node1 to node2, like conical cans of steel towers.
+    Stiffness and mass matrix are integrated exactly from the Hermite shape functions, the mass of the beam is
+    distributed proportional to the cross section. Properties area and area_moi are the mean values over the
+    length and are derived from diameter and thickness.
+    """
+
+    def __init__(
+        self,
+        n1: Node,
+        n2: Node,
+        diameter_1: float,
+        diameter_2: float,
+        thickness_1: float,
+        thickness_2: float,
+        e_modul: float,
+        mass: float,
+    ) -> None:
+        """Creates a new tapered beam.
+
+        :param n1: start node
+        :type n1: Node
+        :param n2: end node
+        :type n2: Node
+        :param diameter_1: outer diameter at node1
+        :type diameter_1: float
+        :param diameter_2: outer diameter at node2
+        :type diameter_2: float
+        :param thickness_1: wall thickness at node1
+        :type thickness_1: float
+        :param thickness_2: wall thickness at node2
+        :type thickness_2: float
+        :param e_modul: elastic modulus
+        :type e_modul: float
+        :param mass: mass of the beam
+        :type mass: float
+        """
+        super().__init__(n1, n2, 0.0, 0.0, e_modul, mass)
+        self._beam_type = (
+            f"{self.__class__.__name__}: Bernoulli, 2DOF, tapered, no p-Delta"
+        )
+        self._diameters: Tuple[float, float] = (diameter_1, diameter_2)
+        self._thicknesses: Tuple[float, float] = (thickness_1, thickness_2)
+        self._set_mean_section()
+
+    @property
+    def diameters(self) -> Tuple[float, float]:
+        """Outer diameter at node1 and node2.
+
+        :return: diameters
+        :rtype: Tuple[float, float]
+        """
+        return self._diameters
+
+    def set_diameters(self, diameter_1: float, diameter_2: float) -> "BeamBT_2DOF":
+        self._diameters = (diameter_1, diameter_2)
+        self._set_mean_section()
+        self._stamp_modification()
+        return self
+
+    @property
+    def thicknesses(self) -> Tuple[float, float]:
+        """Wall thickness at node1 and node2.
+
+        :return: thicknesses
+        :rtype: Tuple[float, float]
+        """
+        return self._thicknesses
+
+    def set_thicknesses(self, thickness_1: float, thickness_2: float) -> "BeamBT_2DOF":
+        self._thicknesses = (thickness_1, thickness_2)
+        self._set_mean_section()
+        self._stamp_modification()
+        return self
+
+    def get_state(self) -> Tuple[float, ...]:
+        return (*self._diameters, *self._thicknesses, self._e_modul, self._mass)
+
+    def set_area(self, area: float) -> "ABeam":
+        raise ValueError(
+            f"Area of {self.__class__.__name__} is derived from diameter and thickness"
+        )
+
+    def set_area_moi(self, area_moi: float) -> "ABeam":
+        raise ValueError(
+            f"Area moment of inertia of {self.__class__.__name__} is derived from diameter and thickness"
+        )
+
+    def get_sections(self, xi: ndarray) -> Tuple[ndarray, ndarray]:
+        """Returns cross section and area moment of inertia at relative positions of the beam.
+
+        :param xi: relative positions, 0.0 at node1 and 1.0 at node2
+        :type xi: ndarray
+
+        :return: Tuple of first is cross section, second is area moment of inertia per position
+        :rtype: Tuple[ndarray, ndarray]
+        """
+        outer_d: ndarray = (
+            self._diameters[0] + (self._diameters[1] - self._diameters[0]) * xi
+        )
+        thickness: ndarray = (
+            self._thicknesses[0] + (self._thicknesses[1] - self._thicknesses[0]) * xi
+        )
+        inner_d: ndarray = outer_d - 2.0 * thickness
+        return (
+            pi / 4.0 * (outer_d**2 - inner_d**2),
+            pi / 64.0 * (outer_d**4 - inner_d**4),
+        )
+
+    def _set_mean_section(self) -> None:
+        area, area_moi = self.get_sections(_GAUSS_XI)
+        self._area = float(_GAUSS_WEIGHTS.dot(area))
+        self._area_moi = float(_GAUSS_WEIGHTS.dot(area_moi))
+
+    def _get_matrix_properties(self) -> Tuple[float, ...]:
+        return (
+            self.length,
+            *self._diameters,
+            *self._thicknesses,
+            self.e_modul,
+            self.mass,
+        )
+
+    def verify(self) -> None:
+        super().verify()
+        for diameter, thickness in zip(self._diameters, self._thicknesses):
+            if diameter <= 0.0:
+                raise ValueError(f"Invalid diameter: {diameter} <= 0.0")
+            if not 0.0 < thickness <= diameter / 2.0:
+                raise ValueError(
+                    f"Invalid thickness: {thickness}, expected 0.0 < thickness <= {diameter / 2.0}"
+                )
+
+    @classmethod
+    def get_problems(cls, beams: Sequence["ABeam"]) -> List[str]:
+        diameters: ndarray = array(
+            [b.diameters for b in beams], dtype=float  # type: ignore
+        ).reshape(-1, 2)
+        thicknesses: ndarray = array(
+            [b.thicknesses for b in beams], dtype=float  # type: ignore
+        ).reshape(-1, 2)
+        return super().get_problems(beams) + get_problems(
+            [
+                (~(diameters > 0.0).all(axis=1), "Invalid diameter <= 0.0"),
+                (
+                    ~((thicknesses > 0.0) & (thicknesses <= diameters / 2.0)).all(
+                        axis=1
+                    ),
+                    "Invalid thickness, expected 0.0 < thickness <= diameter / 2.0",
+                ),
+            ]
+        )
+
+    @cached_element_matrix("K")
+    def get_K(self, order: int = 1) -> ndarray:
+        """Returns the [4x4] element stiffness matrix with oder: w1, phi1, w2, phi2
+
+        :return: element stiffness matrix as 2D numpy array, rows are forces, columns are displacements
+        :rtype: ndarray
+
+        :raises ValueError: If order != 1
+        """
+        if order != 1:
+            raise ValueError(
+                f"Unsupported order {order}, supported is only {self.order}"
+            )
+        self._verify_unless_validated()
+
+        L: float = self.length
+        _, area_moi = self.get_sections(_GAUSS_XI)
+        # second derivatives of the shape functions by xi
+        B: ndarray = array(
+            [
+                12.0 * _GAUSS_XI - 6.0,
+                L * (6.0 * _GAUSS_XI - 4.0),
+                6.0 - 12.0 * _GAUSS_XI,
+                L * (6.0 * _GAUSS_XI - 2.0),
             ]
         )
+        return (self.e_modul / self.length_cu) * einsum(
+            "q,iq,jq->ij", _GAUSS_WEIGHTS * area_moi, B, B
+        )
+
+    @cached_element_matrix("M")
+    def get_M(self) -> ndarray:
+        """Returns the [4x4] element mass matrix with order: w1, phi1, w2, phi2.
+
+        :return: element stiffness matrix as 2D numpy array, rows are forces, columns are displacements
+        :rtype: ndarray
+        """
+        self._verify_unless_validated()
+
+        area, _ = self.get_sections(_GAUSS_XI)
+        N: ndarray = array([self.get_N(xi)[0] for xi in _GAUSS_XI]).T
+        return (self.mass / self.area) * einsum(
+            "q,iq,jq->ij", _GAUSS_WEIGHTS * area, N, N
+        )
+
+    def get_segment(self, n1: Node, n2: Node, xi_1: float, xi_2: float) -> "ABeam":
+        """Returns a tapered beam for the segment between two relative positions of this beam.
+
+        Diameter and thickness are interpolated, the mass is the mass of the segment.
+
+        :param n1: start node of the segment
+        :type n1: Node
+        :param n2: end node of the segment
+        :type n2: Node
+        :param xi_1: relative start position, 0.0 at node1 and 1.0 at node2
+        :type xi_1: float
+        :param xi_2: relative end position > xi_1
+        :type xi_2: float
+
+        :return: beam of the segment
+        :rtype: ABeam
+        """
+        d_1, d_2 = self._diameters
+        t_1, t_2 = self._thicknesses
+        area, _ = self.get_sections(xi_1 + (xi_2 - xi_1) * _GAUSS_XI)
+        return self.__class__(
+            n1,
+            n2,
+            diameter_1=d_1 + (d_2 - d_1) * xi_1,
+            diameter_2=d_1 + (d_2 - d_1) * xi_2,
+            thickness_1=t_1 + (t_2 - t_1) * xi_1,
+            thickness_2=t_1 + (t_2 - t_1) * xi_2,
+            e_modul=self.e_modul,
+            mass=self.mass * (xi_2 - xi_1) * _GAUSS_WEIGHTS.dot(area) / self.area,
+        )
+
+    @classmethod
+    def merge(cls, n1: Node, n2: Node, beams: Sequence["ABeam"]) -> "ABeam":
+        """Returns a tapered beam replacing a sequence of tapered beams.
+
+        The merged beam has the diameter and thickness of the first beam at node1 and of the last beam at
+        node2, the sum of the mass and the length weighted mean of e_modul.
+
+        :param n1: start node of the merged beam
+        :type n1: Node
+        :param n2: end node of the merged beam
+        :type n2: Node
+        :param beams: tapered beams to merge in order
+        :type beams: Sequence[ABeam]
+
+        :return: merged beam
+        :rtype: ABeam
+        """
+        first: BeamBT_2DOF = beams[0]  # type: ignore
+        last: BeamBT_2DOF = beams[-1]  # type: ignore
+        length: float = sum(b.length for b in beams)
+        return cls(
+            n1,
+            n2,
+            diameter_1=first.diameters[0],
+            diameter_2=last.diameters[1],
+            thickness_1=first.thicknesses[0],
+            thickness_2=last.thicknesses[1],
+            e_modul=sum(b.e_modul * b.length for b in beams) / length,
+            mass=sum(b.mass for b in beams),
+        )
+
+
+class BeamBT_2DOF_II(BeamB_2DOF_II, BeamBT_2DOF):
+    """Structural beam element with 2 DOF: w (lateral), phi (rotational) of a tapered circular tube including
+    p-Delta effects, see BeamBT_2DOF.
+
+    The geometric stiffness matrix is the one of BeamB_2DOF_II for the constant axial force of the beam.
+    """
+
+    def __init__(
+        self,
+        n1: Node,
+        n2: Node,
+        diameter_1: float,
+        diameter_2: float,
+        thickness_1: float,
+        thickness_2: float,
+        e_modul: float,
+        mass: float,
+    ) -> None:
+        BeamBT_2DOF.__init__(
+            self,
+            n1,
+            n2,
+            diameter_1,
+            diameter_2,
+            thickness_1,
+            thickness_2,
+            e_modul,
+            mass,
+        )
+        self._beam_type = (
+            f"{self.__class__.__name__}: Bernoulli, 2DOF, tapered, with p-Delta"
+        )
+        self._force_x: float = 0.0
+
+
+# Gauss-Legendre points and weights on [0, 1], exact for polynomials up to degree 11
+_GAUSS6_XI, _GAUSS6_WEIGHTS = leggauss(6)
+_GAUSS6_XI = (_GAUSS6_XI + 1.0) / 2.0
+_GAUSS6_WEIGHTS = _GAUSS6_WEIGHTS / 2.0
+
+
+def _get_quintic_shape(xi: ndarray) -> Tuple[ndarray, ndarray, ndarray]:
+    """Returns the quintic Hermite shape functions and their first and second derivative by xi of a beam with
+    unit length, order: w1, phi1, kappa1, w2, phi2, kappa2.
+
+    :param xi: relative positions, 0.0 at node1 and 1.0 at node2
+    :type xi: ndarray
+
+    :return: Tuple of shape functions, first and second derivatives, each [6 x positions]
+    :rtype: Tuple[ndarray, ndarray, ndarray]
+    """
+    xi = array(xi, dtype=float)
+    # coefficients of xi^0 .. xi^5 of each shape function
+    coeffs: ndarray = array(
+        [
+            [1.0, 0.0, 0.0, -10.0, 15.0, -6.0],
+            [0.0, 1.0, 0.0, -6.0, 8.0, -3.0],
+            [0.0, 0.0, 0.5, -1.5, 1.5, -0.5],
+            [0.0, 0.0, 0.0, 10.0, -15.0, 6.0],
+            [0.0, 0.0, 0.0, -4.0, 7.0, -3.0],
+            [0.0, 0.0, 0.0, 0.5, -1.0, 0.5],
+        ]
+    )
+    powers: ndarray = array([xi**p for p in range(0, 6)])
+    d_coeffs: ndarray = coeffs[:, 1:] * array([1.0, 2.0, 3.0, 4.0, 5.0])
+    dd_coeffs: ndarray = d_coeffs[:, 1:] * array([1.0, 2.0, 3.0, 4.0])
+    return coeffs.dot(powers), d_coeffs.dot(powers[:5]), dd_coeffs.dot(powers[:4])
+
+
+_QUINTIC_N, _QUINTIC_dN, _QUINTIC_ddN = _get_quintic_shape(_GAUSS6_XI)
+# element matrixes of a beam with unit length, stiffness, mass and axial force
+_QUINTIC_K: ndarray = einsum("iq,jq,q->ij", _QUINTIC_ddN, _QUINTIC_ddN, _GAUSS6_WEIGHTS)
+_QUINTIC_M: ndarray = einsum("iq,jq,q->ij", _QUINTIC_N, _QUINTIC_N, _GAUSS6_WEIGHTS)
+_QUINTIC_K2: ndarray = einsum("iq,jq,q->ij", _QUINTIC_dN, _QUINTIC_dN, _GAUSS6_WEIGHTS)
+
+
+class BeamBQ_3DOF(ABeam):
+    """Structural beam element with 3 DOF: w (lateral), phi (rotational), kappa (curvature), no p-Delta effects.
+
+    The lateral displacement is interpolated by quintic Hermite polynomials, that is displacement, rotation and
+    curvature are continuous at nodes (C2). Frequencies converge with the beam length to the power of 8 instead
+    of 4 for cubic beams, which requires far less DOF for higher modes.
+
+    Continuous curvature at nodes requires continuous bending stiffness e_modul * area_moi. At jumps of the
+    bending stiffness the bending moment and not the curvature is continuous, frequencies still converge but at
+    a lower rate, unless the beams at the jump are short.
+    """
+
+    @staticmethod
+    def get_dofs() -> Tuple[DOF, DOF, DOF]:
+        """Returns the DOFs for quintic beam type.
+
+        :return: DOFs for quintic beam
+        :rtype: Tuple[DOF, DOF, DOF]
+        """
+        return DOF.W, DOF.PHI, DOF.KAPPA
+
+    def __init__(
+        self,
+        n1: Node,
+        n2: Node,
+        area: float,
+        area_moi: float,
+        e_modul: float,
+        mass: float,
+    ) -> None:
+        # expected DOF
+        if n1.dofs != BeamBQ_3DOF.get_dofs():
+            raise ValueError(
+                f"Invalid DOF for node1 of {BeamBQ_3DOF.__name__}, expected"
+                f" {BeamBQ_3DOF.get_dofs()}"
+            )
+        if n2.dofs != BeamBQ_3DOF.get_dofs():
+            raise ValueError(
+                f"Invalid DOF for node2 of {BeamBQ_3DOF.__name__}, expected"
+                f" {BeamBQ_3DOF.get_dofs()}"
+            )
+
+        super().__init__(n1, n2, area, area_moi, e_modul, mass)
+        self._beam_type = (
+            f"{self.__class__.__name__}: Bernoulli, quintic, 3DOF, no p-Delta"
+        )
+
+    def _get_dof_scale(self) -> ndarray:
+        """Returns the scale of the element DOF from unit length to the length of the beam.
+
+        :return: 1, L, L^2 for each node
+        :rtype: ndarray
+        """
+        L: float = self.length
+        L_sq: float = self.length_sq
+        return array([1.0, L, L_sq, 1.0, L, L_sq])
+
+    @cached_element_matrix("K")
+    def get_K(self, order: int = 1) -> ndarray:
+        """Returns the [6x6] element stiffness matrix with order: w1, phi1, kappa1, w2, phi2, kappa2.
+
+        :return: element stiffness matrix as 2D numpy array, rows are forces, columns are displacements
+        :rtype: ndarray
+
+        :raises ValueError: If order != 1
+        """
+        if order != 1:
+            raise ValueError(
+                f"Unsupported order {order}, supported is only {self.order}"
+            )
+        self._verify_unless_validated()
+
+        scale: ndarray = self._get_dof_scale()
+        return (
+            self.e_modul
+            * self.area_moi
+            / self.length_cu
+            * outer(scale, scale)
+            * _QUINTIC_K
+        )
+
+    @cached_element_matrix("M")
+    def get_M(self) -> ndarray:
+        """Returns the [6x6] element mass matrix with order: w1, phi1, kappa1, w2, phi2, kappa2.
+
+        :return: element mass matrix as 2D numpy array
+        :rtype: ndarray
+        """
+        self._verify_unless_validated()
+
+        scale: ndarray = self._get_dof_scale()
+        return self.mass * outer(scale, scale) * _QUINTIC_M
+
+    def get_N(self, xi: float) -> ndarray:
+        """Returns the [3x6] interpolation matrix of the quintic Hermite shape functions, order: w1, phi1, kappa1,
+        w2, phi2, kappa2.
+
+        :param xi: relative position, 0.0 at node1 and 1.0 at node2
+        :type xi: float
+
+        :return: interpolation matrix, rows are w, phi and kappa at xi
+        :rtype: ndarray
+        """
+        L: float = self.length
+        N, dN, ddN = _get_quintic_shape(array([xi]))
+        return (
+            array([N[:, 0], dN[:, 0] / L, ddN[:, 0] / self.length_sq])
+            * self._get_dof_scale()
+        )
+
+
+class BeamBQ_3DOF_II(BeamBQ_3DOF):
+    """Structural beam element with 3 DOF: w (lateral), phi (rotational), kappa (curvature) including p-Delta
+    effects, see BeamBQ_3DOF.
+
+    The geometric stiffness matrix is consistent with the quintic shape functions for the constant axial force
+    of the beam.
+    """
+
+    def __init__(
+        self,
+        n1: Node,
+        n2: Node,
+        area: float,
+        area_moi: float,
+        e_modul: float,
+        mass: float,
+    ) -> None:
+        # super will ensure correct DOFs
+        super().__init__(n1, n2, area, area_moi, e_modul, mass)
+        self._beam_type = (
+            f"{self.__class__.__name__}: Bernoulli, quintic, 3DOF, with p-Delta"
+        )
+
+        self._force_x: float = 0.0
+
+    @property
+    def order(self) -> int:
+        return 2
+
+    @property
+    def force_x(self) -> float:
+        return self._force_x
+
+    def set_force_x(self, force_x: float) -> "BeamBQ_3DOF_II":
+        self._force_x = force_x
+        return self
+
+    def get_state(self) -> Tuple[float, ...]:
+        return (*super().get_state(), self._force_x)
+
+    @classmethod
+    def from_state(cls, n1: Node, n2: Node, state: Sequence[float]) -> "ABeam":
+        return cls(n1, n2, *state[:-1]).set_force_x(state[-1])  # type: ignore
+
+    def get_K2(self) -> ndarray:
+        scale: ndarray = self._get_dof_scale()
+        return self._force_x / self.length * outer(scale, scale) * _QUINTIC_K2
 
     def get_K1(self) -> ndarray:
         return super().get_K()
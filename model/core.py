@@ -1,9 +1,20 @@
 """Core implementations like DOF which are used by most other classes."""
 from enum import Enum
+from functools import lru_cache
 from typing import Sequence
 from typing import Tuple
 from typing import Set
 from typing import List
+from typing import Optional
+from typing import Union
+from numpy import ndarray
+from numpy import add
+from numpy import arange
+from numpy import asarray
+from numpy import bincount
+from numpy import flatnonzero
+from numpy import ix_
+from numpy import zeros
 
 
 class AXIS(Enum):
@@ -28,10 +39,11 @@ class AXIS(Enum):
 
 
 class DOF_TYPE(Enum):
-    """Type of degree of freedom, that is displacement or rotation."""
+    """Type of degree of freedom, that is displacement, rotation or curvature."""
 
     DISP = "displacement"
     ROT = "rotation"
+    CURV = "curvature"
 
     def __init__(self, description: str) -> None:
         self._description: str = description
@@ -40,7 +52,7 @@ class DOF_TYPE(Enum):
     def description(self) -> str:
         """Description of DOF type.
 
-        :return: 'rotational' or 'displacement'
+        :return: 'rotational', 'displacement' or 'curvature'
         """
         return self._description
 
@@ -48,7 +60,7 @@ class DOF_TYPE(Enum):
     def short(self) -> str:
         """Short designator.
 
-        :return: single letter designator: 'r' for rotational, 'd' for displacement
+        :return: single letter designator: 'r' for rotational, 'd' for displacement, 'c' for curvature
         """
         return str(self.name).lower()[0]
 
@@ -59,6 +71,7 @@ class DOF(Enum):
     U = (DOF_TYPE.DISP, AXIS.X, "axial displacement")
     W = (DOF_TYPE.DISP, AXIS.Z, "lateral displacement")
     PHI = (DOF_TYPE.ROT, AXIS.Y, "rotation around y")
+    KAPPA = (DOF_TYPE.CURV, AXIS.Y, "curvature around y")
 
     def __init__(self, dof_type: DOF_TYPE, axis: AXIS, description: str):
         self._type: DOF_TYPE = dof_type
@@ -124,5 +137,324 @@ class DOF(Enum):
         """
         return [dof for dof in DOF if dof.dof_type == dof_type]
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def to_codes(dofs: Tuple["DOF", ...]) -> bytes:
+        """Returns compact codes of DOF, that is the index of each DOF in DOF.
+
+        :param dofs: DOF to encode
+        :type dofs: Tuple[DOF, ...]
+
+        :return: one byte per DOF
+        :rtype: bytes
+        """
+        members: List[DOF] = list(DOF)
+        return bytes(members.index(dof) for dof in dofs)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def from_codes(codes: bytes) -> Tuple["DOF", ...]:
+        """Returns the DOF of codes, see to_codes().
+
+        :param codes: one byte per DOF
+        :type codes: bytes
+
+        :return: Tuple of DOF
+        :rtype: Tuple[DOF, ...]
+
+        :raises IndexError: if a code is invalid
+        """
+        members: List[DOF] = list(DOF)
+        return tuple(members[code] for code in codes)
+
     def __str__(self) -> str:
         return self.short
+
+
+class DofMap:
+    """Integer equation numbers of the DOF of a chain of nodes with equal DOF, the rows and columns of system
+    matrixes.
+
+    The equation of DOF dof of the node with index node_idx is node_idx * dof_num + dofs.index(dof), the
+    equations of a beam between the nodes idx and idx + 1 are the equations of both nodes. DOF can be marked
+    constrained, e.g. by boundary conditions, the remaining free equations are the rows and columns of the
+    reduced system.
+    """
+
+    def __init__(self, node_count: int, dofs: Tuple[DOF, ...]) -> None:
+        """Creates a new map of free DOF.
+
+        :param node_count: number of nodes >= 1
+        :type node_count: int
+        :param dofs: DOF of each node
+        :type dofs: Tuple[DOF, ...]
+
+        :raises ValueError: if node_count < 1, dofs is empty or contains duplicates
+        """
+        if node_count < 1:
+            raise ValueError(f"Invalid number of nodes {node_count} < 1")
+        if len(dofs) == 0:
+            raise ValueError("Empty set of DOF")
+        if len(dofs) != len(set(dofs)):
+            raise ValueError(f"Duplicate DOF in {dofs}")
+        self._node_count: int = node_count
+        self._dofs: Tuple[DOF, ...] = dofs
+        self._constrained: ndarray = zeros(node_count * len(dofs), dtype=bool)
+
+    @property
+    def node_count(self) -> int:
+        """Number of nodes.
+
+        :return: number of nodes
+        :rtype: int
+        """
+        return self._node_count
+
+    @property
+    def dofs(self) -> Tuple[DOF, ...]:
+        """DOF of each node in order of the equations of a node.
+
+        :return: Tuple of DOF
+        :rtype: Tuple[DOF, ...]
+        """
+        return self._dofs
+
+    @property
+    def dof_num(self) -> int:
+        """Number of DOF of each node.
+
+        :return: number of DOF
+        :rtype: int
+        """
+        return len(self._dofs)
+
+    @property
+    def size(self) -> int:
+        """Number of equations, that is the size of the system matrixes.
+
+        :return: number of equations
+        :rtype: int
+        """
+        return len(self._constrained)
+
+    def get_dof_index(self, dof: DOF) -> int:
+        """Returns the index of a DOF in the equations of a node.
+
+        :param dof: DOF
+        :type dof: DOF
+
+        :return: index of the DOF
+        :rtype: int
+
+        :raises ValueError: if dof is not supported
+        """
+        if dof not in self._dofs:
+            raise ValueError(f"Unsupported DOF {dof.name}")
+        return self._dofs.index(dof)
+
+    def get_equations(
+        self,
+        node_indexes: Union[int, Sequence[int], ndarray],
+        dof: Optional[DOF] = None,
+    ) -> ndarray:
+        """Returns the equations of nodes, of one DOF or of all DOF.
+
+        :param node_indexes: index of a node or indexes of nodes
+        :type node_indexes: Union[int, Sequence[int], ndarray]
+        :param dof: DOF or None for all DOF of the nodes
+        :type dof: Optional[DOF]
+
+        :return: equations in the shape of node_indexes for a DOF, with an added last axis of dof_num for all DOF
+        :rtype: ndarray
+
+        :raises ValueError: if dof is not supported
+        :raises IndexError: if any node index is out of range
+        """
+        nodes: ndarray = asarray(node_indexes, dtype=int)
+        if ((nodes < 0) | (nodes >= self._node_count)).any():
+            raise IndexError(f"Node index out of range 0 .. {self._node_count - 1}")
+        if dof is not None:
+            return nodes * self.dof_num + self.get_dof_index(dof)
+        return nodes[..., None] * self.dof_num + arange(self.dof_num)
+
+    def get_element_equations(self) -> ndarray:
+        """Returns the equations of the beams between consecutive nodes, in order of the element matrixes.
+
+        :return: equations [beams x 2 * dof_num]
+        :rtype: ndarray
+        """
+        return (
+            arange(self._node_count - 1)[:, None] * self.dof_num
+            + arange(2 * self.dof_num)[None, :]
+        )
+
+    def is_dof(self, equations: ndarray, dof: DOF) -> ndarray:
+        """Indicates for each equation whether it is of a specific DOF.
+
+        :param equations: equations
+        :type equations: ndarray
+        :param dof: DOF
+        :type dof: DOF
+
+        :return: True for each equation of dof
+        :rtype: ndarray
+
+        :raises ValueError: if dof is not supported
+        """
+        return asarray(equations) % self.dof_num == self.get_dof_index(dof)
+
+    def constrain(
+        self, node_indexes: Union[int, Sequence[int], ndarray], *dofs: DOF
+    ) -> "DofMap":
+        """Marks DOF of nodes as constrained, these are removed from the reduced system.
+
+        :param node_indexes: index of a node or indexes of nodes
+        :type node_indexes: Union[int, Sequence[int], ndarray]
+        :param dofs: DOF to constrain for each node
+        :type dofs: DOF
+
+        :return: self for chaining of calls
+        :rtype: DofMap
+
+        :raises ValueError: if a DOF is not supported
+        :raises IndexError: if any node index is out of range
+        """
+        for dof in dofs:
+            self._constrained[self.get_equations(node_indexes, dof)] = True
+        return self
+
+    def is_constrained(self, node_index: int, dof: DOF) -> bool:
+        """Indicates whether a DOF of a node is constrained.
+
+        :param node_index: index of the node
+        :type node_index: int
+        :param dof: DOF
+        :type dof: DOF
+
+        :return: True if constrained, otherwise False
+        :rtype: bool
+
+        :raises ValueError: if dof is not supported
+        :raises IndexError: if node index is out of range
+        """
+        return bool(self._constrained[self.get_equations(node_index, dof)])
+
+    @property
+    def constrained(self) -> ndarray:
+        """Equations of the constrained DOF.
+
+        :return: ascending equations
+        :rtype: ndarray
+        """
+        return flatnonzero(self._constrained)
+
+    @property
+    def free(self) -> ndarray:
+        """Equations of the free DOF, the gather indexes of the reduced system.
+
+        :return: ascending equations
+        :rtype: ndarray
+        """
+        return flatnonzero(~self._constrained)
+
+    def assemble(self, element_matrixes: ndarray) -> ndarray:
+        """Assembles the system matrix of the element matrixes of the beams, see get_element_equations().
+
+        :param element_matrixes: element matrix of each beam [beams x 2 * dof_num x 2 * dof_num]
+        :type element_matrixes: ndarray
+
+        :return: system matrix [size x size]
+        :rtype: ndarray
+
+        :raises ValueError: if the shape of element_matrixes does not match
+        """
+        equations: ndarray = self.get_element_equations()
+        if element_matrixes.shape != equations.shape + equations.shape[1:]:
+            raise ValueError(
+                f"Invalid shape of element matrixes {element_matrixes.shape}, expected"
+                f" {equations.shape + equations.shape[1:]}"
+            )
+        # values of overlapping DOF are added in order of the beams
+        cells: ndarray = equations[:, :, None] * self.size + equations[:, None, :]
+        return bincount(
+            cells.ravel(), weights=element_matrixes.ravel(), minlength=self.size**2
+        ).reshape(self.size, self.size)
+
+    def add_to_diagonal(
+        self,
+        matrix: ndarray,
+        node_indexes: ndarray,
+        dof_indexes: ndarray,
+        values: ndarray,
+    ) -> ndarray:
+        """Adds values of DOF of nodes to the diagonal of a system matrix, like point masses or springs.
+
+        Values of the same equation are added in order, the matrix is changed in place.
+
+        :param matrix: system matrix [size x size] or its diagonal [size]
+        :type matrix: ndarray
+        :param node_indexes: index of the node of each value
+        :type node_indexes: ndarray
+        :param dof_indexes: index of the DOF of each value, see get_dof_index()
+        :type dof_indexes: ndarray
+        :param values: values to add
+        :type values: ndarray
+
+        :return: matrix
+        :rtype: ndarray
+
+        :raises IndexError: if any node or DOF index is out of range
+        """
+        dof_indexes = asarray(dof_indexes, dtype=int)
+        if ((dof_indexes < 0) | (dof_indexes >= self.dof_num)).any():
+            raise IndexError(f"DOF index out of range 0 .. {self.dof_num - 1}")
+        equations: ndarray = self.get_equations(node_indexes)[..., 0] + dof_indexes
+        add.at(matrix, (equations,) * matrix.ndim, values)
+        return matrix
+
+    def gather(self, matrix: ndarray, equations: Optional[ndarray] = None) -> ndarray:
+        """Returns a system matrix reduced to equations.
+
+        :param matrix: system matrix [size x size]
+        :type matrix: ndarray
+        :param equations: equations to keep or None for the free equations
+        :type equations: Optional[ndarray]
+
+        :return: reduced matrix
+        :rtype: ndarray
+        """
+        if equations is None:
+            equations = self.free
+        return matrix[ix_(equations, equations)]
+
+    def scatter(self, vectors: ndarray, equations: Optional[ndarray] = None) -> ndarray:
+        """Returns vectors of the reduced system expanded to all equations, values of other equations are 0.0.
+
+        :param vectors: values of the equations, one row per equation and one column per vector
+        :type vectors: ndarray
+        :param equations: equations of the rows of vectors or None for the free equations
+        :type equations: Optional[ndarray]
+
+        :return: vectors [size x vectors]
+        :rtype: ndarray
+        """
+        if equations is None:
+            equations = self.free
+        expanded: ndarray = zeros((self.size,) + vectors.shape[1:], dtype=vectors.dtype)
+        expanded[equations] = vectors
+        return expanded
+
+    def get_node_values(self, vectors: ndarray, dof: DOF) -> ndarray:
+        """Returns the values of a DOF of all nodes of system vectors.
+
+        :param vectors: system vectors, one row per equation
+        :type vectors: ndarray
+        :param dof: DOF
+        :type dof: DOF
+
+        :return: values, one row per node
+        :rtype: ndarray
+
+        :raises ValueError: if dof is not supported
+        """
+        return vectors[self.get_dof_index(dof) :: self.dof_num]
@@ -1,22 +1,32 @@
 """Nodes for beam ends and other related elements, like point masses."""
 from model.core import DOF, AXIS
 from model.entry import Mass
+from model.utils import ModelObject
+from typing import Any
 from typing import Tuple
 from typing import Set
 from typing import List
 from typing import Dict
+from typing import Mapping
 from typing import TypeVar
 from typing import Generic
 from typing import Type
 from typing import Union
 from typing import Final
 from typing import Optional
+from typing import ClassVar
 from math import pow
 from math import sqrt
-from copy import deepcopy
+from math import isnan
+from math import nan
+from types import MappingProxyType
+
+# coordinates of the CSYS origin, all axes 0.0
+_ORIGIN: Final[Dict[AXIS, float]] = {axis: 0.0 for axis in AXIS}
+
 
 # TODO: DOF must also be computed, if they are not set (to define BC)
-class Node:
+class Node(ModelObject):
     """3D Node with set of DOF.
 
     Location: A node has 3 coordinate values (defined by the enum AXIS) which define its location in 3D-CSYS.
@@ -27,15 +37,24 @@ class Node:
     Values: It is allowed to set values for each DOF - e.g. to define boundary conditions a node's DOF.W can
     be set to 0.0. Solvers use that information to manage boundary conditions. DOF with no values set will be
     free and their displacement will be computed.
+
+    Coordinate stamps: each change of coordinates stamps the node with a new value of a counter shared by all
+    nodes. Values computed from coordinates, like the length of beams, are valid as long as the stamps of the
+    nodes are unchanged.
     """
 
-    def __init__(self, dofs: Tuple[DOF, ...], coords: Dict[AXIS, float] = {}) -> None:
+    # stamp of the latest coordinate change of any node
+    _last_coords_stamp: ClassVar[int] = 0
+
+    def __init__(
+        self, dofs: Tuple[DOF, ...], coords: Mapping[AXIS, float] = {}
+    ) -> None:
         """Creates a new node.
 
         :param dofs: Defines the degree of freedom the node will have
         :type dofs: Tuple[DOF, ...]
         :param coords: Coordinates in 3D-CSYS defined by AXIS
-        :type coords: Dict[AXIS, float]
+        :type coords: Mapping[AXIS, float]
 
         :raises ValueError: if dofs is None or empty, if dofs contains any duplicates
         """
@@ -50,13 +69,63 @@ class Node:
         self._dof_num = len(self._dofs)
         self._dof_values: Dict[DOF, float] = dict()
 
-        self._coords: Dict[AXIS, float] = dict()
-        for c in AXIS:
-            self._coords[c] = 0.0
-
+        self._coords: Dict[AXIS, float] = dict(_ORIGIN)
         # sets only these coords that are specified
-        for k, v in coords.items():
-            self._coords[k] = v
+        self._coords.update(coords)
+        self._coords_stamp: int = self._stamp_coords()
+
+    def _stamp_coords(self) -> int:
+        """Stamps a change of the coordinates.
+
+        :return: new coordinate stamp of the node
+        :rtype: int
+        """
+        Node._last_coords_stamp += 1
+        self._coords_stamp = Node._last_coords_stamp
+        self._stamp_modification()
+        return self._coords_stamp
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # DOF codes, coordinates in order of AXIS and DOF values, nan for values not set
+        return self._restore, (
+            DOF.to_codes(self._dofs),
+            tuple(self._coords[axis] for axis in AXIS),
+            tuple(self._dof_values.get(dof, nan) for dof in self._dofs),
+        )
+
+    @classmethod
+    def _restore(
+        cls, codes: bytes, coords: Tuple[float, ...], dof_values: Tuple[float, ...]
+    ) -> "Node":
+        node: Node = cls.__new__(cls)
+        node._dofs = DOF.from_codes(codes)
+        node._dof_num = len(node._dofs)
+        node._dof_values = {
+            dof: value for dof, value in zip(node._dofs, dof_values) if not isnan(value)
+        }
+        node._coords = dict(zip(_ORIGIN, coords))
+        # new coordinate stamp, restoring does not modify any model
+        Node._last_coords_stamp += 1
+        node._coords_stamp = Node._last_coords_stamp
+        return node
+
+    @property
+    def coords_stamp(self) -> int:
+        """Stamp of the latest coordinate change of the node.
+
+        :return: coordinate stamp
+        :rtype: int
+        """
+        return self._coords_stamp
+
+    @staticmethod
+    def last_coords_stamp() -> int:
+        """Stamp of the latest coordinate change of any node, changes with each move of any node.
+
+        :return: coordinate stamp
+        :rtype: int
+        """
+        return Node._last_coords_stamp
 
     @property
     def dof_num(self) -> int:
@@ -85,6 +154,7 @@ class Node:
         :type value: float
         """
         self._coords[axis] = value
+        self._stamp_coords()
         return self
 
     def set_coords(self, coords: Dict[AXIS, float]) -> "Node":
@@ -114,15 +184,16 @@ class Node:
         return self._coords[axis]
 
     @property
-    def coords(self) -> Dict[AXIS, float]:
-        """Returns a dictionary with all coordinate values by AXIS.
+    def coords(self) -> Mapping[AXIS, float]:
+        """Returns all coordinate values by AXIS.
 
-        Note: chaning this dictionary will not have any effect on the coordinates of this object.
+        Note: the mapping is a read-only view which reflects later changes of the coordinates of this object,
+        use dict(node.coords) for a copy.
 
-        :return: Dictionary with all coordinates
-        :rtype: Dict[AXIS, float]
+        :return: read-only view of all coordinates
+        :rtype: Mapping[AXIS, float]
         """
-        return deepcopy(self._coords)
+        return MappingProxyType(self._coords)
 
     def offset(self, vector: Dict[AXIS, float]) -> "Node":
         """Offsets the node by a specific vector:
@@ -138,6 +209,7 @@ class Node:
             raise ValueError("Empty offset vector")
         for axis, value in vector.items():
             self._coords[axis] = value + self._coords[axis]
+        self._stamp_coords()
         return self
 
     def set_dof(self, dof: DOF, value: float) -> "Node":
@@ -153,6 +225,7 @@ class Node:
         if dof not in self._dofs:
             raise ValueError(f"Unsupported DOF {dof.name}")
         self._dof_values[dof] = value
+        self._stamp_modification()
         return self
 
     def get_dof(self, dof: DOF) -> float:
@@ -1,4 +1,5 @@
 """Entries are items applied to the model such as loads, masses and others."""
+from typing import Any
 from typing import Dict
 from typing import List
 from typing import Sequence
@@ -6,14 +7,17 @@ from typing import Tuple
 from model.core import AXIS
 from model.core import DOF
 from model.core import DOF_TYPE
+from model.utils import ModelObject
 from numpy import ndarray
 from numpy import array
 from numpy import zeros
 from copy import deepcopy
+from math import isnan
+from math import nan
 
 
 # TODO: mass is still strange with DOF.W and DOF.X - perhaps set mass and return for both CSYS the value?
-class Mass:
+class Mass(ModelObject):
     """Mass defined by mass values for specific DOF.
 
     Mass values for displacement DOF are in unit [MASS] and for rotational DOF in [Mass * Length^2]
@@ -23,6 +27,18 @@ class Mass:
     def __init__(self) -> None:
         self._mass_values: Dict[DOF, float] = {}
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # values of all DOF, nan for values not set
+        return self._restore, (tuple(self._mass_values.get(dof, nan) for dof in DOF),)
+
+    @classmethod
+    def _restore(cls, values: Tuple[float, ...]) -> "Mass":
+        mass: Mass = cls()
+        mass._mass_values = {
+            dof: value for dof, value in zip(DOF, values) if not isnan(value)
+        }
+        return mass
+
     def values(self, default_value: float = 0.0) -> Dict[DOF, float]:
         """Mass (mass, mmoi) values for all existing DOF where unset values will be filled with default_value.
 
@@ -52,6 +68,7 @@ class Mass:
                 f"Invalid value {value} for MMOI {dof.name}, allowed is >= 0.0"
             )
         self._mass_values[dof] = value
+        self._stamp_modification()
         return self
 
     def set_mass(self, value: float) -> "Mass":
@@ -66,6 +83,7 @@ class Mass:
             raise ValueError(f"Invalid mass value {value}, allowed is >= 0.0")
         for dof in DOF.get_by_type(DOF_TYPE.DISP):
             self._mass_values[dof] = value
+        self._stamp_modification()
         return self
 
     def get_value(self, dof: DOF) -> float:
@@ -129,7 +147,7 @@ class Mass:
         return m
 
 
-class Spring:
+class Spring(ModelObject):
     """Linear translational or rotational springs for specific DOFs.
 
     Spring values for displacement DOF are in unit [Force/Length] and for rotational DOF in [Moment/RAD].
@@ -138,6 +156,18 @@ class Spring:
     def __init__(self) -> None:
         self._spring_values: Dict[DOF, float] = {}
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # values of all DOF, nan for values not set
+        return self._restore, (tuple(self._spring_values.get(dof, nan) for dof in DOF),)
+
+    @classmethod
+    def _restore(cls, values: Tuple[float, ...]) -> "Spring":
+        spring: Spring = cls()
+        spring._spring_values = {
+            dof: value for dof, value in zip(DOF, values) if not isnan(value)
+        }
+        return spring
+
     def set_value(self, dof: DOF, value: float) -> "Spring":
         """Sets a spring value for specific DOF.
 
@@ -152,6 +182,7 @@ class Spring:
             raise ValueError(f"Invalid spring value {value} for {dof}")
 
         self._spring_values[dof] = value
+        self._stamp_modification()
         return self
 
     def get_value(self, dof: DOF) -> float:
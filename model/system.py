@@ -4,25 +4,279 @@
 """Structural model with multiple beams like composite beam systems."""
 
 from copy import deepcopy
+from hashlib import sha256
+from threading import Lock
+from types import MappingProxyType
 from model.beams import ABeam
 from model.core import DOF
+from model.core import DOF_TYPE
 from model.core import AXIS
-from model.utils import expand_matrix
+from model.core import DofMap
+from model.utils import get_problems
+from model.utils import pack_table
+from model.utils import unpack_table
 from model.elements import Node
 from model.elements import by_offset
 from model.entry import Mass
 from model.entry import Spring
-from model.utils import is_equal
+from utils.strings import require_non_empty
 from typing import List
+from typing import Set
+from typing import Any
 from typing import Sequence
 from typing import Optional
 from typing import Type
 from typing import Tuple
 from typing import Union
 from typing import Dict
+from typing import Mapping
+from typing import Iterator
 from numpy import ndarray
 from numpy import array
 from numpy import zeros
+from numpy import stack
+from numpy import asarray
+from numpy import broadcast_to
+from numpy import concatenate
+from numpy import cumsum
+from numpy import flatnonzero
+from numpy import isnan
+from numpy import argsort
+from numpy import searchsorted
+from numpy import where
+from numpy import isfinite
+from numpy import nan
+from numpy import add
+from numpy import arange
+from numpy import bincount
+from numpy import einsum
+from numpy import maximum
+from numpy import minimum
+from numpy import nonzero
+from numpy import unique
+from numpy.linalg import inv
+from numpy.polynomial.legendre import leggauss
+
+# Gauss points on 0.0 .. 1.0 of the element mass matrixes of line masses, exact for quintic shape functions
+_LINE_XI, _LINE_WEIGHTS = leggauss(6)
+_LINE_XI = (_LINE_XI + 1.0) / 2.0
+_LINE_WEIGHTS = _LINE_WEIGHTS / 2.0
+# coefficients of the polynomials of shape functions by their values at the Gauss points
+_LINE_COEFFS: ndarray = inv(_LINE_XI[:, None] ** arange(len(_LINE_XI)))
+
+
+class _NodeMassesView(Mapping[Node, Sequence[Mass]]):
+    """Read-only view of masses per node, the masses of each node are returned as tuple."""
+
+    def __init__(self, masses: Dict[Node, List[Mass]]) -> None:
+        self._masses: Dict[Node, List[Mass]] = masses
+
+    def __getitem__(self, node: Node) -> Tuple[Mass, ...]:
+        return tuple(self._masses[node])
+
+    def __iter__(self) -> Iterator[Node]:
+        return iter(self._masses)
+
+    def __len__(self) -> int:
+        return len(self._masses)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self.items())})"
+
+
+class BendingPlane:
+    """Springs and masses of a bending plane of a model, like fore-aft or side-side of a tower.
+
+    Springs of the plane replace the springs of the model at the same node, masses of the plane are added
+    to the masses of the model.
+    """
+
+    def __init__(self, name: str) -> None:
+        """Creates a new bending plane without springs and masses.
+
+        :param name: name of the plane
+        :type name: str
+
+        :raises ValueError: if name is None or empty
+        """
+        require_non_empty(name, "plane name")
+        self._name: str = name
+        self._masses: Dict[Node, List[Mass]] = {}
+        self._springs: Dict[Node, Spring] = {}
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def node_masses(self) -> Mapping[Node, Sequence[Mass]]:
+        """Returns the masses of the plane per node, see copy_node_masses() for a copy.
+
+        :return: read-only view of the masses, tuple per node -- reflects later changes of self, masses must
+                 not be changed
+        :rtype: Mapping[Node, Sequence[Mass]]
+        """
+        return _NodeMassesView(self._masses)
+
+    def copy_node_masses(self) -> Dict[Node, List[Mass]]:
+        """Returns a copy of the masses of the plane per node.
+
+        :return: Dictionary of masses -- changes to that dictionary will not effect self
+        :rtype: Dict[Node, List[Mass]]
+        """
+        return deepcopy(self._masses)
+
+    @property
+    def springs(self) -> Mapping[Node, Spring]:
+        """Returns the springs of the plane, see copy_springs() for a copy.
+
+        :return: read-only view of the springs -- reflects later changes of self, springs must not be changed
+        :rtype: Mapping[Node, Spring]
+        """
+        return MappingProxyType(self._springs)
+
+    def copy_springs(self) -> Dict[Node, Spring]:
+        """Returns a copy of the springs of the plane.
+
+        :return: Dictionary of springs -- changes to that dictionary will not effect self
+        :rtype: Dict[Node, Spring]
+        """
+        return deepcopy(self._springs)
+
+    @property
+    def mass_count(self) -> int:
+        return len([m for ms in self._masses.values() for m in ms])
+
+    @property
+    def spring_count(self) -> int:
+        return len(self._springs)
+
+
+class BoundaryScenario:
+    """Boundary conditions of a scenario, like fixed base, soft or stiff foundation, applied to a model.
+
+    A scenario prescribes DOF of nodes and attaches springs to nodes, nodes are identified by x-coordinate.
+    Boundary conditions of the model remain, springs of the scenario replace the springs of the model at the
+    same node.
+    """
+
+    def __init__(self, name: str) -> None:
+        """Creates a new scenario without boundary conditions.
+
+        :param name: name of the scenario
+        :type name: str
+
+        :raises ValueError: if name is None or empty
+        """
+        require_non_empty(name, "scenario name")
+        self._name: str = name
+        self._fixed: List[Tuple[float, Tuple[DOF, ...]]] = []
+        self._springs: List[Tuple[float, Spring]] = []
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def fixed(self) -> List[Tuple[float, Tuple[DOF, ...]]]:
+        """Returns the prescribed DOF as x-coordinate and DOF, empty DOF for all DOF of the node.
+
+        :return: list of x-coordinate and DOF
+        :rtype: List[Tuple[float, Tuple[DOF, ...]]]
+        """
+        return list(self._fixed)
+
+    @property
+    def springs(self) -> List[Tuple[float, Spring]]:
+        """Returns the springs as x-coordinate and spring.
+
+        :return: list of x-coordinate and spring -- changes to the springs will not effect self
+        :rtype: List[Tuple[float, Spring]]
+        """
+        return deepcopy(self._springs)
+
+    def fix(self, x: float, *dofs: DOF) -> "BoundaryScenario":
+        """Prescribes DOF of the node at x to 0.0.
+
+        :param x: x-coordinate of the node
+        :type x: float
+        :param dofs: DOF to prescribe, all DOF of the node if none provided
+        :type dofs: DOF
+
+        :return: self for chaining of calls
+        :rtype: BoundaryScenario
+        """
+        self._fixed.append((x, tuple(dofs)))
+        return self
+
+    def attach_spring(self, x: float, spring: Spring) -> "BoundaryScenario":
+        """Attaches a spring to the node at x.
+
+        :param x: x-coordinate of the node
+        :type x: float
+        :param spring: spring to attach
+        :type spring: Spring
+
+        :return: self for chaining of calls
+        :rtype: BoundaryScenario
+        """
+        self._springs.append((x, spring))
+        return self
+
+    def resolve(
+        self, model: "CompBeamModel", htol: float = 1.0e-4
+    ) -> Tuple[List[Tuple[Node, DOF]], Dict[Node, Spring]]:
+        """Resolves the boundary conditions to the nodes of a model.
+
+        :param model: model to resolve nodes of
+        :type model: CompBeamModel
+        :param htol: symmetric height tolerance
+        :type htol: float
+
+        :return: Tuple of first is prescribed DOF by node, second is springs by node
+        :rtype: Tuple[List[Tuple[Node, DOF]], Dict[Node, Spring]]
+
+        :raises ValueError: if no node exists at x or DOF or spring is not supported by the node
+        """
+        fixed: List[Tuple[Node, DOF]] = []
+        for x, dofs in self._fixed:
+            node: Node = model.get_node_by_height(x, htol)
+            for dof in dofs if len(dofs) > 0 else node.dofs:
+                if dof not in node.dofs:
+                    raise ValueError(f"DOF {dof} is not supported by node at x = {x}")
+                fixed.append((node, dof))
+
+        springs: Dict[Node, Spring] = {}
+        for x, spring in self._springs:
+            node = model.get_node_by_height(x, htol)
+            for dof in spring.dofs:
+                if dof not in node.dofs:
+                    raise ValueError(
+                        f"Spring has DOF {dof} which is not supported by node at x = {x}"
+                    )
+            springs[node] = spring
+        return fixed, springs
+
+    def apply(self, model: "CompBeamModel", htol: float = 1.0e-4) -> "CompBeamModel":
+        """Returns a copy of the model with the boundary conditions of this scenario applied.
+
+        :param model: model to apply boundary conditions to
+        :type model: CompBeamModel
+        :param htol: symmetric height tolerance
+        :type htol: float
+
+        :return: model with boundary conditions
+        :rtype: CompBeamModel
+
+        :raises ValueError: if no node exists at x or DOF or spring is not supported by the node
+        """
+        scenario_model: CompBeamModel = deepcopy(model)
+        fixed, springs = self.resolve(scenario_model, htol)
+        for node, dof in fixed:
+            node.set_dof(dof, 0.0)
+        for node, spring in springs.items():
+            scenario_model.attach_spring(node, deepcopy(spring))
+        return scenario_model
 
 
 # TODO: test adding of springs to model
@@ -37,12 +291,112 @@ class CompBeamModel:
 
     Springs: can be attached to Nodes of the model where the relationship is 1 to 1. Springs will be
     considered in the system stiffness matrix.
+
+    Bending planes: springs and masses can be defined per bending plane, see BendingPlane. The system
+    matrixes of the model do not include these, a model of a plane is provided by get_plane_model().
     """
 
     def __init__(self) -> None:
         self._beams: List[ABeam] = []
+        # index of each node, nodes are compared by identity
+        self._node_indexes: Dict[Node, int] = {}
+        # coordinate stamp, x-coordinates of nodes sorted ascending and node indexes in this order
+        self._x_index: Optional[Tuple[int, ndarray, ndarray]] = None
+        # modifications of the model and its objects, see _stamp_modification()
+        self._modification_stamp: int = 0
+        # modification stamp of the latest validation, see validate()
+        self._valid_stamp: int = -1
+        # modification stamp and mass and spring tables of the model by kind, see get_mass_table()
+        self._tables: Dict[str, Tuple[int, ndarray, ndarray, ndarray]] = {}
         self._masses: Dict[Node, List[Mass]] = {}
+        # x_start, x_end and mass per length of each line mass
+        self._line_masses: List[Tuple[float, float, float]] = []
         self._springs: Dict[Node, Spring] = {}
+        self._planes: Dict[str, BendingPlane] = {}
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickles the model as the arrays of a snapshot, see FrozenCompBeamModel.get_arrays().
+
+        Caches of the model are not pickled, the validation is kept for models validated.
+        """
+        if self.is_empty:
+            return CompBeamModel, (), {"_line_masses": list(self._line_masses)}
+        _, args = FrozenCompBeamModel(self).__reduce__()
+        return self._restore, (*args, self.is_validated)
+
+    @classmethod
+    def _restore(
+        cls,
+        beam_class: Type[ABeam],
+        plane_names: Tuple[str, ...],
+        packed: Dict[str, Any],
+        validated: bool,
+    ) -> "CompBeamModel":
+        model: CompBeamModel = FrozenCompBeamModel._restore(
+            beam_class, plane_names, packed
+        ).thaw()
+        if validated:
+            model._valid_stamp = model._modification_stamp
+        return model
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "CompBeamModel":
+        """Copies the model by the arrays of a snapshot, see FrozenCompBeamModel.thaw().
+
+        Nodes, beams, masses, springs and planes are registered in memo with their copies, objects copied
+        together with the model refer to the objects of the copy. If any node or beam was copied before the
+        model, the object graph is copied instead.
+        """
+        nodes: List[Node] = self.nodes
+        model: CompBeamModel
+        if any(id(obj) in memo for obj in (*nodes, *self._beams)):
+            model = CompBeamModel.__new__(CompBeamModel)
+            memo[id(self)] = model
+            model.__dict__.update(deepcopy(self.__dict__, memo))
+            model._register_objects()
+        else:
+            model = (
+                CompBeamModel() if self.is_empty else FrozenCompBeamModel(self).thaw()
+            )
+            model._line_masses = list(self._line_masses)
+            memo[id(self)] = model
+            copies: Dict[Node, Node] = dict(zip(nodes, model.nodes))
+            pairs: List[Tuple[Any, Any]] = [
+                *copies.items(),
+                *zip(self._beams, model._beams),
+            ]
+            tables: List[Tuple[Any, Any]] = [(self, model)] + [
+                (plane, model._planes[name]) for name, plane in self._planes.items()
+            ]
+            for original, copy in tables:
+                pairs.append((original, copy))
+                for node, masses in original._masses.items():
+                    pairs.extend(zip(masses, copy._masses[copies[node]]))
+                for node, spring in original._springs.items():
+                    pairs.append((spring, copy._springs[copies[node]]))
+            for original, copy in pairs:
+                memo[id(original)] = copy
+        if self.is_validated:
+            model._valid_stamp = model._modification_stamp
+        return model
+
+    def _stamp_modification(self) -> None:
+        """Stamps a modification of the model or any of its objects, see ModelObject._stamp_modification()."""
+        self._modification_stamp += 1
+
+    def _register_objects(self) -> None:
+        """Registers the model with all its nodes, beams, masses and springs, including those of bending planes,
+        these notify the model of their modifications, see ModelObject._add_model().
+        """
+        for node in self._node_indexes:
+            node._add_model(self)
+        for beam in self._beams:
+            beam._add_model(self)
+        for table in (self, *self._planes.values()):
+            for masses in table._masses.values():
+                for mass in masses:
+                    mass._add_model(self)
+            for spring in table._springs.values():
+                spring._add_model(self)
 
     @property
     def is_empty(self) -> bool:
@@ -99,6 +453,18 @@ class CompBeamModel:
             return "undef"
         return self._beams[0].beam_type
 
+    def get_dof_map(self) -> DofMap:
+        """Returns a new map of the equations of the DOF of all nodes, no DOF is constrained.
+
+        :return: map of DOF
+        :rtype: DofMap
+
+        :raises ValueError: if model is empty
+        """
+        if self.is_empty:
+            raise ValueError("Empty model, no DOF")
+        return DofMap(len(self._beams) + 1, self._beams[0].dofs)
+
     def get_coords(self, axis: AXIS) -> List[float]:
         """Returns a list of coordinates of all nodes in the model.
 
@@ -147,13 +513,76 @@ class CompBeamModel:
 
         :raises ValueError: if no node exists at height
         """
-        nodes: List[Node] = [
-            n for n in self.nodes if is_equal(height, n.get_coord(AXIS.X), atol=htol)
-        ]
-        if len(nodes) == 1:
-            return nodes[0]
-        else:
-            raise ValueError(f"No node exists at height = {height}")
+        return self.get_nodes_by_height([height], htol)[0]
+
+    def get_nodes_by_height(
+        self, heights: Sequence[float], htol: float = 1.0e-4
+    ) -> List[Node]:
+        """Gets the nodes at a sequence of heights, see get_node_by_height().
+
+        The heights are resolved at once by binary search in the sorted x-coordinates of the nodes.
+
+        :param heights: heights to get nodes at
+        :type heights: Sequence[float]
+        :param htol: symmetric height tolerance
+        :type htol: float
+
+        :return: node at each height
+        :rtype: List[Node]
+
+        :raises ValueError: if no node or more than one node exists at any height
+        """
+        heights_arr: ndarray = asarray(heights, dtype=float).reshape(-1)
+        if len(heights_arr) == 0:
+            return []
+        x_sorted, order = self._get_x_index()
+        low: ndarray = searchsorted(x_sorted, heights_arr - htol, side="left")
+        high: ndarray = searchsorted(x_sorted, heights_arr + htol, side="right")
+        invalid: ndarray = flatnonzero(high - low != 1)
+        if len(invalid) > 0:
+            raise ValueError(f"No node exists at height = {heights_arr[invalid[0]]}")
+        return [self._get_node(idx) for idx in order[low].tolist()]
+
+    def get_node_index(self, node: Node) -> int:
+        """Returns the index of a node in nodes, nodes are compared by identity.
+
+        :param node: node of the model
+        :type node: Node
+
+        :return: node index, 0 .. count
+        :rtype: int
+
+        :raises KeyError: if node is not a node of the model
+        """
+        return self._node_indexes[node]
+
+    def _get_node(self, index: int) -> Node:
+        """Returns the node at an index of nodes without building the list of nodes.
+
+        :param index: node index, 0 .. count
+        :type index: int
+
+        :return: node at index
+        :rtype: Node
+        """
+        if index < len(self._beams):
+            return self._beams[index].node1
+        return self._beams[index - 1].node2
+
+    def _get_x_index(self) -> Tuple[ndarray, ndarray]:
+        """Returns the x-coordinates of all nodes sorted ascending and the node indexes in this order.
+
+        The index is built on first use after beams were added or any node was moved, see Node.coords_stamp.
+
+        :return: Tuple of first is the sorted x-coordinates, second is the node indexes
+        :rtype: Tuple[ndarray, ndarray]
+        """
+        stamp: int = Node.last_coords_stamp()
+        if self._x_index is None or self._x_index[0] != stamp:
+            x: ndarray = array(self.get_coords(AXIS.X), dtype=float)
+            order: ndarray = argsort(x, kind="stable")
+            self._x_index = (stamp, x[order], order)
+        return self._x_index[1], self._x_index[2]
 
     def offset(self, vector: Dict[AXIS, float]) -> "CompBeamModel":
         """Offsets the entire model, meaning all nodes of the model by the specified vector (parallel shift).
@@ -170,10 +599,24 @@ class CompBeamModel:
             raise ValueError("Empty offset vector")
         for n in self.nodes:
             n.offset(vector)
+        if AXIS.X in vector:
+            dx: float = vector[AXIS.X]
+            self._line_masses = [
+                (x_start + dx, x_end + dx, value)
+                for x_start, x_end, value in self._line_masses
+            ]
         return self
 
     @property
-    def beams(self) -> List[ABeam]:
+    def beams(self) -> Tuple[ABeam, ...]:
+        """All beams, see copy_beams() for a copy.
+
+        :return: tuple of the beams of the model -- beams must not be changed
+        :rtype: Tuple[ABeam, ...]
+        """
+        return tuple(self._beams)
+
+    def copy_beams(self) -> List[ABeam]:
         """List of all beams.
 
         :return: deepcopied list of all beams
@@ -219,14 +662,22 @@ class CompBeamModel:
                 "beam types cannot be mixed in model"
             )
         # TODO: check for node types and DOF instead of beam type? allow insertion of 'spring' elements, etc.
-        if any(beam is b for b in self._beams):
+        # node2 of a beam in the model is either node2 or node1 of a later beam
+        if beam.node2 in self._node_indexes:
             raise ValueError(f"The beam {beam} exists in the model")
         if not self.is_empty and not self._beams[-1].node2 is beam.node1:
             raise ValueError(
                 f"Node1 of {beam} is not Node2 of current end beam of model"
             )
 
+        if self.is_empty:
+            self._node_indexes[beam.node1] = 0
+        self._node_indexes[beam.node2] = len(self._beams) + 1
         self._beams.append(beam)
+        self._x_index = None
+        for obj in (beam.node1, beam.node2, beam):
+            obj._add_model(self)
+        self._stamp_modification()
         return self
 
     def add_all(self, beams: Sequence[ABeam]) -> "CompBeamModel":
@@ -275,6 +726,128 @@ class CompBeamModel:
         )
         return self.add(new_beam)
 
+    @classmethod
+    def from_arrays(
+        cls,
+        beam_type: Type[ABeam],
+        lengths: Sequence[float],
+        area: Union[float, Sequence[float]],
+        area_moi: Union[float, Sequence[float]],
+        e_modul: Union[float, Sequence[float]],
+        mass: Union[float, Sequence[float]],
+        x0: float = 0.0,
+        masses: Optional[Sequence[float]] = None,
+        springs: Optional[Dict[DOF, Sequence[float]]] = None,
+        dof_values: Optional[Dict[DOF, Sequence[float]]] = None,
+    ) -> "CompBeamModel":
+        """Creates a model of a chain of beams along the x-axis from arrays of beam properties.
+
+        All arrays are validated at once and the model is built in linear time, without the checks of add().
+        Beam properties are arrays with one value per beam or a single value for all beams. Masses, springs and
+        DOF values are arrays with one value per node, starting with the start node.
+
+        :param beam_type: type of the beams, beams must be created by area, area_moi, e_modul and mass
+        :type beam_type: Type[ABeam]
+        :param lengths: length of each beam
+        :type lengths: Sequence[float]
+        :param area: cross section per beam
+        :type area: Union[float, Sequence[float]]
+        :param area_moi: area moment of inertia per beam
+        :type area_moi: Union[float, Sequence[float]]
+        :param e_modul: elastic modulus per beam
+        :type e_modul: Union[float, Sequence[float]]
+        :param mass: mass per beam
+        :type mass: Union[float, Sequence[float]]
+        :param x0: x-coordinate of the start node
+        :type x0: float
+        :param masses: point mass per node, 0.0 for no mass
+        :type masses: Optional[Sequence[float]]
+        :param springs: spring values per node by DOF, 0.0 for no spring
+        :type springs: Optional[Dict[DOF, Sequence[float]]]
+        :param dof_values: DOF values per node by DOF, nan for free DOF
+        :type dof_values: Optional[Dict[DOF, Sequence[float]]]
+
+        :return: model of the beams
+        :rtype: CompBeamModel
+
+        :raises ValueError: if lengths is empty, any beam property is invalid for beam_type (see
+                            ABeam.get_problems()), the size of an array does not match or masses and springs are
+                            negative
+        :raises TypeError: if beam_type is not a subtype of ABeam
+        """
+        if not isinstance(beam_type, type) or not issubclass(beam_type, ABeam):
+            raise TypeError(f'Invalid beam type "{beam_type}"')
+        lengths_arr: ndarray = asarray(lengths, dtype=float)
+        count: int = len(lengths_arr)
+        if count == 0:
+            raise ValueError("Empty array of beam lengths")
+
+        def get_array(values: Any, name: str, size: int) -> ndarray:
+            values_arr: ndarray = asarray(values, dtype=float)
+            if values_arr.ndim == 0:
+                return broadcast_to(values_arr, (size,))
+            if values_arr.shape != (size,):
+                raise ValueError(
+                    f"Invalid size {values_arr.size} of {name}, expected {size}"
+                )
+            return values_arr
+
+        def check(invalid: ndarray, message: str) -> None:
+            indexes: ndarray = flatnonzero(invalid)
+            if len(indexes) > 0:
+                raise ValueError(f"{message} at indexes {indexes.tolist()}")
+
+        area_arr: ndarray = get_array(area, "area", count)
+        area_moi_arr: ndarray = get_array(area_moi, "area_moi", count)
+        e_modul_arr: ndarray = get_array(e_modul, "e_modul", count)
+        mass_arr: ndarray = get_array(mass, "mass", count)
+        # lengths are distances of the nodes, negative lengths are not detected by the beams
+        check(~(lengths_arr > 0.0), "Invalid length <= 0.0")
+
+        node_dofs: Tuple[DOF, ...] = beam_type.get_dofs()  # type: ignore
+        x: ndarray = x0 + concatenate(([0.0], cumsum(lengths_arr)))
+        nodes: List[Node] = [Node(node_dofs, {AXIS.X: value}) for value in x.tolist()]
+
+        model: CompBeamModel = cls()
+        model._node_indexes = {node: idx for idx, node in enumerate(nodes)}
+        model._beams = [
+            beam_type(n1, n2, area=a, area_moi=i, e_modul=e, mass=m)  # type: ignore
+            for n1, n2, a, i, e, m in zip(
+                nodes[:-1],
+                nodes[1:],
+                area_arr.tolist(),
+                area_moi_arr.tolist(),
+                e_modul_arr.tolist(),
+                mass_arr.tolist(),
+            )
+        ]
+        # conditions of verify() of the beam type
+        problems: List[str] = beam_type.get_problems(model._beams)
+        if len(problems) > 0:
+            raise ValueError(f"Invalid beams: {'; '.join(problems)}")
+
+        if masses is not None:
+            masses_arr: ndarray = get_array(masses, "masses", count + 1)
+            check(masses_arr < 0.0, "Invalid mass < 0.0")
+            for idx in flatnonzero(masses_arr > 0.0):
+                model._masses[nodes[idx]] = [Mass().set_mass(float(masses_arr[idx]))]
+        for dof, values in (springs or {}).items():
+            if dof not in node_dofs:
+                raise ValueError(f"Spring has DOF {dof} which is not supported by node")
+            springs_arr: ndarray = get_array(values, f"springs {dof}", count + 1)
+            check(springs_arr < 0.0, f"Invalid spring {dof} < 0.0")
+            for idx in flatnonzero(springs_arr > 0.0):
+                model._springs.setdefault(nodes[idx], Spring()).set_value(
+                    dof, float(springs_arr[idx])
+                )
+        for dof, values in (dof_values or {}).items():
+            dof_arr: ndarray = get_array(values, f"DOF values {dof}", count + 1)
+            for idx in flatnonzero(~isnan(dof_arr)):
+                nodes[idx].set_dof(dof, float(dof_arr[idx]))
+
+        model._register_objects()
+        return model
+
     @property
     def count(self) -> int:
         """Returns the number of beams in this model.
@@ -348,7 +921,16 @@ class CompBeamModel:
 
     # TODO: rename every attribute for node masses to include 'node', like 'add_mass' to 'add_node_mass'?
     @property
-    def node_masses(self) -> Dict[Node, List[Mass]]:
+    def node_masses(self) -> Mapping[Node, Sequence[Mass]]:
+        """All node masses, see copy_node_masses() for a copy.
+
+        :return: read-only view of all node masses, tuple per node -- reflects later changes of self, masses
+                 must not be changed
+        :rtype: Mapping[Node, Sequence[Mass]]
+        """
+        return _NodeMassesView(self._masses)
+
+    def copy_node_masses(self) -> Dict[Node, List[Mass]]:
         """All node masses.
 
         :return: deepcopied dict of all node masses
@@ -371,12 +953,14 @@ class CompBeamModel:
 
         :raises ValueError: If node does not exist (for this model)
         """
-        if node not in self.nodes:
+        if node not in self._node_indexes:
             raise ValueError(f"Node {node} does not exist")
         if node in self._masses:
             self._masses[node].append(mass)
         else:
             self._masses[node] = [mass]
+        mass._add_model(self)
+        self._stamp_modification()
         return self
 
     def assign_mass(
@@ -399,42 +983,108 @@ class CompBeamModel:
 
         :raises ValueError: if count node of model < 2, if x out of range from start to end nodes x-coordinate
         """
+        return self.add_mass(self._get_nearest_node(x, htol), mass)
+
+    def assign_masses(
+        self, xs: Sequence[float], masses: Sequence[Mass], htol: float = 1.0e-4
+    ) -> "CompBeamModel":
+        """Assign masses at a sequence of x-coordinates, each to the nearest node, see assign_mass().
+
+        The nearest nodes are resolved at once by binary search in the sorted x-coordinates of the nodes.
+
+        :param xs: x-coordinate of each mass
+        :type xs: Sequence[float]
+        :param masses: masses to attach
+        :type masses: Sequence[Mass]
+        :param htol: symmetric height tolerance
+        :type htol: float
+
+        :return: self for chaining of calls
+        :rtype: CompBeamModel
+
+        :raises ValueError: if sizes of xs and masses differ, if count node of model < 2, if any x out of range
+                            from start to end nodes x-coordinate
+        """
+        if len(xs) != len(masses):
+            raise ValueError(
+                f"Invalid number of masses {len(masses)}, expected {len(xs)} (x-coordinates)"
+            )
+        for node, mass in zip(self._get_nearest_nodes(xs, htol), masses):
+            self.add_mass(node, mass)
+        return self
+
+    def _get_nearest_node(self, x: float, htol: float = 1.0e-4) -> Node:
+        """Returns the node nearest to x, the lower node is preferred if x is exactly between two nodes.
+
+        :param x: x-coordinate
+        :type x: float
+        :param htol: symmetric height tolerance
+        :type htol: float
+
+        :return: nearest node
+        :rtype: Node
+
+        :raises ValueError: if count node of model < 2, if x out of range from start to end nodes x-coordinate
+        """
+        return self._get_nearest_nodes([x], htol)[0]
+
+    def _get_nearest_nodes(
+        self, xs: Sequence[float], htol: float = 1.0e-4
+    ) -> List[Node]:
+        """Returns the node nearest to each x, see _get_nearest_node().
+
+        A node within htol of x is preferred, otherwise the nearest node is selected.
+
+        :param xs: x-coordinates
+        :type xs: Sequence[float]
+        :param htol: symmetric height tolerance
+        :type htol: float
+
+        :return: nearest node of each x
+        :rtype: List[Node]
+
+        :raises ValueError: if count node of model < 2, if any x out of range from start to end nodes x-coordinate
+        """
         assert self.end_node is not None
         assert self.start_node is not None
-        x_low: float = self.start_node.get_coord(AXIS.X)
-        x_high: float = self.end_node.get_coord(AXIS.X)
-
         if self.count < 2:
             raise ValueError(
                 f"Insufficient nodes to assign mass: found {self.count}, required are 2"
             )
-        if not is_equal(x, x_low, htol) and x < x_low:
-            raise ValueError(f"Invalid x-coordinate = {x} < {x_low} (start beam)")
-        if not is_equal(x, x_high, htol) and x > x_high:
-            raise ValueError(f"Invalid x-coordinate = {x} > {x_high} (end beam)")
-
-        nodes: List[Node] = self.nodes
-        nodes_at_x: List[Node] = [
-            n for n in nodes if is_equal(n.get_coord(AXIS.X), x, htol)
-        ]
 
-        if len(nodes_at_x) >= 1:
-            self.add_mass(nodes_at_x[0], mass)
-        else:
-            n_below: Node = max(
-                [n for n in nodes if n.get_coord(AXIS.X) < x],
-                key=lambda n: n.get_coord(AXIS.X),
+        xs_arr: ndarray = asarray(xs, dtype=float).reshape(-1)
+        if len(xs_arr) == 0:
+            return []
+        x_sorted, order = self._get_x_index()
+        x_low: float = float(x_sorted[0])
+        x_high: float = float(x_sorted[-1])
+        below: ndarray = flatnonzero(xs_arr < x_low - htol)
+        if len(below) > 0:
+            raise ValueError(
+                f"Invalid x-coordinate = {xs_arr[below[0]]} < {x_low} (start beam)"
             )
-            n_above: Node = min(
-                [n for n in nodes if n.get_coord(AXIS.X) > x],
-                key=lambda n: n.get_coord(AXIS.X),
+        above: ndarray = flatnonzero(xs_arr > x_high + htol)
+        if len(above) > 0:
+            raise ValueError(
+                f"Invalid x-coordinate = {xs_arr[above[0]]} > {x_high} (end beam)"
             )
-            if abs(x - n_below.get_coord(AXIS.X)) <= abs(n_above.get_coord(AXIS.X) - x):
-                self.add_mass(n_below, mass)
-            else:
-                self.add_mass(n_above, mass)
 
-        return self
+        # first node within htol, else the nearest of the adjacent nodes
+        count: int = len(x_sorted)
+        at_x: ndarray = searchsorted(x_sorted, xs_arr - htol, side="left")
+        is_at_x: ndarray = (at_x < count) & (
+            x_sorted[at_x.clip(max=count - 1)] <= xs_arr + htol
+        )
+        idx_above: ndarray = searchsorted(x_sorted, xs_arr, side="left").clip(
+            1, count - 1
+        )
+        is_below: ndarray = (xs_arr - x_sorted[idx_above - 1]) <= (
+            x_sorted[idx_above] - xs_arr
+        )
+        nearest: ndarray = where(
+            is_at_x, at_x, where(is_below, idx_above - 1, idx_above)
+        )
+        return [self._get_node(idx) for idx in order[nearest].tolist()]
 
     def has_mass_at_node(self, node: Node) -> bool:
         """Indicates whether a mass is registered for the specific node.
@@ -487,12 +1137,12 @@ class CompBeamModel:
 
     @property
     def mass(self) -> float:
-        """Returns the total mass of the model, that is beam mass and added masses.
+        """Returns the total mass of the model, that is beam mass, line masses and added masses.
 
         :return: total mass of model
         :rtype: float
         """
-        return self.total_mass_beams + self.total_node_masses
+        return self.total_mass_beams + self.total_line_masses + self.total_node_masses
 
     @property
     def total_mass_beams(self) -> float:
@@ -503,6 +1153,96 @@ class CompBeamModel:
         """
         return sum(b.mass for b in self._beams)
 
+    def add_line_mass(
+        self, x_start: float, x_end: float, mass_per_length: float
+    ) -> "CompBeamModel":
+        """Adds a mass distributed evenly along the x-range of beams, like platforms, cables or ladders.
+
+        The line mass acts on all displacement DOF of the beams it overlaps, parts outside the beams of the model
+        are ignored. Line masses are defined by x-coordinate, they remain when beams are split or merged.
+
+        :param x_start: x-coordinate of the start of the line mass
+        :type x_start: float
+        :param x_end: x-coordinate of the end of the line mass > x_start
+        :type x_end: float
+        :param mass_per_length: mass per length >= 0.0
+        :type mass_per_length: float
+
+        :return: self for chaining of calls
+        :rtype: CompBeamModel
+
+        :raises ValueError: if x_end <= x_start or mass_per_length < 0.0
+        """
+        if not x_end > x_start:
+            raise ValueError(f"Invalid x-range of line mass {x_start} .. {x_end}")
+        if not mass_per_length >= 0.0:
+            raise ValueError(
+                f"Invalid mass per length {mass_per_length}, allowed is >= 0.0"
+            )
+        self._line_masses.append((float(x_start), float(x_end), float(mass_per_length)))
+        self._stamp_modification()
+        return self
+
+    @property
+    def line_masses(self) -> Tuple[Tuple[float, float, float], ...]:
+        """Returns all line masses in the order they were added.
+
+        :return: x_start, x_end and mass per length of each line mass
+        :rtype: Tuple[Tuple[float, float, float], ...]
+        """
+        return tuple(self._line_masses)
+
+    @property
+    def line_mass_count(self) -> int:
+        """Returns the number of line masses.
+
+        :return: number of line masses
+        :rtype: int
+        """
+        return len(self._line_masses)
+
+    @property
+    def total_line_masses(self) -> float:
+        """Returns the mass of all line masses on the beams of the model.
+
+        :return: total mass of line masses
+        :rtype: float
+        """
+        return float(self.get_beams_line_mass().sum())
+
+    def _get_line_mass_overlaps(self) -> Tuple[ndarray, ndarray, ndarray, ndarray]:
+        """Returns the parts of the line masses on each beam, in order of the beams and the line masses.
+
+        :return: Tuple of first is the beam indexes, second and third are the x-range of each part, fourth is the
+                 mass per length
+        :rtype: Tuple[ndarray, ndarray, ndarray, ndarray]
+        """
+        if self.is_empty or len(self._line_masses) == 0:
+            return zeros(0, dtype=int), zeros(0), zeros(0), zeros(0)
+        lines: ndarray = array(self._line_masses, dtype=float)
+        x: ndarray = array(self.get_coords(AXIS.X), dtype=float)
+        # overlap of the x-range of each beam and each line mass [beams x line masses]
+        x_1: ndarray = maximum(minimum(x[:-1], x[1:])[:, None], lines[:, 0])
+        x_2: ndarray = minimum(maximum(x[:-1], x[1:])[:, None], lines[:, 1])
+        beam_idx, line_idx = nonzero(x_2 > x_1)
+        return (
+            beam_idx,
+            x_1[beam_idx, line_idx],
+            x_2[beam_idx, line_idx],
+            lines[line_idx, 2],
+        )
+
+    def get_beams_line_mass(self) -> ndarray:
+        """Returns the mass of the line masses on each beam.
+
+        :return: mass per beam, in order of the beams
+        :rtype: ndarray
+        """
+        beam_idx, x_1, x_2, mass_per_length = self._get_line_mass_overlaps()
+        return bincount(
+            beam_idx, weights=mass_per_length * (x_2 - x_1), minlength=self.count
+        )
+
     # TODO: test attaching of springs, check for fails by unsupported DOF (if DOF that does not exist in model)
     def attach_spring(self, node: Node, spring: Spring) -> "CompBeamModel":
         """Attach a spring to a specific node of the model.
@@ -517,12 +1257,14 @@ class CompBeamModel:
 
         :raises ValueError: if node does not exist (is not a node of this model)
         """
-        if node not in self.nodes:
+        if node not in self._node_indexes:
             raise ValueError(f"Node {node} does not exist")
         for dof in spring.dofs:
             if dof not in node.dofs:
                 raise ValueError(f"Spring has DOF {dof} which is not supported by node")
         self._springs[node] = spring
+        spring._add_model(self)
+        self._stamp_modification()
         return self
 
     def has_spring(self, node: Node) -> bool:
@@ -556,7 +1298,15 @@ class CompBeamModel:
         return len(self._springs)
 
     @property
-    def springs(self) -> Dict[Node, Spring]:
+    def springs(self) -> Mapping[Node, Spring]:
+        """Returns all attached springs, see copy_springs() for a copy.
+
+        :return: read-only view of attached springs -- reflects later changes of self, springs must not be changed
+        :rtype: Mapping[Node, Spring]
+        """
+        return MappingProxyType(self._springs)
+
+    def copy_springs(self) -> Dict[Node, Spring]:
         """Returns a dictionary of all attached springs.
 
         :return: Dictionary of attached springs -- changes to that dictionary will not effect self
@@ -564,6 +1314,319 @@ class CompBeamModel:
         """
         return deepcopy(self._springs)
 
+    @property
+    def plane_names(self) -> List[str]:
+        """Returns the names of all bending planes in order of definition.
+
+        :return: names of bending planes
+        :rtype: List[str]
+        """
+        return list(self._planes.keys())
+
+    def get_plane(self, name: str) -> BendingPlane:
+        """Returns a bending plane.
+
+        :param name: name of the plane
+        :type name: str
+
+        :return: bending plane
+        :rtype: BendingPlane
+
+        :raises KeyError: if the plane does not exist
+        """
+        if name not in self._planes:
+            raise KeyError(f'Bending plane "{name}" does not exist')
+        return self._planes[name]
+
+    def _get_or_add_plane(self, name: str) -> BendingPlane:
+        if name not in self._planes:
+            self._planes[name] = BendingPlane(name)
+        return self._planes[name]
+
+    def attach_plane_spring(
+        self, name: str, node: Node, spring: Spring
+    ) -> "CompBeamModel":
+        """Attach a spring to a specific node for a bending plane, the plane is added if it does not exist.
+
+        The spring replaces the spring of the model at the node for the plane.
+
+        :param name: name of the plane
+        :type name: str
+        :param node: Node to attach spring to
+        :type node: Node
+        :param spring: Spring to attach
+        :type spring: Spring
+
+        :return: self for chaining of calls
+        :rtype: CompBeamModel
+
+        :raises ValueError: if node does not exist (is not a node of this model), spring has unsupported DOF
+                            or name is empty
+        """
+        if node not in self._node_indexes:
+            raise ValueError(f"Node {node} does not exist")
+        for dof in spring.dofs:
+            if dof not in node.dofs:
+                raise ValueError(f"Spring has DOF {dof} which is not supported by node")
+        self._get_or_add_plane(name)._springs[node] = spring
+        spring._add_model(self)
+        self._stamp_modification()
+        return self
+
+    def add_plane_mass(self, name: str, node: Node, mass: Mass) -> "CompBeamModel":
+        """Adds a mass to a specific node for a bending plane, the plane is added if it does not exist.
+
+        The mass is added to the masses of the model at the node for the plane.
+
+        :param name: name of the plane
+        :type name: str
+        :param node: Node to add mass to
+        :type node: Node
+        :param mass: Mass to add to node
+        :type mass: Mass
+
+        :return: Self for chaining of calls
+        :rtype: CompBeamModel
+
+        :raises ValueError: If node does not exist (for this model) or name is empty
+        """
+        if node not in self._node_indexes:
+            raise ValueError(f"Node {node} does not exist")
+        self._get_or_add_plane(name)._masses.setdefault(node, []).append(mass)
+        mass._add_model(self)
+        self._stamp_modification()
+        return self
+
+    def assign_plane_mass(
+        self, name: str, mass: Mass, x: float, htol: float = 1.0e-4
+    ) -> "CompBeamModel":
+        """Assign a mass for a bending plane at a specific x-coordinate to the nearest node, see assign_mass().
+
+        :param name: name of the plane
+        :type name: str
+        :param mass: mass to attach
+        :type mass: Mass
+        :param x: x-coordinate
+        :type x: float
+        :param htol: symmetric height tolerance
+        :type htol: float
+
+        :return: self for chaining of calls
+        :rtype: CompBeamModel
+
+        :raises ValueError: if count node of model < 2, if x out of range from start to end nodes x-coordinate
+        """
+        return self.add_plane_mass(name, self._get_nearest_node(x, htol), mass)
+
+    def get_plane_model(self, name: str) -> "CompBeamModel":
+        """Returns a copy of the model with the springs and masses of a bending plane applied.
+
+        The returned model has no bending planes.
+
+        :param name: name of the plane
+        :type name: str
+
+        :return: model of the bending plane
+        :rtype: CompBeamModel
+
+        :raises KeyError: if the plane does not exist
+        """
+        self.get_plane(name)
+        model: CompBeamModel = deepcopy(self)
+        plane: BendingPlane = model._planes[name]
+        model._planes = {}
+        model._springs.update(plane._springs)
+        for node, masses in plane._masses.items():
+            model._masses.setdefault(node, []).extend(masses)
+        return model
+
+    def merged(self, node_indexes: Sequence[int]) -> "CompBeamModel":
+        """Returns a coarser model of the nodes at the indexes, beams between these nodes are merged.
+
+        Beams between kept nodes are merged, see ABeam.merge(). Masses of removed nodes are moved to the
+        nearest node, the lower node is preferred, line masses remain. Bending planes are not included.
+
+        :param node_indexes: ascending indexes of nodes to keep, must include start and end node
+        :type node_indexes: Sequence[int]
+
+        :return: merged model
+        :rtype: CompBeamModel
+
+        :raises ValueError: if model is empty, indexes are not ascending, do not include start and end node or
+                            a removed node has DOF set or a spring attached
+        """
+        if self.is_empty:
+            raise ValueError("Empty model, unable to merge beams")
+        nodes: List[Node] = self.nodes
+        keep: List[int] = list(node_indexes)
+        if len(keep) < 2 or keep[0] != 0 or keep[-1] != len(nodes) - 1:
+            raise ValueError("Node indexes must include start and end node")
+        if any(idx_1 >= idx_2 for idx_1, idx_2 in zip(keep[:-1], keep[1:])):
+            raise ValueError(f"Node indexes are not ascending: {keep}")
+        for idx, node in enumerate(nodes):
+            if idx not in keep and (node.has_set_dofs or node in self._springs):
+                raise ValueError(
+                    f"Unable to remove node {idx} with DOF set or spring attached"
+                )
+
+        new_nodes: List[Node] = [deepcopy(nodes[idx]) for idx in keep]
+        model: CompBeamModel = CompBeamModel()
+        for pos, (idx_1, idx_2) in enumerate(zip(keep[:-1], keep[1:])):
+            beams: List[ABeam] = self._beams[idx_1:idx_2]
+            model.add(
+                beams[0].get_segment(new_nodes[pos], new_nodes[pos + 1], 0.0, 1.0)
+                if len(beams) == 1
+                else beams[0].merge(new_nodes[pos], new_nodes[pos + 1], beams)
+            )
+
+        x_keep: List[float] = [nodes[idx].get_coord(AXIS.X) for idx in keep]
+        for node, masses in self._masses.items():
+            x: float = node.get_coord(AXIS.X)
+            target: int = min(range(len(keep)), key=lambda pos: abs(x_keep[pos] - x))
+            for mass in masses:
+                model.add_mass(new_nodes[target], deepcopy(mass))
+        for node, spring in self._springs.items():
+            model.attach_spring(
+                new_nodes[keep.index(self._node_indexes[node])], deepcopy(spring)
+            )
+        model._line_masses = list(self._line_masses)
+        return model
+
+    def subdivided(self, parts: Sequence[int]) -> "CompBeamModel":
+        """Returns a finer model with each beam split into parts of equal length.
+
+        Split beams are segments of the beam, see ABeam.get_segment(). Boundary conditions, masses, springs
+        and bending planes remain at their nodes, line masses remain.
+
+        :param parts: number of parts per beam in order of beams, 1 keeps the beam
+        :type parts: Sequence[int]
+
+        :return: subdivided model
+        :rtype: CompBeamModel
+
+        :raises ValueError: if model is empty, the number of parts does not match the number of beams or is < 1
+        """
+        if self.is_empty:
+            raise ValueError("Empty model, unable to subdivide beams")
+        if len(parts) != self.count:
+            raise ValueError(
+                f"Number of parts {len(parts)} does not match number of beams {self.count}"
+            )
+        if any(count < 1 for count in parts):
+            raise ValueError(f"Invalid number of parts {min(parts)} < 1")
+
+        node_map: Dict[Node, Node] = {node: deepcopy(node) for node in self.nodes}
+        model: CompBeamModel = CompBeamModel()
+        for beam, count in zip(self._beams, parts):
+            node1: Node = node_map[beam.node1]
+            for part in range(1, count + 1):
+                node2: Node = (
+                    node_map[beam.node2]
+                    if part == count
+                    else by_offset(
+                        node_map[beam.node1], {AXIS.X: beam.length * part / count}
+                    )
+                )
+                model.add(
+                    beam.get_segment(node1, node2, (part - 1) / count, part / count)
+                )
+                node1 = node2
+
+        for node, masses in self._masses.items():
+            for mass in masses:
+                model.add_mass(node_map[node], deepcopy(mass))
+        for node, spring in self._springs.items():
+            model.attach_spring(node_map[node], deepcopy(spring))
+        model._line_masses = list(self._line_masses)
+        for name, plane in self._planes.items():
+            for node, masses in plane._masses.items():
+                for mass in masses:
+                    model.add_plane_mass(name, node_map[node], deepcopy(mass))
+            for node, spring in plane._springs.items():
+                model.attach_plane_spring(name, node_map[node], deepcopy(spring))
+        return model
+
+    def coarsen(self, tolerance: float) -> Tuple["CompBeamModel", float]:
+        """Returns a coarser model with consecutive beams of similar stiffness and mass merged into longer beams.
+
+        Beams are merged by equal bending flexibility and total mass, see ABeam.merge(). The relative frequency
+        error of merging beams is estimated from the relative deviation of the bending stiffness e_modul *
+        area_moi and the mass per length of each merged beam from the merged beam, to first order the relative
+        error of the frequencies is at most half the sum of both maximum deviations. Consecutive beams are merged
+        as long as this estimate is within the tolerance. The estimate does not include the discretization error
+        of the longer beams, which is small for the lower modes.
+
+        Nodes with DOF set, masses, springs or masses and springs of bending planes are kept.
+
+        :param tolerance: maximum estimated relative frequency error of each merged beam >= 0.0, 0.0 merges
+                          beams of equal stiffness and mass per length only
+        :type tolerance: float
+
+        :return: Tuple of first is the coarse model, second is the estimated relative frequency error
+        :rtype: Tuple[CompBeamModel, float]
+
+        :raises ValueError: if model is empty or tolerance < 0.0
+        """
+        if self.is_empty:
+            raise ValueError("Empty model, unable to coarsen beams")
+        if tolerance < 0.0:
+            raise ValueError(f"Invalid tolerance {tolerance} < 0.0")
+
+        nodes: List[Node] = self.nodes
+        kept: Set[Node] = {node for node in nodes if node.has_set_dofs}
+        kept.update(self._masses.keys(), self._springs.keys())
+        for plane in self._planes.values():
+            kept.update(plane._masses.keys(), plane._springs.keys())
+
+        lengths: ndarray = array([b.length for b in self._beams])
+        stiffness: ndarray = array([b.e_modul * b.area_moi for b in self._beams])
+        mass_per_length: ndarray = array([b.mass for b in self._beams]) / lengths
+
+        def get_error(start: int, end: int) -> float:
+            # equal flexibility and total mass of beams start .. end - 1
+            group: slice = slice(start, end)
+            length: float = lengths[group].sum()
+            group_stiffness: float = length / (lengths[group] / stiffness[group]).sum()
+            group_mass: float = (mass_per_length[group] * lengths[group]).sum() / length
+            return 0.5 * (
+                abs(stiffness[group] / group_stiffness - 1.0).max()
+                + abs(mass_per_length[group] / group_mass - 1.0).max()
+            )
+
+        keep: List[int] = [0]
+        error: float = 0.0
+        group_error: float = 0.0
+        for idx in range(1, self.count):
+            # node idx is removed, if the beams from the last kept node to node idx + 1 can be merged
+            merged_error: float = get_error(keep[-1], idx + 1)
+            # allow round-off of the merged properties of equal beams
+            if nodes[idx] in kept or merged_error > tolerance + 1.0e-12:
+                keep.append(idx)
+                error = max(error, group_error)
+                group_error = 0.0
+            else:
+                group_error = merged_error
+        keep.append(len(nodes) - 1)
+        error = max(error, group_error)
+
+        model: CompBeamModel = self.merged(keep)
+        new_nodes: List[Node] = model.nodes
+        for name, plane in self._planes.items():
+            for node, masses in plane._masses.items():
+                for mass in masses:
+                    model.add_plane_mass(
+                        name,
+                        new_nodes[keep.index(self._node_indexes[node])],
+                        deepcopy(mass),
+                    )
+            for node, spring in plane._springs.items():
+                model.attach_plane_spring(
+                    name,
+                    new_nodes[keep.index(self._node_indexes[node])],
+                    deepcopy(spring),
+                )
+        return model, error
+
     @property
     def length(self) -> float:
         """Returns the total length of the model.
@@ -573,35 +1636,193 @@ class CompBeamModel:
         """
         return sum(b.length for b in self._beams)
 
-    def _point_masses_to_sys_M(self, sys_mass_matrix: ndarray) -> ndarray:
-        """Insert point mass matrixes of all defined masses into system mass matrix and return combined matrix.
+    @property
+    def is_validated(self) -> bool:
+        """Indicates whether the model was validated and neither the model nor any of its objects was modified
+        since, see validate().
 
-        :param sys_mass_matrix: System mass matrix
-        :type sys_mass_matrix: ndarray
+        Each model counts its own modifications, modifications of objects of other models do not affect the
+        validation, see model.utils.ModelObject.
 
-        :return: System mass matrix with mass points inserted
+        :return: True if the validation is current, otherwise False
+        :rtype: bool
         """
-        if self.mass_count == 0:
-            return sys_mass_matrix
-        else:
-            assert self.start_node is not None
-
-            dofs: Tuple[DOF, ...] = self.dofs
-            dof_num: int = self.dof_num
-            nodes: List[Node] = self.nodes
-
-            # loop over masses and insert in system mass matrix
-            for node, masses in self._masses.items():
-                node_idx: int = nodes.index(node)
-                # index of the first DOF of the node in system matrix
-                sys_idx: int = node_idx * dof_num
-                # insert point mass matrix in system mass matrix
-                for mass in masses:
-                    sys_mass_matrix[
-                        sys_idx : sys_idx + dof_num, sys_idx : sys_idx + dof_num
-                    ] += mass.get_M(dofs)
+        return self._valid_stamp == self._modification_stamp
+
+    def validate(self) -> "CompBeamModel":
+        """Validates all beams, DOF values, masses and springs of the model at once and reports all problems.
+
+        The validation is recorded with the modification stamp of the model, see is_validated. While the stamp
+        is current, element matrixes of the beams skip their checks (see ABeam.verify()) and the validation is
+        not repeated.
+
+        :return: self for chaining of calls
+        :rtype: CompBeamModel
+
+        :raises ValueError: if model is empty or any problem was found, the message lists all problems
+        """
+        if self.is_empty:
+            raise ValueError("Empty model")
+        if self.is_validated:
+            return self
+        stamp: int = self._modification_stamp
+
+        # flags nodes with any non-finite value of pairs of node index and value
+        def invalid_at(values: List[Tuple[int, float]]) -> ndarray:
+            pairs: ndarray = array(values, dtype=float).reshape(-1, 2)
+            invalid: ndarray = zeros(len(self._beams) + 1, dtype=bool)
+            invalid[pairs[~isfinite(pairs[:, 1]), 0].astype(int)] = True
+            return invalid
+
+        checks: List[Tuple[ndarray, str]] = []
+        dof_values: List[Tuple[int, float]] = [
+            (idx, n.get_dof(dof))
+            for idx, n in enumerate(self.nodes)
+            for dof in n.set_dofs
+        ]
+        checks.append((invalid_at(dof_values), "Invalid DOF value"))
+        planes: List[Tuple[str, Dict[Node, List[Mass]], Dict[Node, Spring]]] = [
+            ("model", self._masses, self._springs)
+        ] + [
+            (f"plane {name}", p._masses, p._springs) for name, p in self._planes.items()
+        ]
+        for name, masses, springs in planes:
+            mass_values: List[Tuple[int, float]] = [
+                (self._node_indexes[n], m.get_value(dof))
+                for n, ms in masses.items()
+                for m in ms
+                for dof in m.dofs
+            ]
+            spring_values: List[Tuple[int, float]] = [
+                (self._node_indexes[n], spring.get_value(dof))
+                for n, spring in springs.items()
+                for dof in spring.dofs
+            ]
+            checks.append((invalid_at(mass_values), f"Invalid mass value of {name}"))
+            checks.append(
+                (invalid_at(spring_values), f"Invalid spring value of {name}")
+            )
+
+        problems: List[str] = [
+            f"Beams: {problem}"
+            for problem in type(self._beams[0]).get_problems(self._beams)
+        ] + [f"Nodes: {problem}" for problem in get_problems(checks)]
+        if len(problems) > 0:
+            raise ValueError(f"Invalid model: {'; '.join(problems)}")
+        self._valid_stamp = stamp
+        return self
+
+    def _get_table(
+        self, kind: str, entries: Sequence[Tuple[Node, Mapping[DOF, float]]]
+    ) -> Tuple[ndarray, ndarray, ndarray]:
+        """Returns the table of values of DOF of nodes, values of DOF not supported by the model are skipped.
+
+        :param kind: kind of the table, key of the table of the model or empty to skip the cache
+        :type kind: str
+        :param entries: node and values by DOF of each entry, in order of the rows
+        :type entries: Sequence[Tuple[Node, Mapping[DOF, float]]]
+
+        :return: Tuple of first is the node indexes, second is the DOF indexes, third is the values
+        :rtype: Tuple[ndarray, ndarray, ndarray]
+        """
+        stamp: int = self._modification_stamp
+        if kind in self._tables and self._tables[kind][0] == stamp:
+            return self._tables[kind][1:]
+        dof_indexes: Dict[DOF, int] = {dof: idx for idx, dof in enumerate(self.dofs)}
+        rows: List[Tuple[int, int, float]] = [
+            (self._node_indexes[node], dof_indexes[dof], value)
+            for node, values in entries
+            for dof, value in values.items()
+            if dof in dof_indexes
+        ]
+        table: Tuple[ndarray, ndarray, ndarray] = (
+            array([r[0] for r in rows], dtype=int),
+            array([r[1] for r in rows], dtype=int),
+            array([r[2] for r in rows], dtype=float),
+        )
+        for arr in table:
+            arr.setflags(write=False)
+        if len(kind) > 0:
+            self._tables[kind] = (stamp, *table)
+        return table
+
+    def get_mass_table(
+        self, node_masses: Optional[Mapping[Node, Sequence[Mass]]] = None
+    ) -> Tuple[ndarray, ndarray, ndarray]:
+        """Returns the values of the masses as table of rows node index, DOF index and value, in order of the
+        nodes and the masses of a node.
+
+        The DOF index is the index in dofs, values of DOF not supported by the model are skipped. The table of
+        the masses of the model is built on first use after any change of the model.
 
-            return sys_mass_matrix
+        :param node_masses: masses per node or None for the masses of the model
+        :type node_masses: Optional[Mapping[Node, Sequence[Mass]]]
+
+        :return: Tuple of first is the node indexes, second is the DOF indexes, third is the values -- read-only
+        :rtype: Tuple[ndarray, ndarray, ndarray]
+
+        :raises KeyError: if a node is not a node of the model
+        """
+        return self._get_table(
+            "masses" if node_masses is None else "",
+            [
+                (node, mass._mass_values)
+                for node, masses in (
+                    self._masses if node_masses is None else node_masses
+                ).items()
+                for mass in masses
+            ],
+        )
+
+    def get_spring_table(
+        self, springs: Optional[Mapping[Node, Spring]] = None
+    ) -> Tuple[ndarray, ndarray, ndarray]:
+        """Returns the values of the springs as table of rows node index, DOF index and value, in order of the
+        nodes, see get_mass_table().
+
+        :param springs: springs per node or None for the springs of the model
+        :type springs: Optional[Mapping[Node, Spring]]
+
+        :return: Tuple of first is the node indexes, second is the DOF indexes, third is the values -- read-only
+        :rtype: Tuple[ndarray, ndarray, ndarray]
+
+        :raises KeyError: if a node is not a node of the model
+        """
+        return self._get_table(
+            "springs" if springs is None else "",
+            [
+                (node, spring._spring_values)
+                for node, spring in (
+                    self._springs if springs is None else springs
+                ).items()
+            ],
+        )
+
+    def add_masses_to_M(
+        self,
+        sys_M: ndarray,
+        node_masses: Optional[Mapping[Node, Sequence[Mass]]] = None,
+    ) -> ndarray:
+        """Inserts the point mass matrixes of masses into a system mass matrix, e.g. of get_beams_M().
+
+        Masses are added to the diagonal by one scatter of the mass table, see get_mass_table().
+
+        :param sys_M: system mass matrix, changed in place
+        :type sys_M: ndarray
+        :param node_masses: masses per node or None for the masses of the model
+        :type node_masses: Optional[Mapping[Node, Sequence[Mass]]]
+
+        :return: system mass matrix with point masses inserted or sys_M if none defined
+        :rtype: ndarray
+
+        :raises KeyError: if a node is not a node of the model
+        """
+        node_indexes, dof_indexes, values = self.get_mass_table(node_masses)
+        if len(values) == 0:
+            return sys_M
+        return self.get_dof_map().add_to_diagonal(
+            sys_M, node_indexes, dof_indexes, values
+        )
 
     def get_M(self) -> ndarray:
         """Returns the system mass matrix.
@@ -609,41 +1830,97 @@ class CompBeamModel:
         :return: System mass matrix
         :rtype: ndarray
 
+        :raises ValueError: If model is empty
+        """
+        return self.add_masses_to_M(self.get_beams_M())
+
+    def get_beams_M(self) -> ndarray:
+        """Returns the system mass matrix of the beams and line masses, excluding masses.
+
+        :return: System mass matrix of beams
+        :rtype: ndarray
+
         :raises ValueError: If model is empty
         """
         if self.is_empty:
             raise ValueError(f"Empty model, unable to generate mass matrix")
-        sys_M = self._beams[0].get_M()
-        for beam in self._beams[1:]:
-            sys_M = expand_matrix(sys_M, beam.get_M())
-        return self._point_masses_to_sys_M(sys_M)
+        elem_M: ndarray = stack([beam.get_M() for beam in self._beams])
+        beam_idx, x_1, x_2, mass_per_length = self._get_line_mass_overlaps()
+        if len(beam_idx) > 0:
+            add.at(
+                elem_M,
+                beam_idx,
+                self._get_line_masses_M(beam_idx, x_1, x_2, mass_per_length),
+            )
+        return self.get_dof_map().assemble(elem_M)
+
+    def _get_line_masses_M(
+        self,
+        beam_idx: ndarray,
+        x_1: ndarray,
+        x_2: ndarray,
+        mass_per_length: ndarray,
+    ) -> ndarray:
+        """Returns the consistent element mass matrixes of parts of line masses, see _get_line_mass_overlaps().
+
+        The matrix of a part is the integral of mass_per_length * N^T * N over its x-range, N are the rows of the
+        displacement DOF of the interpolation matrix of the beam, see ABeam.get_N(). The shape functions of each
+        beam are evaluated at the Gauss points only and interpolated to the Gauss points of the parts.
+
+        :return: element mass matrixes [parts x element DOF x element DOF]
+        :rtype: ndarray
+        """
+        beams, inverse = unique(beam_idx, return_inverse=True)
+        disp: List[int] = [
+            idx for idx, dof in enumerate(self.dofs) if dof.dof_type == DOF_TYPE.DISP
+        ]
+        # polynomial coefficients of the shape functions [beams x power x displacement DOF x element DOF]
+        coeffs: ndarray = einsum(
+            "ps,bsre->bpre",
+            _LINE_COEFFS,
+            array(
+                [
+                    [self._beams[idx].get_N(xi)[disp] for xi in _LINE_XI.tolist()]
+                    for idx in beams.tolist()
+                ]
+            ),
+        )
+        x: ndarray = array(self.get_coords(AXIS.X), dtype=float)
+        length: ndarray = x[beam_idx + 1] - x[beam_idx]
+        xi_1: ndarray = (x_1 - x[beam_idx]) / length
+        xi_2: ndarray = (x_2 - x[beam_idx]) / length
+        # Gauss points of the parts [parts x points]
+        xi: ndarray = xi_1[:, None] + (xi_2 - xi_1)[:, None] * _LINE_XI
+        N: ndarray = einsum(
+            "oqp,opre->oqre", xi[:, :, None] ** arange(len(_LINE_XI)), coeffs[inverse]
+        )
+        weights: ndarray = (mass_per_length * (x_2 - x_1))[:, None] * _LINE_WEIGHTS
+        return einsum("oq,oqre,oqrf->oef", weights, N, N)
 
-    def _springs_to_sys_K(self, sys_K: ndarray) -> ndarray:
-        """Inserts the element stiffness matrix of all springs into the system stiffness matrix.
+    def add_springs_to_K(
+        self, sys_K: ndarray, springs: Optional[Mapping[Node, Spring]] = None
+    ) -> ndarray:
+        """Inserts the element stiffness matrixes of springs into a system stiffness matrix, e.g. of
+        get_beams_K().
 
-        :param sys_K: system stiffness matrix
+        Springs are added to the diagonal by one scatter of the spring table, see get_spring_table().
+
+        :param sys_K: system stiffness matrix, changed in place
         :type sys_K: ndarray
+        :param springs: springs per node or None for the springs of the model
+        :type springs: Optional[Mapping[Node, Spring]]
 
         :return: system stiffness matrix with all spring element matrixes included or sys_K if none defined
+        :rtype: ndarray
+
+        :raises KeyError: if a node is not a node of the model
         """
-        if len(self._springs) == 0:
+        node_indexes, dof_indexes, values = self.get_spring_table(springs)
+        if len(values) == 0:
             return sys_K
-
-        assert self.start_node is not None
-
-        # cache some variables
-        nodes: List[Node] = self.nodes
-        node_dofs: Tuple[DOF, ...] = self.start_node.dofs
-        dof_num: int = self.dof_num
-
-        for node, spring in self._springs.items():
-            # insert spring K in system K
-            idx_node: int = nodes.index(node)
-            sys_idx: int = idx_node * dof_num
-            sys_K[
-                sys_idx : sys_idx + dof_num, sys_idx : sys_idx + dof_num
-            ] += spring.get_K(node_dofs)
-        return sys_K
+        return self.get_dof_map().add_to_diagonal(
+            sys_K, node_indexes, dof_indexes, values
+        )
 
     def get_K(self, order: int = 1) -> ndarray:
         """Returns the system stiffness matrix.
@@ -654,11 +1931,415 @@ class CompBeamModel:
         :return: System stiffness matrix
         :rtype: ndarray
 
+        :raises ValueError: If model is empty or if specified order is not supported
+        """
+        return self.add_springs_to_K(self.get_beams_K(order))
+
+    def get_beams_K(self, order: int = 1) -> ndarray:
+        """Returns the system stiffness matrix of the beams, excluding springs.
+
+        :param order: 1 or 2 (2 includes p-Delta effects)
+        :type order: int
+
+        :return: System stiffness matrix of beams
+        :rtype: ndarray
+
         :raises ValueError: If model is empty or if specified order is not supported
         """
         if self.is_empty:
             raise ValueError(f"Empty model, unable to generate stiffness matrix")
-        sys_K = self._beams[0].get_K(order)
-        for beam in self._beams[1:]:
-            sys_K = expand_matrix(sys_K, beam.get_K(order))
-        return self._springs_to_sys_K(sys_K)
+        return self.get_dof_map().assemble(
+            stack([beam.get_K(order) for beam in self._beams])
+        )
+
+    def freeze(self) -> "FrozenCompBeamModel":
+        """Returns an immutable and hashable snapshot of the validated model, see FrozenCompBeamModel.
+
+        :return: snapshot of the model
+        :rtype: FrozenCompBeamModel
+
+        :raises ValueError: if the model is invalid, see validate()
+        """
+        return FrozenCompBeamModel(self.validate())
+
+
+class FrozenCompBeamModel:
+    """Immutable and hashable snapshot of a validated composite beam model.
+
+    Beams, nodes, masses, line masses and springs are stored as read-only arrays, the snapshot does not refer to any object of
+    the model it was taken from. The hash is computed once from the content of the arrays, snapshots of models
+    with equal content are equal, e.g. to key caches of solutions. System matrixes are assembled once per
+    snapshot and returned read-only.
+
+    Masses and springs store values for all DOF (see DOF), nan for values not set. Masses of each node are kept
+    in the order they were added, nodes in ascending order.
+    """
+
+    # arrays of masses and springs of the model and each plane
+    _TABLES: Tuple[str, ...] = (
+        "mass_nodes",
+        "mass_values",
+        "spring_nodes",
+        "spring_values",
+    )
+
+    def __init__(self, model: CompBeamModel) -> None:
+        """Creates a snapshot of a model, use CompBeamModel.freeze() to validate the model before.
+
+        :param model: model to take the snapshot from
+        :type model: CompBeamModel
+
+        :raises ValueError: if model is empty
+        """
+        if model.is_empty:
+            raise ValueError("Empty model, unable to freeze")
+        nodes: List[Node] = model.nodes
+        dofs: Tuple[DOF, ...] = model.dofs
+        arrays: Dict[str, ndarray] = {
+            "coords": array([[n.get_coord(axis) for axis in AXIS] for n in nodes]),
+            "beam_states": array([b.get_state() for b in model._beams]),
+            "dof_values": array(
+                [
+                    [n.get_dof(dof) if n.is_set(dof) else nan for dof in dofs]
+                    for n in nodes
+                ]
+            ).reshape(-1, len(dofs)),
+            "line_masses": array(model._line_masses, dtype=float).reshape(-1, 3),
+        }
+        tables: List[Tuple[Mapping[Node, Sequence[Mass]], Mapping[Node, Spring]]] = [
+            (model._masses, model._springs)
+        ] + [(p._masses, p._springs) for p in model._planes.values()]
+        for idx, (node_masses, springs) in enumerate(tables):
+            for table, arr in zip(
+                self._TABLES, self._get_tables(model, node_masses, springs)
+            ):
+                arrays[f"{idx}.{table}"] = arr
+        self._init(type(model.start_beam), model.plane_names, arrays)
+
+    @classmethod
+    def from_arrays(
+        cls,
+        beam_class: Type[ABeam],
+        plane_names: Sequence[str],
+        arrays: Mapping[str, ndarray],
+    ) -> "FrozenCompBeamModel":
+        """Creates a snapshot of the arrays of another snapshot, see get_arrays().
+
+        The arrays are not copied but made read-only, e.g. arrays in shared memory.
+
+        :param beam_class: type of the beams
+        :type beam_class: Type[ABeam]
+        :param plane_names: names of the bending planes
+        :type plane_names: Sequence[str]
+        :param arrays: arrays by name
+        :type arrays: Mapping[str, ndarray]
+
+        :return: snapshot of the arrays
+        :rtype: FrozenCompBeamModel
+
+        :raises KeyError: if an array is missing
+        """
+        frozen: FrozenCompBeamModel = cls.__new__(cls)
+        frozen._init(beam_class, plane_names, arrays)
+        return frozen
+
+    def _init(
+        self,
+        beam_class: Type[ABeam],
+        plane_names: Sequence[str],
+        arrays: Mapping[str, ndarray],
+    ) -> None:
+        self._set("_beam_class", beam_class)
+        self._set("_coords", self._read_only(arrays["coords"]))
+        self._set("_beam_states", self._read_only(arrays["beam_states"]))
+        self._set("_dof_values", self._read_only(arrays["dof_values"]))
+        self._set("_line_masses", self._read_only(arrays["line_masses"]))
+        planes: List[Tuple[str, ndarray, ndarray, ndarray, ndarray]] = [
+            (
+                name,
+                *(self._read_only(arrays[f"{idx}.{table}"]) for table in self._TABLES),
+            )
+            for idx, name in enumerate(["", *plane_names])
+        ]
+        self._set("_planes", tuple(planes))
+
+        digest = sha256(
+            repr((self._beam_class.__qualname__, tuple(self.plane_names))).encode()
+        )
+        # name, type and shape delimit the bytes of each array
+        for name, arr in self.get_arrays().items():
+            digest.update(repr((name, arr.dtype.str, arr.shape)).encode())
+            digest.update(arr.tobytes())
+        self._set("_digest", digest.hexdigest())
+        self._set("_hash", hash(self._digest))
+
+        self._set("_lock", Lock())
+        self._set("_model", None)
+        self._set("_matrixes", {})
+
+    def get_arrays(self) -> Dict[str, ndarray]:
+        """Returns all arrays of the snapshot by name, see from_arrays().
+
+        :return: read-only arrays by name
+        :rtype: Dict[str, ndarray]
+        """
+        arrays: Dict[str, ndarray] = {
+            "coords": self._coords,
+            "beam_states": self._beam_states,
+            "dof_values": self._dof_values,
+            "line_masses": self._line_masses,
+        }
+        for idx, (_, *tables) in enumerate(self._planes):
+            for table, arr in zip(self._TABLES, tables):
+                arrays[f"{idx}.{table}"] = arr
+        return arrays
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # tables of values are packed by columns, see pack_table()
+        return self._restore, (
+            self._beam_class,
+            tuple(self.plane_names),
+            {
+                name: pack_table(arr) if arr.ndim == 2 else arr
+                for name, arr in self.get_arrays().items()
+            },
+        )
+
+    @classmethod
+    def _restore(
+        cls,
+        beam_class: Type[ABeam],
+        plane_names: Tuple[str, ...],
+        packed: Dict[str, Any],
+    ) -> "FrozenCompBeamModel":
+        return cls.from_arrays(
+            beam_class,
+            plane_names,
+            {
+                name: unpack_table(value) if isinstance(value, tuple) else value
+                for name, value in packed.items()
+            },
+        )
+
+    def _set(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"Unable to set {name}, model is frozen")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"Unable to delete {name}, model is frozen")
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FrozenCompBeamModel):
+            return NotImplemented
+        return self._digest == other._digest
+
+    @staticmethod
+    def _read_only(arr: ndarray) -> ndarray:
+        arr.setflags(write=False)
+        return arr
+
+    @classmethod
+    def _get_tables(
+        cls,
+        model: CompBeamModel,
+        node_masses: Mapping[Node, Sequence[Mass]],
+        springs: Mapping[Node, Spring],
+    ) -> Tuple[ndarray, ndarray, ndarray, ndarray]:
+        """Returns the node indexes and values of masses and springs, ordered by node index.
+
+        :return: node indexes of masses, mass values [masses x DOF], node indexes of springs and spring
+                 values [springs x DOF]
+        :rtype: Tuple[ndarray, ndarray, ndarray, ndarray]
+        """
+        mass_rows: List[Tuple[int, List[float]]] = sorted(
+            (
+                (model._node_indexes[node], list(mass.values(nan).values()))
+                for node, masses in node_masses.items()
+                for mass in masses
+            ),
+            key=lambda row: row[0],
+        )
+        spring_rows: List[Tuple[int, List[float]]] = sorted(
+            (
+                (
+                    model._node_indexes[node],
+                    [
+                        spring.get_value(dof) if spring.has_dof(dof) else nan
+                        for dof in DOF
+                    ],
+                )
+                for node, spring in springs.items()
+            ),
+            key=lambda row: row[0],
+        )
+        return (
+            cls._read_only(array([row[0] for row in mass_rows], dtype=int)),
+            cls._read_only(array([row[1] for row in mass_rows]).reshape(-1, len(DOF))),
+            cls._read_only(array([row[0] for row in spring_rows], dtype=int)),
+            cls._read_only(
+                array([row[1] for row in spring_rows]).reshape(-1, len(DOF))
+            ),
+        )
+
+    @property
+    def content_hash(self) -> str:
+        """SHA-256 digest of the content of the snapshot.
+
+        :return: hex digest
+        :rtype: str
+        """
+        return self._digest
+
+    @property
+    def beam_class(self) -> Type[ABeam]:
+        """Type of the beams of the model.
+
+        :return: beam type
+        :rtype: Type[ABeam]
+        """
+        return self._beam_class
+
+    @property
+    def count(self) -> int:
+        """Returns the number of beams.
+
+        :return: number of beams
+        :rtype: int
+        """
+        return len(self._beam_states)
+
+    @property
+    def dofs(self) -> Tuple[DOF, ...]:
+        """Degree of freedom of each beam of the model.
+
+        :return: Tuple of DOF
+        :rtype: Tuple[DOF, ...]
+        """
+        return self._beam_class.get_dofs()  # type: ignore
+
+    @property
+    def coords(self) -> ndarray:
+        """Coordinates of the nodes, in order of AXIS.
+
+        :return: read-only coordinates [nodes x axes]
+        :rtype: ndarray
+        """
+        return self._coords
+
+    @property
+    def beam_states(self) -> ndarray:
+        """Values defining each beam besides its nodes, see ABeam.get_state().
+
+        :return: read-only beam values [beams x values]
+        :rtype: ndarray
+        """
+        return self._beam_states
+
+    @property
+    def dof_values(self) -> ndarray:
+        """DOF values of the nodes, nan for free DOF.
+
+        :return: read-only DOF values [nodes x DOF of beams]
+        :rtype: ndarray
+        """
+        return self._dof_values
+
+    @property
+    def line_masses(self) -> ndarray:
+        """Line masses of the model, see CompBeamModel.add_line_mass().
+
+        :return: read-only x_start, x_end and mass per length [line masses x 3]
+        :rtype: ndarray
+        """
+        return self._line_masses
+
+    @property
+    def plane_names(self) -> List[str]:
+        """Names of the bending planes.
+
+        :return: plane names
+        :rtype: List[str]
+        """
+        return [plane[0] for plane in self._planes[1:]]
+
+    def thaw(self) -> CompBeamModel:
+        """Creates a new model of the content of the snapshot.
+
+        :return: new model
+        :rtype: CompBeamModel
+        """
+        # objects are restored as by unpickling, a new model does not modify any other model
+        codes: bytes = DOF.to_codes(self.dofs)
+        nodes: List[Node] = [
+            Node._restore(codes, coords, values)
+            for coords, values in zip(self._coords.tolist(), self._dof_values.tolist())
+        ]
+
+        model: CompBeamModel = CompBeamModel()
+        model._node_indexes = {node: idx for idx, node in enumerate(nodes)}
+        model._beams = [
+            self._beam_class.from_state(n1, n2, state)
+            for n1, n2, state in zip(nodes[:-1], nodes[1:], self._beam_states.tolist())
+        ]
+        for name, mass_idx, mass_values, spring_idx, spring_values in self._planes:
+            masses: Dict[Node, List[Mass]] = (
+                model._masses if name == "" else model._get_or_add_plane(name)._masses
+            )
+            springs: Dict[Node, Spring] = (
+                model._springs if name == "" else model._planes[name]._springs
+            )
+            for idx, values in zip(mass_idx.tolist(), mass_values.tolist()):
+                masses.setdefault(nodes[idx], []).append(Mass._restore(values))
+            for idx, values in zip(spring_idx.tolist(), spring_values.tolist()):
+                springs[nodes[idx]] = Spring._restore(values)
+        model._line_masses = [
+            (x_start, x_end, value)
+            for x_start, x_end, value in self._line_masses.tolist()
+        ]
+        model._register_objects()
+        return model
+
+    def _get_matrix(self, key: Tuple[str, int]) -> ndarray:
+        """Returns a cached system matrix, assembles it on first access.
+
+        :param key: "K" and order or "M" and 0
+        :type key: Tuple[str, int]
+
+        :return: read-only system matrix
+        :rtype: ndarray
+        """
+        with self._lock:
+            if key not in self._matrixes:
+                if self._model is None:
+                    self._set("_model", self.thaw())
+                matrix: ndarray = (
+                    self._model.get_K(key[1]) if key[0] == "K" else self._model.get_M()
+                )
+                self._matrixes[key] = self._read_only(matrix)
+            return self._matrixes[key]
+
+    def get_K(self, order: int = 1) -> ndarray:
+        """Returns the system stiffness matrix, assembled once per order.
+
+        :param order: 1 or 2 (2 includes p-Delta effects)
+        :type order: int
+
+        :return: read-only system stiffness matrix
+        :rtype: ndarray
+
+        :raises ValueError: if specified order is not supported
+        """
+        return self._get_matrix(("K", order))
+
+    def get_M(self) -> ndarray:
+        """Returns the system mass matrix, assembled once.
+
+        :return: read-only system mass matrix
+        :rtype: ndarray
+        """
+        return self._get_matrix(("M", 0))
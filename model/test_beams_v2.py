@@ -4,12 +4,27 @@ from unittest import TestCase
 from model.beams import BeamB_2DOF
 from model.beams import BeamB_3DOF
 from model.beams import BeamB_2DOF_II
+from model.beams import BeamBT_2DOF
+from model.beams import BeamBT_2DOF_II
+from model.beams import BeamBQ_3DOF
+from model.beams import BeamBQ_3DOF_II
+from model.beams import element_matrix_cache
+from model.system import CompBeamModel
 from model.elements import Node
 from model.elements import by_axial_length
 from model.core import AXIS
+from model.core import DOF
 from numpy import ndarray
 from numpy import array
 from numpy import allclose
+from numpy import arange
+from numpy import einsum
+from numpy import ix_
+from numpy.linalg import eigvals
+from numpy.linalg import solve
+from math import pi
+from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
 
 
 class TestBeam_Generic(TestCase):
@@ -156,6 +171,29 @@ class TestBeam_Generic(TestCase):
 
         print("> OK")
 
+    def test_length(self) -> None:
+        print("< test cached length of beam follows moved nodes")
+        beam: BeamB_2DOF_II = BeamB_2DOF_II(
+            *by_axial_length(BeamB_2DOF_II.get_dofs(), 2.0), 0.0, 0.5, 2.1e11, 100.0
+        )
+        elem_K2: ndarray = beam.set_force_x(-1.0e6).get_K2()
+        self.assertEqual((beam.length, beam.length_sq, beam.length_cu), (2.0, 4.0, 8.0))
+
+        beam.node2.set_coord(AXIS.X, 3.0)
+        self.assertEqual(
+            (beam.length, beam.length_sq, beam.length_cu), (3.0, 9.0, 27.0)
+        )
+        self.assertAlmostEqual(beam.get_K2()[1, 1], elem_K2[1, 1] * 1.5, delta=1.0e-6)
+        beam.node1.offset({AXIS.X: 1.0, AXIS.Y: 0.0})
+        self.assertEqual(beam.length, 2.0)
+        model: CompBeamModel = CompBeamModel().add(beam)
+        model.offset({AXIS.Y: 5.0})
+        self.assertEqual(beam.length, 2.0)
+        beam.node2.set_coords({AXIS.Y: 5.0, AXIS.Z: 1.5})
+        self.assertEqual(beam.length_sq, 6.25)
+
+        print("> OK")
+
 
 class TestBeamB_3DOF(TestCase):
     def test_beam_MassMatrix(self) -> None:
@@ -477,3 +515,378 @@ class TestBeamB_2DOF(TestCase):
             ),
         )
         print("> OK")
+
+
+class TestElementMatrixCache(TestCase):
+    def setUp(self) -> None:
+        self.max_size: int = element_matrix_cache.max_size
+        element_matrix_cache.clear()
+
+    def tearDown(self) -> None:
+        element_matrix_cache.set_max_size(self.max_size).clear()
+
+    def test_shared_matrixes(self) -> None:
+        """
+        < Test element matrixes of identical beams are computed once and shared across models
+        """
+        print(TestElementMatrixCache.test_shared_matrixes.__doc__.strip())  # type: ignore
+
+        sections = [(0.2, 0.05, 2.1e11, 3000.0), (0.1, 0.02, 2.1e11, 1500.0)]
+        models = []
+        for _ in range(2):
+            model: CompBeamModel = CompBeamModel().add(
+                BeamB_2DOF_II(
+                    *by_axial_length(BeamB_2DOF_II.get_dofs(), 2.0), *sections[0]
+                )
+            )
+            for idx in range(1, 20):
+                area, area_moi, e_modul, mass = sections[idx % 2]
+                model.append(
+                    2.0, area=area, area_moi=area_moi, e_modul=e_modul, mass=mass
+                )
+            models.append(model)
+
+        sys_K: ndarray = models[0].get_K(1)
+        sys_M: ndarray = models[0].get_M()
+        print(
+            f"     hits={element_matrix_cache.hits}, misses={element_matrix_cache.misses}"
+        )
+        self.assertEqual(4, element_matrix_cache.misses)
+        self.assertEqual(36, element_matrix_cache.hits)
+
+        self.assertTrue(allclose(sys_K, models[1].get_K(1)))
+        self.assertTrue(allclose(sys_M, models[1].get_M()))
+        self.assertEqual(4, element_matrix_cache.misses)
+        self.assertEqual(4, element_matrix_cache.size)
+
+        # shared matrixes must not be modified
+        elem_K: ndarray = models[0].start_beam.get_K(1)
+        self.assertIs(elem_K, models[1].start_beam.get_K(1))
+        with self.assertRaises(ValueError) as context:
+            elem_K[0, 0] = 0.0
+        print(f"   EXPECTED: {str(context.exception)}")
+
+        # modified properties are a new entry
+        models[0].start_beam.set_e_modul(2.0e11)
+        self.assertFalse(allclose(elem_K, models[0].start_beam.get_K(1)))
+        self.assertEqual(5, element_matrix_cache.misses)
+
+        print("> OK")
+
+    def test_bounded_size(self) -> None:
+        """
+        < Test element matrix cache evicts least recently used entries and can be disabled
+        """
+        print(TestElementMatrixCache.test_bounded_size.__doc__.strip())  # type: ignore
+
+        element_matrix_cache.set_max_size(2)
+        beams = [
+            BeamB_2DOF(
+                *by_axial_length(BeamB_2DOF.get_dofs(), length),
+                0.2,
+                0.05,
+                2.1e11,
+                3000.0,
+            )
+            for length in (1.0, 2.0, 3.0)
+        ]
+        for beam in beams:
+            beam.get_M()
+        self.assertEqual(2, element_matrix_cache.size)
+        beams[2].get_M()
+        beams[0].get_M()
+        print(
+            f"     hits={element_matrix_cache.hits}, misses={element_matrix_cache.misses}"
+        )
+        self.assertEqual(1, element_matrix_cache.hits)
+        self.assertEqual(4, element_matrix_cache.misses)
+
+        element_matrix_cache.set_max_size(0)
+        self.assertEqual(0, element_matrix_cache.size)
+        elem_M: ndarray = beams[1].get_M()
+        elem_M[0, 0] = 0.0
+        self.assertEqual(0, element_matrix_cache.size)
+
+        with self.assertRaises(ValueError) as context:
+            element_matrix_cache.set_max_size(-1)
+        print(f"   EXPECTED: {str(context.exception)}")
+
+        print("> OK")
+
+    def test_normalized_keys(self) -> None:
+        """
+        < Test element matrix cache shares entries of positional, keyword and default arguments
+        """
+        print(TestElementMatrixCache.test_normalized_keys.__doc__.strip())  # type: ignore
+
+        beam: BeamB_2DOF = BeamB_2DOF(
+            *by_axial_length(BeamB_2DOF.get_dofs(), 2.0), 0.2, 0.05, 2.1e11, 3000.0
+        )
+        elem_K: ndarray = beam.get_K()
+        self.assertIs(elem_K, beam.get_K(1))
+        self.assertIs(elem_K, beam.get_K(order=1))
+        print(
+            f"     hits={element_matrix_cache.hits}, misses={element_matrix_cache.misses}"
+        )
+        self.assertEqual(1, element_matrix_cache.misses)
+        self.assertEqual(2, element_matrix_cache.hits)
+        self.assertEqual(1, element_matrix_cache.size)
+
+        print("> OK")
+
+    def test_threads(self) -> None:
+        """
+        < Test element matrix cache used by concurrent threads
+        """
+        print(TestElementMatrixCache.test_threads.__doc__.strip())  # type: ignore
+
+        element_matrix_cache.set_max_size(4)
+        beams = [
+            BeamB_2DOF(
+                *by_axial_length(BeamB_2DOF.get_dofs(), 1.0 + 0.5 * idx),
+                0.2,
+                0.05,
+                2.1e11,
+                3000.0,
+            )
+            for idx in range(8)
+        ]
+
+        def get_matrixes(offset: int) -> None:
+            for idx in range(400):
+                beams[(idx + offset) % len(beams)].get_M()
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for result in [executor.submit(get_matrixes, idx) for idx in range(8)]:
+                result.result()
+        print(
+            f"     hits={element_matrix_cache.hits}, misses={element_matrix_cache.misses}"
+        )
+        self.assertEqual(3200, element_matrix_cache.hits + element_matrix_cache.misses)
+        self.assertEqual(4, element_matrix_cache.size)
+
+        print("> OK")
+
+
+class TestBeamBT_2DOF(TestCase):
+    def setUp(self) -> None:
+        self.beam: BeamBT_2DOF_II = BeamBT_2DOF_II(
+            *by_axial_length(BeamBT_2DOF_II.get_dofs(), 20.0),
+            diameter_1=6.0,
+            diameter_2=4.5,
+            thickness_1=0.05,
+            thickness_2=0.03,
+            e_modul=2.1e11,
+            mass=1.5e5,
+        )
+
+    def test_prismatic(self) -> None:
+        """
+        < Test tapered beam of constant section against prismatic beam
+        """
+        print(TestBeamBT_2DOF.test_prismatic.__doc__.strip())  # type: ignore
+
+        diameter, thickness = 4.0, 0.03
+        area: float = pi / 4.0 * (diameter**2 - (diameter - 2.0 * thickness) ** 2)
+        area_moi: float = pi / 64.0 * (diameter**4 - (diameter - 2.0 * thickness) ** 4)
+        tapered: BeamBT_2DOF = BeamBT_2DOF(
+            *by_axial_length(BeamBT_2DOF.get_dofs(), 3.0),
+            diameter,
+            diameter,
+            thickness,
+            thickness,
+            2.1e11,
+            5000.0,
+        )
+        prismatic: BeamB_2DOF = BeamB_2DOF(
+            *by_axial_length(BeamB_2DOF.get_dofs(), 3.0), area, area_moi, 2.1e11, 5000.0
+        )
+        print(f"     area = {tapered.area}, area_moi = {tapered.area_moi}")
+        self.assertAlmostEqual(area, tapered.area, delta=area * 1.0e-12)
+        self.assertAlmostEqual(area_moi, tapered.area_moi, delta=area_moi * 1.0e-12)
+        self.assertTrue(allclose(prismatic.get_K(), tapered.get_K(), rtol=1.0e-12))
+        self.assertTrue(allclose(prismatic.get_M(), tapered.get_M(), rtol=1.0e-12))
+
+        print("> OK")
+
+    def test_exact_integration(self) -> None:
+        """
+        < Test element matrixes of tapered beam against fine numerical integration
+        """
+        print(TestBeamBT_2DOF.test_exact_integration.__doc__.strip())  # type: ignore
+
+        L: float = self.beam.length
+        xi: ndarray = (arange(20000) + 0.5) / 20000
+        area, area_moi = self.beam.get_sections(xi)
+        B: ndarray = array(
+            [
+                12.0 * xi - 6.0,
+                L * (6.0 * xi - 4.0),
+                6.0 - 12.0 * xi,
+                L * (6.0 * xi - 2.0),
+            ]
+        )
+        N: ndarray = array([self.beam.get_N(x)[0] for x in xi]).T
+        K: ndarray = (2.1e11 / L**3) * einsum("q,iq,jq->ij", area_moi / len(xi), B, B)
+        M: ndarray = (1.5e5 / area.mean()) * einsum("q,iq,jq->ij", area / len(xi), N, N)
+
+        self.assertTrue(allclose(K, self.beam.get_K(1), rtol=1.0e-8))
+        self.assertTrue(allclose(M, self.beam.get_M(), rtol=1.0e-8))
+        # geometric stiffness of the axial force
+        self.beam.set_force_x(-2.0e6)
+        self.assertTrue(
+            allclose(self.beam.get_K(2), self.beam.get_K(1) + self.beam.get_K2())
+        )
+
+        print("> OK")
+
+    def test_segment(self) -> None:
+        """
+        < Test segments of tapered beam keep geometry and mass
+        """
+        print(TestBeamBT_2DOF.test_segment.__doc__.strip())  # type: ignore
+
+        model: CompBeamModel = CompBeamModel().add(self.beam).subdivided([4])
+        self.assertEqual(4, model.count)
+        self.assertAlmostEqual(1.5e5, model.total_mass_beams, delta=1.0e-8)
+        self.assertEqual((6.0, 5.625), model.start_beam.diameters)  # type: ignore
+        self.assertAlmostEqual(0.03, model.end_beam.thicknesses[1])  # type: ignore
+        # mass is distributed by cross section
+        self.assertGreater(model.start_beam.mass, model.end_beam.mass)
+
+        merged: CompBeamModel = model.merged([0, 4])
+        self.assertEqual((6.0, 4.5), merged.start_beam.diameters)  # type: ignore
+        self.assertAlmostEqual(1.5e5, merged.start_beam.mass, delta=1.0e-8)
+        self.assertTrue(allclose(self.beam.get_K(1), merged.start_beam.get_K(1)))
+
+        print("> OK")
+
+    def test_fails(self) -> None:
+        """
+        < Test tapered beam fails for invalid geometry
+        """
+        print(TestBeamBT_2DOF.test_fails.__doc__.strip())  # type: ignore
+
+        with self.assertRaises(ValueError) as context:
+            self.beam.set_area_moi(1.0)
+        print(f"   EXPECTED: {str(context.exception)}")
+        with self.assertRaises(ValueError) as context:
+            self.beam.set_thicknesses(0.05, 3.0).get_M()
+        print(f"   EXPECTED: {str(context.exception)}")
+        with self.assertRaises(ValueError) as context:
+            self.beam.set_thicknesses(0.05, 0.03).set_diameters(6.0, -1.0).get_K(1)
+        print(f"   EXPECTED: {str(context.exception)}")
+
+        # all beams verified at once
+        beams = [deepcopy(self.beam).set_diameters(6.0, 4.0) for _ in range(3)]
+        self.assertEqual(BeamBT_2DOF.get_problems(beams), [])
+        beams[0].set_diameters(6.0, -1.0)
+        beams[2].set_thicknesses(0.05, 3.0).set_mass(0.0)
+        problems = BeamBT_2DOF.get_problems(beams)
+        print(f"   EXPECTED: {problems}")
+        self.assertEqual(
+            problems,
+            [
+                "Invalid mass <= 0.0 at indexes [2]",
+                "Invalid diameter <= 0.0 at indexes [0]",
+                "Invalid thickness, expected 0.0 < thickness <= diameter / 2.0 at indexes [0, 2]",
+            ],
+        )
+
+        print("> OK")
+
+
+class TestBeamBQ_3DOF(TestCase):
+    def setUp(self) -> None:
+        self.beam: BeamBQ_3DOF_II = BeamBQ_3DOF_II(
+            *by_axial_length(BeamBQ_3DOF_II.get_dofs(), 4.0),
+            area=0.5,
+            area_moi=0.25,
+            e_modul=2.1e11,
+            mass=8.0e3,
+        )
+
+    def test_matrixes(self) -> None:
+        """
+        < Test element matrixes of quintic beam: symmetry, rigid body modes, total mass and interpolation
+        """
+        print(TestBeamBQ_3DOF.test_matrixes.__doc__.strip())  # type: ignore
+
+        K: ndarray = self.beam.get_K(1)
+        M: ndarray = self.beam.get_M()
+        self.assertEqual((6, 6), K.shape)
+        self.assertTrue(allclose(K, K.T))
+        self.assertTrue(allclose(M, M.T))
+        # translation and rotation are free of strain energy
+        rigid: ndarray = array(
+            [[1.0, 0.0, 0.0, 1.0, 0.0, 0.0], [0.0, 1.0, 0.0, 4.0, 1.0, 0.0]]
+        )
+        self.assertTrue(allclose(rigid.dot(K), 0.0, atol=1.0e-3))
+        self.assertAlmostEqual(8.0e3, rigid[0].dot(M).dot(rigid[0]), delta=1.0e-8)
+        # interpolation of the end DOF
+        self.assertTrue(
+            allclose(self.beam.get_N(0.0)[:, :3], [[1, 0, 0], [0, 1, 0], [0, 0, 1]])
+        )
+        self.assertTrue(allclose(self.beam.get_N(0.0)[:, 3:], 0.0))
+        self.assertTrue(
+            allclose(self.beam.get_N(1.0)[:, 3:], [[1, 0, 0], [0, 1, 0], [0, 0, 1]])
+        )
+        # quintic interpolation is exact for w = x^5
+        L: float = self.beam.length
+        w: ndarray = array([0.0, 0.0, 0.0, L**5, 5.0 * L**4, 20.0 * L**3])
+        self.assertTrue(
+            allclose(
+                self.beam.get_N(0.5).dot(w),
+                [(L / 2.0) ** 5, 5.0 * (L / 2.0) ** 4, 20.0 * (L / 2.0) ** 3],
+            )
+        )
+
+        print("> OK")
+
+    def test_K2(self) -> None:
+        """
+        < Test geometric stiffness of quintic beams by the buckling load of a cantilever
+        """
+        print(TestBeamBQ_3DOF.test_K2.__doc__.strip())  # type: ignore
+
+        # axial force of the magnitude of the buckling load, K2 is the difference of large matrixes
+        force_x: float = -1.0e9
+        self.beam.set_force_x(force_x)
+        model: CompBeamModel = CompBeamModel().add(self.beam).subdivided([2])
+        for idx in range(0, model.count):
+            model.get(idx).set_force_x(force_x)  # type: ignore
+        self.assertTrue(
+            allclose(self.beam.get_K(2), self.beam.get_K1() + self.beam.get_K2())
+        )
+        K1: ndarray = model.get_K(1)
+        K2: ndarray = model.get_K(2) - K1
+        # clamped: w and phi of the start node, curvature is free
+        free: ndarray = array([2, *range(3, K1.shape[0])])
+        buckling: float = -force_x * min(
+            eigvals(solve(-K2[ix_(free, free)], K1[ix_(free, free)])).real
+        )
+        expected: float = pi**2 * 2.1e11 * 0.25 / (4.0 * 4.0**2)
+        print(f"    buckling_exp={expected}, buckling_act={buckling}")
+        self.assertAlmostEqual(expected, buckling, delta=expected * 1.0e-6)
+
+        print("> OK")
+
+    def test_fails(self) -> None:
+        """
+        < Test quintic beam fails for invalid DOF and order
+        """
+        print(TestBeamBQ_3DOF.test_fails.__doc__.strip())  # type: ignore
+
+        with self.assertRaises(ValueError) as context:
+            BeamBQ_3DOF(*by_axial_length((DOF.W, DOF.PHI), 1.0), 0.5, 0.25, 2.1e11, 1.0)
+        print(f"   EXPECTED: {str(context.exception)}")
+        with self.assertRaises(ValueError) as context:
+            BeamBQ_3DOF(
+                *by_axial_length(BeamBQ_3DOF.get_dofs(), 1.0), 0.5, 0.25, 2.1e11, 1.0
+            ).get_K(2)
+        print(f"   EXPECTED: {str(context.exception)}")
+        with self.assertRaises(ValueError) as context:
+            self.beam.get_K(3)
+        print(f"   EXPECTED: {str(context.exception)}")
+
+        print("> OK")
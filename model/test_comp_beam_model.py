@@ -1,19 +1,32 @@
 # -*- coding: utf-8 -*-
 from model.test_utils import TestBaseCase
 from model.system import CompBeamModel
+from model.system import FrozenCompBeamModel
 from model.elements import Node
 from model.elements import by_axial_length
 from model.beams import BeamB_3DOF
 from model.beams import BeamB_2DOF
+from model.beams import BeamB_2DOF_II
+from model.beams import BeamBT_2DOF
+from model.beams import BeamBQ_3DOF
+from model.beams import ABeam
 from model.core import AXIS, DOF
+from model.core import DofMap
+from model.utils import expand_matrix
 from model.entry import Mass
+from model.entry import Spring
 from numpy import ndarray
 from numpy import array
+from numpy import nan
+from numpy import stack
 from typing import List
 from typing import Dict
 from typing import Any
 from data_io.json import JsonReader
 from pathlib import Path
+from copy import deepcopy
+from pickle import dumps
+from pickle import loads
 
 
 class TestCompBeamModel(TestBaseCase):
@@ -1960,3 +1973,696 @@ class TestCompBeamModel(TestBaseCase):
         self.assertEqual(masses[0].get_value(DOF.W), 939834.28934)
 
         print("> OK")
+
+    def test_subdivided(self) -> None:
+        print(f">> test {CompBeamModel.subdivided.__name__}()")
+        model: CompBeamModel = CompBeamModel().add(
+            BeamB_2DOF(
+                *by_axial_length(BeamB_2DOF.get_dofs(), 3.0),
+                e_modul=2.1e11,
+                area_moi=0.6,
+                area=0.0,
+                mass=6000.0,
+            )
+        )
+        model.append(2.0, e_modul=2.1e11, area_moi=0.4, area=0.0, mass=3000.0)
+        model.start_node.set_dof(DOF.W, 0.0)
+        model.add_mass(model.end_node, Mass().set_mass(1000.0))
+        model.add_plane_mass("side-side", model.nodes[1], Mass().set_mass(500.0))
+
+        refined: CompBeamModel = model.subdivided([3, 1])
+        self.assertEqual(refined.count, 4)
+        self.assertEqual(refined.get_coords(AXIS.X), [0.0, 1.0, 2.0, 3.0, 5.0])
+        self.assertAlmostEqual(refined.get(0).mass, 2000.0)
+        self.assertEqual(refined.get(3).area_moi, 0.4)
+        self.assertAlmostEqual(refined.mass, model.mass)
+        self.assertTrue(refined.start_node.is_set(DOF.W))
+        self.assertEqual(refined.mass_count(refined.end_node), 1)
+        self.assertEqual(refined.get_plane("side-side").mass_count, 1)
+        self.assertIn(refined.nodes[3], refined.get_plane("side-side")._masses)
+
+        with self.assertRaises(ValueError) as context:
+            model.subdivided([2])
+        print(f"   EXPECTED: {str(context.exception)}")
+        with self.assertRaises(ValueError) as context:
+            model.subdivided([2, 0])
+        print(f"   EXPECTED: {str(context.exception)}")
+        print("> OK")
+
+    def test_coarsen(self) -> None:
+        print(f">> test {CompBeamModel.coarsen.__name__}()")
+        model: CompBeamModel = CompBeamModel().add(
+            BeamB_2DOF(
+                *by_axial_length(BeamB_2DOF.get_dofs(), 1.0),
+                e_modul=2.1e11,
+                area_moi=0.6,
+                area=0.0,
+                mass=1000.0,
+            )
+        )
+        for area_moi, mass in [(0.6, 1000.0), (0.59, 1000.0), (0.6, 1000.0)] + [
+            (0.4, 600.0)
+        ] * 4:
+            model.append(1.0, e_modul=2.1e11, area_moi=area_moi, area=0.0, mass=mass)
+        model.start_node.set_dof(DOF.W, 0.0).set_dof(DOF.PHI, 0.0)
+        model.add_mass(model.nodes[6], Mass().set_mass(300.0))
+        model.add_plane_mass("side-side", model.end_node, Mass().set_mass(50.0))
+
+        # beams of equal properties only
+        exact, error = model.coarsen(0.0)
+        self.assertEqual(exact.get_coords(AXIS.X), [0.0, 2.0, 3.0, 4.0, 6.0, 8.0])
+        self.assertAlmostEqual(error, 0.0)
+
+        coarse, error = model.coarsen(0.01)
+        print(f"    beams: {coarse.count}, estimated error: {error}")
+        self.assertEqual(coarse.get_coords(AXIS.X), [0.0, 4.0, 6.0, 8.0])
+        self.assertGreater(error, 0.0)
+        self.assertLessEqual(error, 0.01)
+        self.assertAlmostEqual(coarse.mass, model.mass)
+        # equal bending flexibility
+        self.assertAlmostEqual(
+            4.0 / coarse.start_beam.area_moi,
+            sum(1.0 / model.get(idx).area_moi for idx in range(0, 4)),
+        )
+        self.assertTrue(coarse.start_node.is_set(DOF.PHI))
+        self.assertEqual(coarse.mass_count(coarse.nodes[2]), 1)
+        self.assertIn(coarse.end_node, coarse.get_plane("side-side")._masses)
+
+        with self.assertRaises(ValueError) as context:
+            model.coarsen(-0.1)
+        print(f"   EXPECTED: {str(context.exception)}")
+        with self.assertRaises(ValueError) as context:
+            CompBeamModel().coarsen(0.1)
+        print(f"   EXPECTED: {str(context.exception)}")
+        print("> OK")
+
+    def test_from_arrays(self) -> None:
+        print(f">> test {CompBeamModel.from_arrays.__name__}()")
+        lengths: List[float] = [3.0, 2.0, 2.5]
+        area_moi: List[float] = [0.6, 0.5, 0.4]
+        mass: List[float] = [6000.0, 3000.0, 2000.0]
+        expected: CompBeamModel = CompBeamModel().add(
+            BeamB_2DOF(
+                *by_axial_length(BeamB_2DOF.get_dofs(), lengths[0]),
+                area=0.0,
+                area_moi=area_moi[0],
+                e_modul=2.1e11,
+                mass=mass[0],
+            )
+        )
+        for idx in range(1, 3):
+            expected.append(
+                lengths[idx],
+                area=0.0,
+                area_moi=area_moi[idx],
+                e_modul=2.1e11,
+                mass=mass[idx],
+            )
+
+        model: CompBeamModel = CompBeamModel.from_arrays(
+            BeamB_2DOF,
+            lengths,
+            0.0,
+            array(area_moi),
+            2.1e11,
+            mass,
+            masses=[0.0, 0.0, 500.0, 1000.0],
+            springs={DOF.W: [2.0e9, 0.0, 0.0, 0.0], DOF.PHI: [8.0e11, 0.0, 0.0, 0.0]},
+            dof_values={DOF.W: [nan, 0.0, nan, nan]},
+        )
+        self.assertEqual(model.count, 3)
+        self.assertEqual(model.get_coords(AXIS.X), expected.get_coords(AXIS.X))
+        self.assertTrue((model.get_beams_K() == expected.get_beams_K()).all())
+        self.assertTrue((model.get_beams_M() == expected.get_beams_M()).all())
+        self.assertEqual(model.mass_count(), 2)
+        self.assertEqual(model.total_node_masses, 1500.0)
+        self.assertEqual(model.spring_count, 1)
+        self.assertEqual(model.get_spring(model.start_node).get_value(DOF.PHI), 8.0e11)
+        self.assertEqual(model.nodes[1].set_dofs, [DOF.W])
+        self.assertFalse(model.start_node.has_set_dofs)
+        # offset of the start node
+        shifted: CompBeamModel = CompBeamModel.from_arrays(
+            BeamB_2DOF, lengths, 0.0, 0.5, 2.1e11, 100.0, x0=10.0
+        )
+        self.assertEqual(shifted.get_coords(AXIS.X), [10.0, 13.0, 15.0, 17.5])
+
+        with self.assertRaises(ValueError) as context:
+            CompBeamModel.from_arrays(BeamB_2DOF, [], 0.0, 0.5, 2.1e11, 100.0)
+        print(f"   EXPECTED: {str(context.exception)}")
+        with self.assertRaises(ValueError) as context:
+            CompBeamModel.from_arrays(
+                BeamB_2DOF, [1.0, -1.0, 0.0], 0.0, 0.5, 2.1e11, 100.0
+            )
+        print(f"   EXPECTED: {str(context.exception)}")
+        with self.assertRaises(ValueError) as context:
+            CompBeamModel.from_arrays(BeamB_2DOF, lengths, 0.0, [0.5], 2.1e11, 100.0)
+        print(f"   EXPECTED: {str(context.exception)}")
+        with self.assertRaises(ValueError) as context:
+            CompBeamModel.from_arrays(
+                BeamB_2DOF, lengths, 0.0, 0.5, 2.1e11, 100.0, masses=[-1.0] * 4
+            )
+        print(f"   EXPECTED: {str(context.exception)}")
+        with self.assertRaises(ValueError) as context:
+            CompBeamModel.from_arrays(
+                BeamB_2DOF, lengths, 0.0, 0.5, 2.1e11, 100.0, springs={DOF.U: [1.0] * 4}
+            )
+        print(f"   EXPECTED: {str(context.exception)}")
+        with self.assertRaises(ValueError) as context:
+            CompBeamModel.from_arrays(
+                BeamB_2DOF, lengths, 0.0, 0.5, [2.1e11, -1.0, 0.0], 100.0
+            )
+        print(f"   EXPECTED: {str(context.exception)}")
+        # conditions of the beam type
+        with self.assertRaises(ValueError) as context:
+            CompBeamModel.from_arrays(BeamB_3DOF, lengths, 0.0, 0.5, 2.1e11, 100.0)
+        print(f"   EXPECTED: {str(context.exception)}")
+        self.assertEqual(
+            CompBeamModel.from_arrays(
+                BeamB_3DOF, lengths, 0.1, 0.5, 2.1e11, 100.0
+            ).count,
+            3,
+        )
+        with self.assertRaises(TypeError) as context:
+            CompBeamModel.from_arrays(Mass, lengths, 0.0, 0.5, 2.1e11, 100.0)  # type: ignore
+        print(f"   EXPECTED: {str(context.exception)}")
+        print("> OK")
+
+    def test_node_indexes(self) -> None:
+        print(f">> test node indexes of {CompBeamModel.__name__}")
+        model: CompBeamModel = CompBeamModel.from_arrays(
+            BeamB_2DOF, [1.0] * 200, 0.0, 0.5, 2.1e11, 100.0
+        )
+        model.append(1.0, area=0.0, area_moi=0.5, e_modul=2.1e11, mass=100.0)
+        for idx, node in enumerate(model.nodes):
+            self.assertEqual(model.get_node_index(node), idx)
+            model.add_mass(node, Mass().set_mass(10.0))
+        self.assertEqual(model.mass_count(), 202)
+        # translation of all nodes
+        translation: ndarray = array([1.0, 0.0] * len(model.nodes))
+        self.assertAlmostEqual(
+            translation.dot(model.get_M()).dot(translation),
+            model.mass,
+            delta=1.0e-9 * model.mass,
+        )
+
+        # copies map their own nodes
+        copied: CompBeamModel = deepcopy(model)
+        self.assertEqual(copied.get_node_index(copied.end_node), 201)
+        with self.assertRaises(KeyError) as context_key:
+            copied.get_node_index(model.end_node)
+        print(f"   EXPECTED: {str(context_key.exception)}")
+
+        with self.assertRaises(ValueError) as context:
+            model.add_mass(Node(BeamB_2DOF.get_dofs()), Mass().set_mass(1.0))
+        print(f"   EXPECTED: {str(context.exception)}")
+        with self.assertRaises(ValueError) as context:
+            model.add(model.end_beam)
+        print(f"   EXPECTED: {str(context.exception)}")
+        print("> OK")
+
+    def test_get_nodes_by_height(self) -> None:
+        print(f">> test {CompBeamModel.get_nodes_by_height.__name__}()")
+        model: CompBeamModel = CompBeamModel.from_arrays(
+            BeamB_2DOF, [0.5, 1.0, 1.5, 2.0], 0.0, 0.5, 2.1e11, 100.0
+        )
+        nodes: List[Node] = model.nodes
+        self.assertEqual(model.get_nodes_by_height([]), [])
+        found: List[Node] = model.get_nodes_by_height([5.0, 0.0, 1.50005, 3.0])
+        self.assertEqual([model.get_node_index(n) for n in found], [4, 0, 2, 3])
+        self.assertIs(model.get_node_by_height(0.5), nodes[1])
+
+        # index follows offset and added beams
+        model.offset({AXIS.X: 10.0})
+        self.assertIs(model.get_node_by_height(10.5), nodes[1])
+        model.append(1.0, area=0.0, area_moi=0.5, e_modul=2.1e11, mass=100.0)
+        self.assertIs(model.get_node_by_height(16.0), model.end_node)
+        # and nodes moved outside of the model
+        nodes[2].set_coord(AXIS.X, 12.0)
+        self.assertIs(model.get_node_by_height(12.0), nodes[2])
+
+        with self.assertRaises(ValueError) as context:
+            model.get_nodes_by_height([10.0, 10.2])
+        print(f"   EXPECTED: {str(context.exception)}")
+        with self.assertRaises(ValueError) as context:
+            model.get_node_by_height(10.2, htol=0.5)
+        print(f"   EXPECTED: {str(context.exception)}")
+        print("> OK")
+
+    def test_assign_masses(self) -> None:
+        print(f">> test {CompBeamModel.assign_masses.__name__}()")
+        model: CompBeamModel = CompBeamModel.from_arrays(
+            BeamB_2DOF, [1.0] * 100, 0.0, 0.5, 2.1e11, 100.0
+        )
+        xs: List[float] = [0.0, 0.49, 0.5, 0.51, 37.00005, 99.6, 100.0, 1.0e-5]
+        expected: List[Mass] = [Mass().set_mass(10.0 + idx) for idx in range(len(xs))]
+        reference: CompBeamModel = deepcopy(model)
+        for x, mass in zip(xs, expected):
+            reference.assign_mass(deepcopy(mass), x)
+        model.assign_masses(xs, expected)
+
+        # same nodes as assigning one by one, the lower node is preferred at the center
+        for node, ref_node in zip(model.nodes, reference.nodes):
+            self.assertEqual(
+                [m.get_value(DOF.W) for m in model._masses.get(node, [])],
+                [m.get_value(DOF.W) for m in reference._masses.get(ref_node, [])],
+            )
+        self.assertEqual(model.mass_count(model.start_node), 4)
+        self.assertEqual(model.mass_count(model.nodes[1]), 1)
+        self.assertEqual(model.mass_count(model.nodes[37]), 1)
+        self.assertEqual(model.mass_count(model.end_node), 2)
+
+        with self.assertRaises(ValueError) as context:
+            model.assign_masses([1.0, 2.0], [Mass().set_mass(1.0)])
+        print(f"   EXPECTED: {str(context.exception)}")
+        with self.assertRaises(ValueError) as context:
+            model.assign_masses([1.0, -0.1], [Mass().set_mass(1.0)] * 2)
+        print(f"   EXPECTED: {str(context.exception)}")
+        with self.assertRaises(ValueError) as context:
+            model.assign_masses([100.1], [Mass().set_mass(1.0)])
+        print(f"   EXPECTED: {str(context.exception)}")
+        print("> OK")
+
+    def test_views(self) -> None:
+        print(f">> test read-only views of {CompBeamModel.__name__}")
+        model: CompBeamModel = CompBeamModel.from_arrays(
+            BeamB_2DOF, [1.0, 2.0], 0.0, 0.5, 2.1e11, 100.0, masses=[0.0, 0.0, 50.0]
+        )
+        model.attach_spring(model.start_node, Spring().set_value(DOF.W, 1.0e8))
+        model.add_plane_mass("fore-aft", model.end_node, Mass().set_mass(20.0))
+
+        # views share the objects of the model and reflect later changes
+        self.assertIs(model.beams[1], model.end_beam)
+        masses = model.node_masses
+        self.assertIs(
+            masses[model.end_node][0], model.get_masses_of_node(model.end_node)[0]
+        )
+        model.add_mass(model.start_node, Mass().set_mass(10.0))
+        self.assertEqual(len(masses), 2)
+        self.assertIs(
+            model.springs[model.start_node], model.get_spring(model.start_node)
+        )
+        self.assertEqual(len(model.get_plane("fore-aft").node_masses), 1)
+        coords = model.end_node.coords
+        model.end_node.set_coord(AXIS.X, 3.5)
+        self.assertEqual(coords[AXIS.X], 3.5)
+
+        with self.assertRaises(TypeError) as context:
+            model.springs[model.end_node] = Spring()  # type: ignore
+        print(f"   EXPECTED: {str(context.exception)}")
+        # masses of a node cannot be extended by the view
+        extra: Mass = Mass().set_mass(1.0)
+        model.validate()
+        with self.assertRaises(TypeError) as context:
+            model.node_masses[model.end_node] = [extra]  # type: ignore
+        print(f"   EXPECTED: {str(context.exception)}")
+        with self.assertRaises(AttributeError) as context_attr:
+            model.node_masses[model.end_node].append(extra)  # type: ignore
+        print(f"   EXPECTED: {str(context_attr.exception)}")
+        with self.assertRaises(AttributeError) as context_attr:
+            model.get_plane("fore-aft").node_masses[model.end_node].append(extra)  # type: ignore
+        print(f"   EXPECTED: {str(context_attr.exception)}")
+        self.assertEqual(model.total_node_masses, 60.0)
+        self.assertTrue(model.is_validated)
+        with self.assertRaises(TypeError) as context:
+            model.end_node.coords[AXIS.X] = 0.0  # type: ignore
+        print(f"   EXPECTED: {str(context.exception)}")
+
+        # copies are isolated from the model
+        beams: List[ABeam] = model.copy_beams()
+        beams[0].set_mass(1.0)
+        self.assertEqual(model.start_beam.mass, 100.0)
+        self.assertEqual(len(model.copy_node_masses()), 2)
+        self.assertNotIn(model.start_node, model.copy_springs())
+        self.assertEqual(len(model.get_plane("fore-aft").copy_node_masses()), 1)
+        self.assertEqual(len(model.get_plane("fore-aft").copy_springs()), 0)
+        print("> OK")
+
+    def test_validate(self) -> None:
+        print(f">> test {CompBeamModel.validate.__name__}()")
+        model: CompBeamModel = CompBeamModel.from_arrays(
+            BeamB_2DOF, [1.0] * 5, 0.0, 0.5, 2.1e11, 100.0, masses=10.0
+        )
+        model.attach_plane_spring(
+            "fore-aft", model.start_node, Spring().set_value(DOF.W, 1.0e8)
+        )
+        self.assertFalse(model.is_validated)
+        self.assertTrue(model.validate().is_validated)
+        # copies keep the validation, solving and matrix assembly do not modify the model
+        self.assertTrue(deepcopy(model).is_validated)
+        model.get_K()
+        model.get_M()
+        self.assertTrue(model.is_validated)
+
+        # modifications of objects of other models or of no model keep the validation
+        copied: CompBeamModel = deepcopy(model)
+        copied.get(2).set_mass(200.0)
+        copied.nodes[3].set_coord(AXIS.X, 3.1)
+        Mass().set_mass(1.0)
+        Spring().set_value(DOF.W, 1.0)
+        self.assertTrue(model.is_validated)
+        self.assertFalse(copied.is_validated)
+
+        # any modification requires a new validation
+        for modify in (
+            lambda: model.get(2).set_mass(200.0),
+            lambda: model.nodes[3].set_coord(AXIS.X, 3.1),
+            lambda: model.start_node.set_dof(DOF.W, 0.0),
+            lambda: model.add_mass(model.end_node, Mass().set_mass(1.0)),
+            lambda: model.get_masses_of_node(model.end_node)[0].set_mass(2.0),
+            lambda: model.attach_spring(model.end_node, Spring()),
+            lambda: model.get_plane("fore-aft")
+            .springs[model.start_node]
+            .set_value(DOF.PHI, 1.0e9),
+            lambda: model.append(
+                1.0, area=0.0, area_moi=0.5, e_modul=2.1e11, mass=100.0
+            ),
+        ):
+            modify()
+            self.assertFalse(model.is_validated)
+            model.validate()
+
+        # all problems are reported at once
+        model.get(1).set_mass(0.0)
+        model.get(3).set_e_modul(-1.0).set_area_moi(float("nan"))
+        model.nodes[4].set_dof(DOF.PHI, float("inf"))
+        model.add_plane_mass("fore-aft", model.nodes[2], Mass().set_mass(float("nan")))
+        with self.assertRaises(ValueError) as context:
+            model.validate()
+        print(f"   EXPECTED: {str(context.exception)}")
+        for problem in (
+            "Invalid mass <= 0.0 at indexes [1]",
+            "Invalid elastic modulus <= 0.0 at indexes [3]",
+            "Invalid area moment of inertia <= 0.0 at indexes [3]",
+            "Invalid DOF value at indexes [4]",
+            "Invalid mass value of plane fore-aft at indexes [2]",
+        ):
+            self.assertIn(problem, str(context.exception))
+        self.assertFalse(model.is_validated)
+        # element matrixes check the beam again
+        with self.assertRaises(ValueError) as context:
+            model.get(1).get_M()
+        print(f"   EXPECTED: {str(context.exception)}")
+        with self.assertRaises(ValueError) as context:
+            CompBeamModel().validate()
+        print(f"   EXPECTED: {str(context.exception)}")
+        print("> OK")
+
+    def test_freeze(self) -> None:
+        print(f">> test {CompBeamModel.freeze.__name__}()")
+        model: CompBeamModel = CompBeamModel.from_arrays(
+            BeamB_2DOF_II,
+            [1.0, 2.0, 1.5],
+            0.0,
+            0.5,
+            2.1e11,
+            100.0,
+            masses=[0.0, 10.0, 0.0, 20.0],
+            springs={DOF.PHI: [1.0e9, 0.0, 0.0, 0.0]},
+            dof_values={DOF.W: [0.0, nan, nan, nan]},
+        )
+        model.get(1).set_force_x(-1.0e4)
+        model.add_mass(model.nodes[1], Mass().set_mmoi(DOF.PHI, 5.0))
+        model.attach_plane_spring(
+            "fore-aft", model.end_node, Spring().set_value(DOF.W, 1.0e8)
+        )
+        frozen: FrozenCompBeamModel = model.freeze()
+        self.assertTrue(model.is_validated)
+        self.assertEqual(frozen.count, 3)
+        self.assertEqual(frozen.beam_class, BeamB_2DOF_II)
+        self.assertEqual(frozen.plane_names, ["fore-aft"])
+        self.assertEqual(frozen.beam_states[1].tolist()[-1], -1.0e4)
+
+        # snapshots of equal content are equal, independent of the model
+        self.assertEqual(frozen, model.freeze())
+        self.assertEqual(hash(frozen), hash(deepcopy(model).freeze()))
+        self.assertEqual(len({frozen, model.freeze()}), 1)
+        model.get(2).set_force_x(-2.0e4)
+        self.assertNotEqual(frozen, model.freeze())
+        model.get(2).set_force_x(0.0)
+        self.assertEqual(frozen, model.freeze())
+
+        # mass and spring of equal values are different content
+        with_mass: CompBeamModel = CompBeamModel.from_arrays(
+            BeamB_3DOF, [1.0, 2.0], 0.2, 0.5, 2.1e11, 100.0
+        )
+        with_spring: CompBeamModel = deepcopy(with_mass)
+        with_mass.add_mass(with_mass.end_node, Mass().set_mass(1.0e6))
+        with_spring.attach_spring(
+            with_spring.end_node,
+            Spring().set_value(DOF.U, 1.0e6).set_value(DOF.W, 1.0e6),
+        )
+        self.assertNotEqual(with_mass.freeze(), with_spring.freeze())
+        self.assertNotEqual(
+            with_mass.freeze().content_hash, with_spring.freeze().content_hash
+        )
+
+        # immutable
+        with self.assertRaises(AttributeError) as context:
+            frozen._coords = array([])  # type: ignore
+        print(f"   EXPECTED: {str(context.exception)}")
+        with self.assertRaises(ValueError) as context:
+            frozen.coords[0, 0] = 1.0
+        print(f"   EXPECTED: {str(context.exception)}")
+
+        # matrixes are cached read-only and equal these of the model
+        for order in (1, 2):
+            K: ndarray = frozen.get_K(order)
+            self.assertIs(K, frozen.get_K(order))
+            self.assertFalse(K.flags.writeable)
+            self.assertTrue((K == model.get_K(order)).all())
+        self.assertIs(frozen.get_M(), frozen.get_M())
+        self.assertTrue((frozen.get_M() == model.get_M()).all())
+
+        # thawed model is a new model of equal content
+        thawed: CompBeamModel = frozen.thaw()
+        self.assertEqual(thawed.freeze(), frozen)
+        self.assertEqual(thawed.mass_count(), model.mass_count())
+        self.assertEqual(
+            thawed.get_plane("fore-aft").springs[thawed.end_node].get_value(DOF.W),
+            1.0e8,
+        )
+        self.assertTrue((thawed.get_M() == model.get_M()).all())
+        self.assertNotIn(model.start_node, thawed.nodes)
+
+        # beams with other values than area and area moment of inertia
+        tapered: CompBeamModel = CompBeamModel().add(
+            BeamBT_2DOF(
+                *by_axial_length(BeamBT_2DOF.get_dofs(), 2.0),
+                4.0,
+                3.0,
+                0.03,
+                0.02,
+                2.1e11,
+                100.0,
+            )
+        )
+        self.assertTrue((tapered.freeze().thaw().get_K() == tapered.get_K()).all())
+
+        with self.assertRaises(ValueError) as context:
+            CompBeamModel().freeze()
+        print(f"   EXPECTED: {str(context.exception)}")
+        print("> OK")
+
+    def test_pickle(self) -> None:
+        print(f">> test {CompBeamModel.__reduce__.__name__}()")
+        model: CompBeamModel = CompBeamModel.from_arrays(
+            BeamB_2DOF_II,
+            [1.0] * 200,
+            0.0,
+            0.5,
+            2.1e11,
+            100.0,
+            masses=[0.0] * 200 + [20.0],
+            springs={DOF.PHI: [1.0e9] + [0.0] * 200},
+            dof_values={DOF.W: [0.0] + [nan] * 200},
+        )
+        model.get(1).set_force_x(-1.0e4)
+        model.add_mass(model.end_node, Mass().set_mmoi(DOF.PHI, 5.0))
+        model.add_plane_mass("fore-aft", model.nodes[1], Mass().set_mass(1.0))
+
+        copied: CompBeamModel = loads(dumps(model))
+        self.assertEqual(copied.freeze(), model.freeze())
+        self.assertFalse(model.has_mass_at_node(copied.end_node))
+        self.assertEqual(len(copied.get_masses_of_node(copied.end_node)), 2)
+        self.assertEqual(copied.get(1).force_x, -1.0e4)  # type: ignore
+        # validation is kept, restoring does not modify the model
+        self.assertTrue(copied.is_validated)
+        self.assertTrue(model.is_validated)
+        self.assertTrue(deepcopy(model).is_validated)
+        model.get(0).set_mass(200.0)
+        self.assertFalse(loads(dumps(model)).is_validated)
+        # values are pickled as arrays packed by columns, not as objects
+        self.assertLess(
+            len(dumps(model)), len(dumps([b.get_state() for b in model.beams]))
+        )
+
+        frozen: FrozenCompBeamModel = model.freeze()
+        self.assertEqual(loads(dumps(frozen)), frozen)
+        beam: ABeam = loads(dumps(model.get(1)))
+        self.assertEqual(beam.get_state(), model.get(1).get_state())
+        self.assertTrue((beam.get_K(2) == model.get(1).get_K(2)).all())
+        self.assertTrue(loads(dumps(CompBeamModel())).is_empty)
+
+        # deep copies keep references to the objects of the model
+        mass: Mass = model.get_masses_of_node(model.end_node)[1]
+        copied, node, beam, mass = deepcopy((model, model.end_node, model.get(1), mass))
+        self.assertIs(node, copied.end_node)
+        self.assertIs(beam, copied.get(1))
+        self.assertIs(mass, copied.get_masses_of_node(node)[1])
+        self.assertEqual(copied.freeze(), model.freeze())
+        node, copied = deepcopy((model.nodes[3], model))
+        self.assertIs(node, copied.nodes[3])
+        self.assertIs(copied.get(2).node2, node)
+        self.assertEqual(copied.freeze(), model.freeze())
+        print("> OK")
+
+    def test_get_dof_map(self) -> None:
+        print(f">> test {CompBeamModel.get_dof_map.__name__}()")
+        model: CompBeamModel = CompBeamModel.from_arrays(
+            BeamB_3DOF, [1.0, 2.0, 1.5], 0.2, [0.5, 0.4, 0.3], 2.1e11, 100.0
+        )
+        dof_map: DofMap = model.get_dof_map()
+        self.assertEqual(dof_map.node_count, 4)
+        self.assertEqual(dof_map.dofs, (DOF.U, DOF.W, DOF.PHI))
+        self.assertEqual(dof_map.size, 12)
+        self.assertEqual(dof_map.get_equations(2, DOF.W), 7)
+        self.assertEqual(dof_map.get_equations([0, 3], DOF.PHI).tolist(), [2, 11])
+        self.assertEqual(dof_map.get_equations(1).tolist(), [3, 4, 5])
+        self.assertEqual(dof_map.get_element_equations()[1].tolist(), list(range(3, 9)))
+        self.assertEqual(
+            dof_map.is_dof(array([0, 4, 6]), DOF.U).tolist(), [True, False, True]
+        )
+
+        # constrained DOF are removed from the free equations
+        self.assertEqual(dof_map.free.tolist(), list(range(12)))
+        dof_map.constrain(0, DOF.W, DOF.PHI).constrain([2, 3], DOF.U)
+        self.assertTrue(dof_map.is_constrained(0, DOF.PHI))
+        self.assertFalse(dof_map.is_constrained(0, DOF.U))
+        self.assertEqual(dof_map.constrained.tolist(), [1, 2, 6, 9])
+        self.assertEqual(len(dof_map.free), 8)
+        sys_K: ndarray = model.get_K()
+        self.assertEqual(dof_map.gather(sys_K).shape, (8, 8))
+        vectors: ndarray = dof_map.scatter(array([[1.0]] * 8))
+        self.assertEqual(vectors[:, 0].tolist(), [1, 0, 0, 1, 1, 1, 0, 1, 1, 0, 1, 1])
+        self.assertEqual(
+            dof_map.get_node_values(vectors, DOF.U)[:, 0].tolist(), [1, 1, 0, 0]
+        )
+
+        # assembly adds the element matrixes of consecutive beams
+        expected: ndarray = model.get(0).get_K()
+        for beam in model.beams[1:]:
+            expected = expand_matrix(expected, beam.get_K())
+        self.assertTrue((sys_K == expected).all())
+
+        with self.assertRaises(ValueError) as context:
+            dof_map.get_dof_index(DOF.KAPPA)
+        print(f"   EXPECTED: {str(context.exception)}")
+        with self.assertRaises(IndexError) as context:
+            dof_map.constrain(4, DOF.W)
+        print(f"   EXPECTED: {str(context.exception)}")
+        with self.assertRaises(ValueError) as context:
+            dof_map.assemble(stack([model.get(0).get_K()] * 2))
+        print(f"   EXPECTED: {str(context.exception)}")
+        with self.assertRaises(ValueError) as context:
+            CompBeamModel().get_dof_map()
+        print(f"   EXPECTED: {str(context.exception)}")
+        print("> OK")
+
+    def test_get_mass_table(self) -> None:
+        print(f">> test {CompBeamModel.get_mass_table.__name__}()")
+        model: CompBeamModel = CompBeamModel.from_arrays(
+            BeamB_2DOF, [1.0, 2.0, 1.5], 0.0, 0.5, 2.1e11, 100.0
+        )
+        nodes: List[Node] = model.nodes
+        model.add_mass(nodes[2], Mass().set_mass(10.0).set_mmoi(DOF.PHI, 2.0))
+        model.add_mass(nodes[1], Mass().set_mass(5.0))
+        model.add_mass(nodes[2], Mass().set_mass(3.0))
+        model.attach_spring(nodes[0], Spring().set_value(DOF.W, 1.0e6))
+
+        # rows in order of nodes and masses, mass of DOF U is skipped
+        node_indexes, dof_indexes, values = model.get_mass_table()
+        self.assertEqual(node_indexes.tolist(), [2, 2, 2, 1])
+        self.assertEqual(dof_indexes.tolist(), [0, 1, 0, 0])
+        self.assertEqual(values.tolist(), [10.0, 2.0, 3.0, 5.0])
+        self.assertIs(model.get_mass_table()[2], values)
+        self.assertFalse(values.flags.writeable)
+        node_indexes, dof_indexes, values = model.get_spring_table()
+        self.assertEqual((node_indexes.tolist(), dof_indexes.tolist()), ([0], [0]))
+
+        # masses of the same DOF are added on the diagonal
+        sys_M: ndarray = model.get_M() - model.get_beams_M()
+        self.assertEqual(sys_M[4, 4], 13.0)
+        self.assertEqual(sys_M[5, 5], 2.0)
+        self.assertEqual(sys_M[2, 2], 5.0)
+        self.assertEqual(abs(sys_M).sum(), 20.0)
+        self.assertEqual((model.get_K() - model.get_beams_K())[0, 0], 1.0e6)
+
+        # table is rebuilt after changes of the model
+        model.add_mass(nodes[3], Mass().set_mass(1.0))
+        self.assertEqual(model.get_mass_table()[0].tolist(), [2, 2, 2, 1, 3])
+        self.assertEqual(
+            model.get_mass_table({nodes[0]: [Mass().set_mass(7.0)]})[2].tolist(), [7.0]
+        )
+        with self.assertRaises(IndexError) as context:
+            model.get_dof_map().add_to_diagonal(
+                sys_M, array([0]), array([2]), array([1.0])
+            )
+        print(f"   EXPECTED: {str(context.exception)}")
+        print("> OK")
+
+    def test_add_line_mass(self) -> None:
+        print(f">> test {CompBeamModel.add_line_mass.__name__}()")
+        lengths: List[float] = [1.0, 2.0, 1.5]
+        for beam_class in (BeamB_2DOF, BeamB_3DOF, BeamBQ_3DOF):
+            # line mass along the model is the consistent mass of the beams
+            expected: CompBeamModel = CompBeamModel.from_arrays(
+                beam_class, lengths, 0.2, 0.5, 2.1e11, [100.0, 200.0, 150.0]
+            )
+            model: CompBeamModel = CompBeamModel.from_arrays(
+                beam_class, lengths, 0.2, 0.5, 2.1e11, 1.0e-9
+            )
+            model.add_line_mass(-1.0, 1.6, 100.0).add_line_mass(1.6, 10.0, 100.0)
+            self.assertEqual(model.line_mass_count, 2)
+            sys_M: ndarray = model.get_M() - model.get_dof_map().assemble(
+                stack([b.get_M() for b in model.beams])
+            )
+            self.assertTrue(
+                abs(sys_M - expected.get_M()).max() < 1.0e-12 * expected.get_M().max()
+            )
+            self.assertAlmostEqual(model.total_line_masses, 450.0, delta=1.0e-9)
+
+        # parts of line masses on beams, parts outside the model are ignored
+        model = CompBeamModel.from_arrays(BeamB_2DOF, lengths, 0.0, 0.5, 2.1e11, 10.0)
+        model.add_line_mass(0.5, 2.0, 20.0).add_line_mass(4.0, 5.0, 1.0)
+        self.assertEqual(model.get_beams_line_mass().tolist(), [10.0, 20.0, 0.5])
+        self.assertAlmostEqual(model.mass, 60.5, delta=1.0e-12)
+        translation: ndarray = model.get_dof_map().scatter(
+            array([[1.0]] * 4), model.get_dof_map().get_equations(range(4), DOF.W)
+        )[:, 0]
+        self.assertAlmostEqual(
+            translation @ model.get_M() @ translation, 60.5, delta=1.0e-12
+        )
+
+        # line masses remain by x-coordinate
+        self.assertEqual(
+            model.subdivided([2, 1, 1]).get_beams_line_mass()[:2].tolist(), [0.0, 10.0]
+        )
+        self.assertEqual(
+            model.merged([0, 2, 3]).get_beams_line_mass().tolist(), [30.0, 0.5]
+        )
+        self.assertEqual(loads(dumps(model)).line_masses, model.line_masses)
+        self.assertTrue((model.freeze().thaw().get_M() == model.get_M()).all())
+        self.assertNotEqual(
+            model.freeze(), deepcopy(model).add_line_mass(0.0, 1.0, 1.0).freeze()
+        )
+        model.offset({AXIS.X: 1.0})
+        self.assertEqual(model.line_masses[0], (1.5, 3.0, 20.0))
+        self.assertEqual(model.get_beams_line_mass().tolist(), [10.0, 20.0, 0.5])
+
+        with self.assertRaises(ValueError) as context:
+            model.add_line_mass(2.0, 2.0, 1.0)
+        print(f"   EXPECTED: {str(context.exception)}")
+        with self.assertRaises(ValueError) as context:
+            model.add_line_mass(1.0, 2.0, -1.0)
+        print(f"   EXPECTED: {str(context.exception)}")
+        print("> OK")
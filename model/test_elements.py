@@ -3,6 +3,10 @@ from unittest import TestCase
 from model.elements import Node
 from model.elements import by_axial_length
 from model.core import AXIS, DOF
+from model.entry import Mass
+from model.entry import Spring
+from pickle import dumps
+from pickle import loads
 from typing import Tuple
 
 
@@ -78,6 +82,51 @@ class TestNode(TestCase):
 
         print("> OK")
 
+    def test_coords_stamp(self) -> None:
+        print("< test coordinate stamps of nodes")
+
+        dofs: Tuple[DOF, ...] = (DOF.W, DOF.PHI)
+        n1: Node = Node(dofs, {AXIS.X: 1.0})
+        n2: Node = Node(dofs)
+        self.assertLess(n1.coords_stamp, n2.coords_stamp)
+        self.assertEqual(n2.coords_stamp, Node.last_coords_stamp())
+
+        stamp: int = n1.coords_stamp
+        n1.set_coord(AXIS.Y, 2.0)
+        self.assertGreater(n1.coords_stamp, stamp)
+        self.assertEqual(n1.coords_stamp, Node.last_coords_stamp())
+        stamp = n2.coords_stamp
+        n2.offset({AXIS.Z: 1.0})
+        self.assertGreater(n2.coords_stamp, stamp)
+        stamp = n2.coords_stamp
+        n2.get_coord(AXIS.Z)
+        n2.set_dof(DOF.W, 0.0)
+        self.assertEqual(n2.coords_stamp, stamp)
+
+        print("> OK")
+
+    def test_pickle(self) -> None:
+        print("< test pickling of nodes, masses and springs")
+
+        node: Node = Node((DOF.W, DOF.PHI), {AXIS.X: 1.5, AXIS.Z: -0.5})
+        node.set_dof(DOF.PHI, 0.0)
+        copied: Node = loads(dumps(node))
+        self.assertEqual(copied.dofs, node.dofs)
+        self.assertEqual(dict(copied.coords), dict(node.coords))
+        self.assertEqual(copied.set_dofs, [DOF.PHI])
+        self.assertEqual(copied.get_dof(DOF.PHI), 0.0)
+        # restored node is not a move of any node
+        self.assertGreater(copied.coords_stamp, node.coords_stamp)
+
+        mass: Mass = loads(dumps(Mass().set_mass(10.0).set_mmoi(DOF.PHI, 2.0)))
+        self.assertEqual(mass.dofs, (DOF.U, DOF.W, DOF.PHI))
+        self.assertEqual(mass.get_value(DOF.PHI), 2.0)
+        spring: Spring = loads(dumps(Spring().set_value(DOF.W, 1.0e6)))
+        self.assertEqual(spring.dofs, (DOF.W,))
+        self.assertEqual(spring.get_value(DOF.W), 1.0e6)
+
+        print("> OK")
+
     def test_by_axial_length(self) -> None:
         print("< test creation of nodes by axial length")
 
@@ -2,7 +2,17 @@
 
 from numpy import ndarray
 from numpy import zeros
+from numpy import flatnonzero
+from numpy import ascontiguousarray
+from numpy import full
+from numpy import isnan
+from numpy import nan
+from typing import Any
+from typing import Optional
+from typing import List
+from typing import Sequence
 from typing import Tuple
+from weakref import WeakSet
 
 
 def expand_matrix(
@@ -62,3 +72,95 @@ def is_equal(val1: float, val2: float, atol: float = 1.0e-12) -> bool:
     :return: True if val1 == val2 considering atol
     """
     return abs(val1 - val2) <= atol
+
+
+class ModelObject:
+    """Base class of the objects of models, like nodes, beams, masses and springs.
+
+    Each modification of an object is notified to the models the object was added to, each model counts its own
+    modifications, see CompBeamModel.is_validated. Models are referenced weakly, copies and unpickled objects
+    belong to no model.
+    """
+
+    # models the object was added to, None until the object is added to any model
+    _models: Optional["WeakSet[Any]"] = None
+
+    def _add_model(self, model: Any) -> None:
+        """Adds a model the object belongs to, the model is notified of each later modification of the object.
+
+        :param model: model the object was added to, see CompBeamModel
+        :type model: Any
+        """
+        if self._models is None:
+            self._models = WeakSet()
+        self._models.add(model)
+
+    def _stamp_modification(self) -> None:
+        """Stamps a modification of the object, like coordinates or DOF of a node, properties of a beam or values
+        of a mass or spring, in all models the object belongs to.
+        """
+        if self._models is not None:
+            for model in self._models:
+                model._stamp_modification()
+
+
+def get_problems(checks: Sequence[Tuple[ndarray, str]]) -> List[str]:
+    """Returns the problems of failed checks of a sequence of items, like beams or nodes.
+
+    :param checks: invalid flag of each item and description of the problem
+    :type checks: Sequence[Tuple[ndarray, str]]
+
+    :return: description of each failed check with the indexes of the invalid items
+    :rtype: List[str]
+    """
+    return [
+        f"{message} at indexes {flatnonzero(invalid).tolist()}"
+        for invalid, message in checks
+        if invalid.any()
+    ]
+
+
+def pack_table(table: ndarray) -> Tuple[int, Tuple[Any, ...]]:
+    """Packs the columns of a table of values for compact serialization, see unpack_table().
+
+    A column of a single value (or nan only) is packed to the value, a column of at most a quarter of values
+    not nan to the row indexes and the values of these, any other column to a contiguous copy.
+
+    :param table: values [rows x columns]
+    :type table: ndarray
+
+    :return: Tuple of first is the number of rows, second is the packed columns
+    :rtype: Tuple[int, Tuple[Any, ...]]
+    """
+    rows: int = table.shape[0]
+    columns: List[Any] = []
+    for column in table.T:
+        is_value: ndarray = ~isnan(column)
+        count: int = int(is_value.sum())
+        if rows > 0 and (count == 0 or (column == column[0]).all()):
+            columns.append(float(column[0]))
+        elif 4 * count <= rows:
+            indexes: ndarray = flatnonzero(is_value)
+            columns.append((indexes, column[indexes]))
+        else:
+            columns.append(ascontiguousarray(column))
+    return rows, tuple(columns)
+
+
+def unpack_table(packed: Tuple[int, Tuple[Any, ...]]) -> ndarray:
+    """Unpacks a table of values packed by pack_table().
+
+    :param packed: number of rows and packed columns
+    :type packed: Tuple[int, Tuple[Any, ...]]
+
+    :return: values [rows x columns]
+    :rtype: ndarray
+    """
+    rows, columns = packed
+    table: ndarray = full((rows, len(columns)), nan)
+    for idx, column in enumerate(columns):
+        if isinstance(column, tuple):
+            table[column[0], idx] = column[1]
+        else:
+            table[:, idx] = column
+    return table
@@ -0,0 +1,332 @@
+# -*- coding: utf-8 -*-
+"""Adaptive refinement of models with Richardson extrapolation of frequencies."""
+from model.system import CompBeamModel
+from model.beams import ABeam
+
+from copy import deepcopy
+from typing import List
+from numpy import array
+from numpy import einsum
+from numpy import ndarray
+from numpy import outer
+from numpy import sqrt
+from numpy import stack
+from numpy import where
+
+from solve.eigen import FlexEigenSolver
+from solve.eigen import ModalSolution
+
+
+class RefinementResult:
+    """Result of an adaptive refinement, the solution of the finest model and the extrapolated frequencies."""
+
+    def __init__(
+        self,
+        solution: ModalSolution,
+        frequencies: ndarray,
+        error_estimate: ndarray,
+        target_rel_error: float,
+        dof_counts: List[int],
+    ) -> None:
+        """Creates a new refinement result.
+
+        :param solution: modal solution of the finest model
+        :type solution: ModalSolution
+        :param frequencies: extrapolated frequencies, one per mode
+        :type frequencies: ndarray
+        :param error_estimate: estimated relative error of the frequencies of the solution, one per mode
+        :type error_estimate: ndarray
+        :param target_rel_error: target relative error of the refinement
+        :type target_rel_error: float
+        :param dof_counts: number of free DOF per refinement step
+        :type dof_counts: List[int]
+        """
+        self._solution: ModalSolution = solution
+        self._frequencies: ndarray = frequencies
+        self._error_estimate: ndarray = error_estimate
+        self._target_rel_error: float = target_rel_error
+        self._dof_counts: List[int] = dof_counts
+
+    @property
+    def solution(self) -> ModalSolution:
+        """Modal solution of the finest model.
+
+        :return: modal solution
+        :rtype: ModalSolution
+        """
+        return self._solution
+
+    @property
+    def model(self) -> CompBeamModel:
+        """Finest model of the refinement.
+
+        :return: refined model
+        :rtype: CompBeamModel
+        """
+        return self._solution.model
+
+    @property
+    def frequencies(self) -> ndarray:
+        """Frequencies extrapolated to the converged limit.
+
+        :return: frequencies, one per mode
+        :rtype: ndarray
+        """
+        return self._frequencies
+
+    @property
+    def error_estimate(self) -> ndarray:
+        """Estimated relative error of the frequencies of the finest model, that is the difference to the
+        extrapolated frequencies.
+
+        :return: relative error, one per mode
+        :rtype: ndarray
+        """
+        return self._error_estimate
+
+    @property
+    def converged(self) -> bool:
+        """Whether the estimated relative error of all modes is within the target relative error.
+
+        :return: True if converged
+        :rtype: bool
+        """
+        return bool(max(self._error_estimate) <= self._target_rel_error)
+
+    @property
+    def dof_counts(self) -> List[int]:
+        """Number of free DOF per refinement step, starting with the unrefined model.
+
+        :return: number of DOF
+        :rtype: List[int]
+        """
+        return list(self._dof_counts)
+
+
+class AdaptiveRefinement:
+    """Refines the model of a solver until the estimated error of the frequencies is within a target.
+
+    Each step splits the beams with a high share of the frequency error of any mode into halves and solves
+    the refined model. The error share of a beam is estimated from its share of the modal kinetic energy
+    times (k * length)^p, with the wave number k of the mode in the beam and the convergence rate p of the
+    frequency error (4 for beams with cubic shape functions). The kinetic energy measures the inertia load
+    omega^2 * mass * w of the beam, which the shape functions of the beam do not represent exactly, whereas
+    the strain energy concentrates at clamped ends where the inertia load is small.
+
+    The frequency change by a step is the error removed from the split beams, which calibrates the error
+    remaining in the refined model. The remaining error is the error estimate and the frequencies corrected
+    by it are the extrapolated frequencies. For uniform refinement (mark_fraction = 0.0) this is Richardson extrapolation
+    f = f_fine + (f_fine - f_coarse) / (2^p - 1).
+
+    Beams are marked for refinement if their error share is at least mark_fraction of the maximum share of
+    all beams.
+    """
+
+    def __init__(self, solver: FlexEigenSolver) -> None:
+        """Creates a new adaptive refinement for the configuration and model of a solver.
+
+        :param solver: eigen solver with model and parameters
+        :type solver: FlexEigenSolver
+
+        :raises ValueError: if solver is None
+        """
+        if solver is None:
+            raise ValueError("Undefined solver")
+        self._solver: FlexEigenSolver = solver
+        self._mark_fraction: float = 0.5
+        self._max_steps: int = 6
+        self._convergence_rate: float = 4.0
+
+    @property
+    def solver(self) -> FlexEigenSolver:
+        """Eigen solver with the model to refine.
+
+        :return: eigen solver
+        :rtype: FlexEigenSolver
+        """
+        return self._solver
+
+    @property
+    def mark_fraction(self) -> float:
+        """Fraction of the maximum error share of beams to mark a beam for refinement.
+
+        The error share of a beam is its share of the error indicators of a mode, the modal kinetic energy of
+        the beam times (k * length)^p, see AdaptiveRefinement. A beam is marked if its share of any mode is at
+        least the fraction of the maximum share of all beams.
+
+        :return: mark fraction
+        :rtype: float
+        """
+        return self._mark_fraction
+
+    def set_mark_fraction(self, mark_fraction: float) -> "AdaptiveRefinement":
+        """Sets the fraction of the maximum error share of beams to mark a beam for refinement, see
+        mark_fraction.
+
+        :param mark_fraction: fraction 0.0 <= mark_fraction <= 1.0, 0.0 refines all beams
+        :type mark_fraction: float
+
+        :return: self for chaining of calls
+        :rtype: AdaptiveRefinement
+
+        :raises ValueError: if mark_fraction is out of range
+        """
+        if not 0.0 <= mark_fraction <= 1.0:
+            raise ValueError(
+                f"Invalid mark fraction {mark_fraction}, expected 0.0 .. 1.0"
+            )
+        self._mark_fraction = mark_fraction
+        return self
+
+    @property
+    def max_steps(self) -> int:
+        """Maximum number of refinement steps.
+
+        :return: maximum number of steps
+        :rtype: int
+        """
+        return self._max_steps
+
+    def set_max_steps(self, max_steps: int) -> "AdaptiveRefinement":
+        """Sets the maximum number of refinement steps.
+
+        :param max_steps: maximum number of steps >= 1
+        :type max_steps: int
+
+        :return: self for chaining of calls
+        :rtype: AdaptiveRefinement
+
+        :raises ValueError: if max_steps < 1
+        """
+        if max_steps < 1:
+            raise ValueError(f"Invalid maximum number of steps {max_steps} < 1")
+        self._max_steps = max_steps
+        return self
+
+    @property
+    def convergence_rate(self) -> float:
+        """Convergence rate p of the frequency error by halving the beam length, error ~ length^p.
+
+        :return: convergence rate
+        :rtype: float
+        """
+        return self._convergence_rate
+
+    def set_convergence_rate(self, convergence_rate: float) -> "AdaptiveRefinement":
+        """Sets the convergence rate p of the frequency error by halving the beam length, error ~ length^p.
+
+        :param convergence_rate: convergence rate > 0.0
+        :type convergence_rate: float
+
+        :return: self for chaining of calls
+        :rtype: AdaptiveRefinement
+
+        :raises ValueError: if convergence_rate <= 0.0
+        """
+        if convergence_rate <= 0.0:
+            raise ValueError(f"Invalid convergence rate {convergence_rate} <= 0.0")
+        self._convergence_rate = convergence_rate
+        return self
+
+    def refine(self, target_rel_error: float) -> RefinementResult:
+        """Refines the model of the solver until the estimated relative error of all frequencies is within the
+        target or the maximum number of steps is reached, see RefinementResult.converged.
+
+        The model of the solver is not changed.
+
+        :param target_rel_error: target relative error of the frequencies > 0.0
+        :type target_rel_error: float
+
+        :return: result of the refinement
+        :rtype: RefinementResult
+
+        :raises ValueError: if target_rel_error <= 0.0 or model of solver is not set
+        :raises SolutionError: if solution cannot be found
+        """
+        if target_rel_error <= 0.0:
+            raise ValueError(f"Invalid target relative error {target_rel_error} <= 0.0")
+        if self._solver.model is None:
+            raise ValueError("Model of solver is not set")
+
+        model: CompBeamModel = self._solver.model
+        solution: ModalSolution = deepcopy(self._solver).set_model(model).solve_modal()
+        dof_counts: List[int] = [len(solution.free)]
+        scale: float = 2.0**-self._convergence_rate
+
+        for _ in range(0, self._max_steps):
+            indicators: ndarray = self._get_error_indicators(solution)
+            marked: ndarray = self._mark(indicators)
+            model = model.subdivided([2 if mark else 1 for mark in marked])
+            fine: ModalSolution = deepcopy(self._solver).set_model(model).solve_modal()
+            dof_counts.append(len(fine.free))
+
+            # frequency change is the error removed from marked beams, calibrates remaining error
+            mode_count: int = min(solution.mode_count, fine.mode_count)
+            indicators = indicators[:, :mode_count]
+            removed: ndarray = indicators[marked].sum(axis=0) * (1.0 - scale)
+            remaining: ndarray = indicators[marked].sum(axis=0) * scale + indicators[
+                ~marked
+            ].sum(axis=0)
+            freq_fine: ndarray = fine.frequencies[:mode_count]
+            error: ndarray = (
+                (freq_fine - solution.frequencies[:mode_count])
+                * remaining
+                / where(removed > 0.0, removed, 1.0)
+            )
+            frequencies: ndarray = freq_fine + error
+            error_estimate: ndarray = abs(error) / abs(frequencies)
+            solution = fine
+            if max(error_estimate) <= target_rel_error:
+                break
+
+        return RefinementResult(
+            solution, frequencies, error_estimate, target_rel_error, dof_counts
+        )
+
+    def _get_error_indicators(self, solution: ModalSolution) -> ndarray:
+        """Returns the error indicators of the frequencies per beam and mode.
+
+        The indicator is the share of the beam of the modal kinetic energy times (k * length)^p with the wave
+        number k = (omega^2 * mass / (length * e_modul * area_moi))^(1/4) of the beam. Indicators of a mode are
+        proportional to the frequency error contributed by each beam.
+
+        :param solution: modal solution of the model to refine
+        :type solution: ModalSolution
+
+        :return: error indicators [beams x modes]
+        :rtype: ndarray
+        """
+        model: CompBeamModel = solution.model
+        beams: List[ABeam] = [model.get(idx) for idx in range(0, model.count)]
+
+        # element mode vectors [beams x element DOF x modes]
+        elem_modes: ndarray = solution.modes[
+            model.get_dof_map().get_element_equations()
+        ]
+        energy: ndarray = einsum(
+            "eim,eij,ejm->em", elem_modes, stack([b.get_M() for b in beams]), elem_modes
+        )
+        length: ndarray = array([b.length for b in beams])
+        wave_number_sq: ndarray = sqrt(
+            outer(
+                array([b.mass / (b.e_modul * b.area_moi) for b in beams]) / length,
+                abs(solution.omega_sq),
+            )
+        )
+        return (
+            energy
+            / energy.sum(axis=0)
+            * (wave_number_sq * (length**2)[:, None]) ** (self._convergence_rate / 2.0)
+        )
+
+    def _mark(self, indicators: ndarray) -> ndarray:
+        """Marks beams with an error share of any mode of at least mark_fraction of the maximum share.
+
+        :param indicators: error indicators [beams x modes]
+        :type indicators: ndarray
+
+        :return: True for each beam to refine
+        :rtype: ndarray
+        """
+        share: ndarray = (indicators / indicators.sum(axis=0)).max(axis=1)
+        return share >= self._mark_fraction * share.max()
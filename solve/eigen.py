@@ -1,19 +1,32 @@
 # -*- coding: utf-8 -*-
 """Solution of the eigenvalues, frequency and mode shapes."""
 from model.system import CompBeamModel
+from model.system import BoundaryScenario
 from model.core import DOF, AXIS
+from model.core import DOF_TYPE
+from model.core import DofMap
 from model.elements import Node
 from model.entry import Spring
 from model.utils import is_equal
 
-from typing import Optional, Tuple, List
+from typing import Any, Optional, Tuple, List, Dict, Mapping, Sequence
+from typing import Protocol
+from typing import runtime_checkable
 from numpy import array
 from numpy import ndarray
 from numpy import size
 from numpy import argsort
-from numpy import delete
 from numpy import insert
-from numpy.linalg import eig, inv
+from numpy import einsum
+from numpy import ix_
+from numpy import stack
+from numpy import array_equal
+from numpy import sqrt as sqrt_array
+from numpy import float32
+from numpy import float64
+from numpy.linalg import eig, eigh, inv, cholesky
+from numpy.linalg import solve as solve_linear
+from numpy.linalg import norm
 from pandas import DataFrame
 from math import sqrt, pi
 from copy import deepcopy
@@ -25,6 +38,157 @@ class SolutionError(ValueError):
     """Error that prevents finding the solution."""
 
 
+def rayleigh_ritz(
+    sys_K: ndarray, sys_M: ndarray, basis: ndarray
+) -> Tuple[ndarray, ndarray]:
+    """Solves the eigenvalue problem projected onto a subspace.
+
+    :param sys_K: system stiffness matrix
+    :type sys_K: ndarray
+    :param sys_M: system mass matrix
+    :type sys_M: ndarray
+    :param basis: vectors spanning the subspace, one column per vector
+    :type basis: ndarray
+
+    :return: Tuple of first is sorted eigenvalues, second is mass normalized Ritz vectors (one column per eigenvalue)
+    :rtype: Tuple[ndarray, ndarray]
+    """
+    L: ndarray = cholesky(basis.T.dot(sys_M).dot(basis))
+    L_inv: ndarray = inv(L)
+    omega_sq, vectors = eigh(L_inv.dot(basis.T.dot(sys_K).dot(basis)).dot(L_inv.T))
+    return omega_sq, basis.dot(L_inv.T.dot(vectors))
+
+
+class ModalSolution:
+    """Eigenpairs of the lowest modes of a composite beam model.
+
+    Mode vectors are the columns of modes with one row per system DOF in order of the model's nodes and their DOF.
+    Mode vectors are mass normalized and DOF removed by boundary conditions are 0.0.
+    """
+
+    def __init__(
+        self,
+        model: CompBeamModel,
+        omega_sq: ndarray,
+        modes: ndarray,
+        free: ndarray,
+        order: int = 1,
+        error_indicator: Optional[ndarray] = None,
+    ) -> None:
+        """Creates a new modal solution.
+
+        :param model: solved model, including axial forces for solutions of order 2
+        :type model: CompBeamModel
+        :param omega_sq: squared angular frequencies, one per mode
+        :type omega_sq: ndarray
+        :param modes: mass normalized mode vectors, one column per mode
+        :type modes: ndarray
+        :param free: indexes of free system DOF
+        :type free: ndarray
+        :param order: order of the theory the model was solved for
+        :type order: int
+        :param error_indicator: estimated relative error of each mode or None if not estimated
+        :type error_indicator: ndarray
+        """
+        self._model: CompBeamModel = model
+        self._omega_sq: ndarray = omega_sq
+        self._modes: ndarray = modes
+        self._free: ndarray = free
+        self._order: int = order
+        self._error_indicator: Optional[ndarray] = error_indicator
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # model is pickled as arrays, see CompBeamModel.__reduce__()
+        return ModalSolution, (
+            self._model,
+            self._omega_sq,
+            self._modes,
+            self._free,
+            self._order,
+            self._error_indicator,
+        )
+
+    @property
+    def model(self) -> CompBeamModel:
+        """Solved model.
+
+        :return: model the eigenpairs were solved for
+        :rtype: CompBeamModel
+        """
+        return self._model
+
+    @property
+    def omega_sq(self) -> ndarray:
+        """Eigenvalues, that is the squared angular frequencies.
+
+        :return: squared angular frequency of each mode
+        :rtype: ndarray
+        """
+        return self._omega_sq
+
+    @property
+    def frequencies(self) -> ndarray:
+        """Frequencies of the modes.
+
+        :return: frequency of each mode
+        :rtype: ndarray
+        """
+        return array([sqrt(o) / (2 * pi) for o in self._omega_sq])
+
+    @property
+    def modes(self) -> ndarray:
+        """Mass normalized mode vectors of all system DOF.
+
+        :return: mode vectors, one column per mode
+        :rtype: ndarray
+        """
+        return self._modes
+
+    @property
+    def free(self) -> ndarray:
+        """Indexes of free system DOF, that is DOF not removed by boundary conditions.
+
+        :return: indexes of free DOF
+        :rtype: ndarray
+        """
+        return self._free
+
+    @property
+    def order(self) -> int:
+        """Order of the theory the model was solved for: 1 or 2 (2 is with p-Delta effects).
+
+        :return: order of theory
+        :rtype: int
+        """
+        return self._order
+
+    @property
+    def error_indicator(self) -> Optional[ndarray]:
+        """A-posteriori error indicator of approximate solutions, like reduced basis solutions.
+
+        :return: estimated relative error of each mode, or None if the solution was not estimated
+        :rtype: Optional[ndarray]
+        """
+        return self._error_indicator
+
+    @property
+    def mode_count(self) -> int:
+        """Number of modes.
+
+        :return: number of modes
+        :rtype: int
+        """
+        return len(self._omega_sq)
+
+
+@runtime_checkable
+class PEigenEngine(Protocol):
+    def solve_modal(
+        self, model: CompBeamModel, order: int, mode_count: int
+    ) -> ModalSolution:
+        ...
+
+
 class FlexEigenSolver:
     """Solves eigenvalue problem for flexural modes and finds frequency and mode shapes for composite beam models.
 
@@ -40,6 +204,9 @@ class FlexEigenSolver:
         self._normalize_shapes: bool = True
         self._order: int = 1
         self._gravity: float = 9.81
+        self._precision: str = "float64"
+        self._refinement_steps: int = 4
+        self._engine: Optional[PEigenEngine] = None
 
     @property
     def model(self) -> Optional[CompBeamModel]:
@@ -115,6 +282,85 @@ class FlexEigenSolver:
         self._order = order
         return self
 
+    @property
+    def precision(self) -> str:
+        """Floating point precision of the solution of the eigenvalue problem: "float64" or "float32".
+
+        With "float32", the eigenvalue problem is solved in single precision and the eigenpairs are refined by
+        block inverse iteration and Rayleigh-Ritz projection against the double precision system matrixes.
+
+        :return: precision of the solution
+        :rtype: str
+        """
+        return self._precision
+
+    def set_precision(self, precision: str) -> "FlexEigenSolver":
+        """Sets the floating point precision of the solution of the eigenvalue problem.
+
+        :param precision: "float64" or "float32"
+        :type precision: str
+
+        :return: self for chaining of calls
+        :rtype: FlexEigenSolver
+
+        :raises ValueError: if precision is not supported
+        """
+        if precision not in ("float64", "float32"):
+            raise ValueError(
+                f'Unsupported precision "{precision}", allowed are: float64 or float32'
+            )
+        self._precision = precision
+        return self
+
+    @property
+    def refinement_steps(self) -> int:
+        """Number of double precision refinement steps for precision "float32".
+
+        :return: number of refinement steps
+        :rtype: int
+        """
+        return self._refinement_steps
+
+    def set_refinement_steps(self, steps: int) -> "FlexEigenSolver":
+        """Sets the number of double precision refinement steps for precision "float32".
+
+        :param steps: number of refinement steps
+        :type steps: int
+
+        :return: self for chaining of calls
+        :rtype: FlexEigenSolver
+
+        :raises ValueError: if steps < 0
+        """
+        if steps < 0:
+            raise ValueError(f"Invalid refinement steps {steps}, required: steps >= 0")
+        self._refinement_steps = steps
+        return self
+
+    @property
+    def engine(self) -> Optional[PEigenEngine]:
+        """Engine solving the eigenvalue problem instead of this solver, like a reduced basis engine.
+
+        :return: engine or None if the eigenvalue problem is solved by this solver
+        :rtype: Optional[PEigenEngine]
+        """
+        return self._engine
+
+    def set_engine(self, engine: Optional[PEigenEngine]) -> "FlexEigenSolver":
+        """Sets the engine solving the eigenvalue problem of the prepared model.
+
+        The engine is called with the model (deepcopied, axial forces set for order 2), the order and the
+        mode count of this solver.
+
+        :param engine: engine or None to solve by this solver
+        :type engine: Optional[PEigenEngine]
+
+        :return: self for chaining of calls
+        :rtype: FlexEigenSolver
+        """
+        self._engine = engine
+        return self
+
     @property
     def is_pref_positive_lat_msv(self) -> bool:
         """Indicates whether positive lateral (z-axis) mode shape values are preferred.
@@ -179,19 +425,23 @@ class FlexEigenSolver:
     def set_normalize_shapes(self, normalize: bool) -> "FlexEigenSolver":
         """Sets the indicator for normalization of mode shape values to 1.0.
 
+        Mode shape values that are not normalized to 1.0 are the values of mode vectors of unit length, the
+        scaling of the eigenvectors of the system.
+
         :param normalize: True to normalize mode shape values, False otherwise
         :type normalize: bool
         """
         self._normalize_shapes = normalize
         return self
 
-    def solve(self) -> Tuple[ndarray, ndarray]:
-        """Solves the eigenvalue problem and returns frequencies and mode shape values.
+    def _prepare_model(self) -> CompBeamModel:
+        """Returns a deepcopy of the model ready for assembly, that is with axial forces set for order 2.
 
-        :return: Tuple of first is frequencies, second is mode shape values
-        :rtype: Tuple[ndarray, ndarray]
+        :return: deepcopied model
+        :rtype: CompBeamModel
 
-        :raises SolutionError: if solution cannot be found
+        :raises SolutionError: if model is not set, empty or does not support the order of solution
+        :raises ValueError: if model is invalid, see CompBeamModel.validate()
         """
         if self._model is None:
             raise SolutionError(f"Unable to solve with model None")
@@ -203,12 +453,8 @@ class FlexEigenSolver:
                 f" {self._model.order} for {self._model.beam_type}"
             )
 
-        # cache properties
-        model: CompBeamModel = deepcopy(self._model)
-        dof: int = model.dof_num
-        dofs: Tuple[DOF, ...] = self._model.dofs
-        assert model.start_node is not None, "model start node is None"
-        start_node: Node = model.start_node
+        # the model set is not changed, element matrixes of the validated copy skip their checks
+        model: CompBeamModel = deepcopy(self._model).validate()
 
         if self._order == 2:
             beam_solver: CompBeamSolver = CompBeamSolver(model)
@@ -217,63 +463,422 @@ class FlexEigenSolver:
                     gravity=self.gravity, accumulate=True
                 )
             )
+        return model
+
+    @staticmethod
+    def _get_free_dofs(
+        model: CompBeamModel,
+        fixed: Sequence[Tuple[Node, DOF]] = (),
+        springs: Optional[Mapping[Node, Spring]] = None,
+    ) -> ndarray:
+        """Returns the indexes of the system DOF that are free with respect to the boundary conditions.
+
+        DOF set to 0.0 for any node of the model and fixed DOF are removed from the system, DOF set to other
+        values remain free. Each DOF of the start node must be removed or supported by a spring. Curvature DOF
+        are not supported by the boundary conditions, these are free at the start node.
+
+        :param model: model to get free DOF for
+        :type model: CompBeamModel
+        :param fixed: additional fixed DOF by node, e.g. of a BoundaryScenario
+        :type fixed: Sequence[Tuple[Node, DOF]]
+        :param springs: springs by node or None for the springs of the model
+        :type springs: Optional[Mapping[Node, Spring]]
+
+        :return: indexes of free DOF in system matrixes
+        :rtype: ndarray
+
+        :raises SolutionError: if boundary conditions are insufficient
+        """
+        if springs is None:
+            springs = model.springs
+        dof_map: DofMap = model.get_dof_map()
+        dof_tol: float = 1.0e-12
+        for idx, node in enumerate(model.nodes):
+            dof_map.constrain(
+                idx,
+                *(
+                    dof
+                    for dof in node.set_dofs
+                    if is_equal(0.0, node.get_dof(dof), dof_tol)
+                ),
+            )
+        for node, dof in fixed:
+            dof_map.constrain(model.get_node_index(node), dof)
+
+        start_spring: Optional[Spring] = springs.get(model.start_node, None)
+        for dof in model.dofs:
+            if dof.dof_type == DOF_TYPE.CURV:
+                continue
+            if not dof_map.is_constrained(0, dof) and (
+                start_spring is None or not start_spring.has_dof(dof)
+            ):
+                raise SolutionError(
+                    f"Insufficient boundary conditions, DOF {dof} of start node is neither"
+                    " set to 0.0 nor supported by a spring"
+                )
+        return dof_map.free
+
+    @staticmethod
+    def _split_axial_dofs(
+        model: CompBeamModel, free: ndarray, sys_K: ndarray, sys_M: ndarray
+    ) -> Tuple[ndarray, ndarray]:
+        """Splits the free system DOF into flexural and axial DOF, if the axial DOF are decoupled.
+
+        The axial DOF (DOF.U) are decoupled if stiffness and mass matrix have no entries coupling them with any
+        other DOF, like for BeamB_3DOF.
+
+        :param model: model
+        :type model: CompBeamModel
+        :param free: indexes of free DOF in system matrixes
+        :type free: ndarray
+        :param sys_K: system stiffness matrix
+        :type sys_K: ndarray
+        :param sys_M: system mass matrix
+        :type sys_M: ndarray
+
+        :return: Tuple of first is flexural, second is axial DOF indexes, axial is empty if not decoupled
+        :rtype: Tuple[ndarray, ndarray]
+        """
+        if DOF.U not in model.dofs:
+            return free, free[:0]
+
+        is_axial: ndarray = model.get_dof_map().is_dof(free, DOF.U)
+        flexural: ndarray = free[~is_axial]
+        axial: ndarray = free[is_axial]
+        if sys_K[ix_(flexural, axial)].any() or sys_M[ix_(flexural, axial)].any():
+            return free, free[:0]
+        return flexural, axial
+
+    def get_reduced_system(self) -> Tuple[CompBeamModel, ndarray, ndarray, ndarray]:
+        """Returns the system solved by solve_modal(), that is the prepared model and its system matrixes reduced
+        to the free DOF.
+
+        The prepared model is a deepcopy of the model with axial forces set for order 2. The free DOF are the DOF
+        not removed by the boundary conditions, without the axial DOF if these are decoupled, see solve_modal().
+
+        :return: Tuple of first is the prepared model, second is the reduced stiffness matrix, third is the
+                 reduced mass matrix, fourth is the indexes of the free DOF in the system matrixes
+        :rtype: Tuple[CompBeamModel, ndarray, ndarray, ndarray]
+
+        :raises SolutionError: if model is not set, empty, does not support the order of solution or boundary
+                               conditions are insufficient
+        :raises ValueError: if model is invalid, see CompBeamModel.validate()
+        """
+        model: CompBeamModel = self._prepare_model()
+        sys_K: ndarray = model.get_K(self._order)
+        sys_M: ndarray = model.get_M()
+        free, _ = self._split_axial_dofs(
+            model, self._get_free_dofs(model), sys_K, sys_M
+        )
+        return model, sys_K[ix_(free, free)], sys_M[ix_(free, free)], free
+
+    def solve_modal(self) -> ModalSolution:
+        """Solves the eigenvalue problem and returns the eigenpairs of the lowest modes.
+
+        In contrast to solve(), the mode vectors are not reduced to the lateral DOF and
+        they are mass normalized.
+
+        If the axial DOF are decoupled from the flexural DOF (e.g. BeamB_3DOF), only the flexural sub-system is
+        solved and the axial DOF are not included in the free DOF of the solution, see solve_axial().
+
+        DOF set to 0.0 for any node are removed from the system, each DOF of the start node must be removed or
+        supported by a spring.
+
+        :return: eigenpairs of the first mode_count modes
+        :rtype: ModalSolution
+
+        :raises SolutionError: if solution cannot be found
+        """
+        model: CompBeamModel = self._prepare_model()
+        if self._engine is not None:
+            return self._engine.solve_modal(model, self._order, self._mode_count)
+        free: ndarray = self._get_free_dofs(model)
 
         sys_M: ndarray = model.get_M()
         sys_K: ndarray = model.get_K(self._order)
+        flexural, _ = self._split_axial_dofs(model, free, sys_K, sys_M)
+        return self._solve_sub_system(model, sys_K, sys_M, flexural)
 
-        # determine boundary conditions
-        # base spring
-        start_spring: Optional[Spring] = (
-            model.get_spring(start_node) if model.has_spring(start_node) else None
-        )
-        spring_set: bool = start_spring is not None and all(
-            start_spring.has_dof(dof) for dof in dofs
+    def solve_axial(self) -> ModalSolution:
+        """Solves the eigenvalue problem of the decoupled axial DOF and returns the eigenpairs of the lowest modes.
+
+        :return: eigenpairs of the first mode_count axial modes
+        :rtype: ModalSolution
+
+        :raises SolutionError: if the model has no axial DOF, these are coupled with other DOF or solution
+                               cannot be found
+        """
+        model: CompBeamModel = self._prepare_model()
+        if DOF.U not in model.dofs:
+            raise SolutionError(f"No axial DOF for {model.beam_type}")
+        free: ndarray = self._get_free_dofs(model)
+
+        sys_M: ndarray = model.get_M()
+        sys_K: ndarray = model.get_K(self._order)
+        _, axial = self._split_axial_dofs(model, free, sys_K, sys_M)
+        if len(axial) == 0:
+            raise SolutionError(f"Axial DOF are not decoupled for {model.beam_type}")
+        return self._solve_sub_system(model, sys_K, sys_M, axial)
+
+    def solve_planes(self) -> Dict[str, ModalSolution]:
+        """Solves the eigenvalue problem for each bending plane of the model.
+
+        The system matrixes of the beams are assembled once and the springs and masses of each plane are
+        added to copies of these. For order 2 the axial forces of a plane include the weight of the masses of
+        the plane. The eigenvalue problems of all planes are solved in one batched call, if the planes have
+        equal free DOF and precision is float64.
+
+        :return: eigenpairs of the first mode_count modes by plane name, models are the models of the planes
+        :rtype: Dict[str, ModalSolution]
+
+        :raises SolutionError: if the model has no bending planes or solution cannot be found
+        """
+        model: CompBeamModel = self._prepare_model()
+        if len(model.plane_names) == 0:
+            raise SolutionError("No bending planes defined for model")
+
+        beams_M: ndarray = model.get_beams_M()
+        beams_K: ndarray = model.get_beams_K(self._order)
+
+        plane_models: List[CompBeamModel] = []
+        sys_Ks: List[ndarray] = []
+        sys_Ms: List[ndarray] = []
+        dofs: List[ndarray] = []
+        for name in model.plane_names:
+            plane_model: CompBeamModel = model.get_plane_model(name)
+            plane_K: ndarray = beams_K
+            if self._order == 2 and model.get_plane(name).mass_count > 0:
+                beam_solver: CompBeamSolver = CompBeamSolver(plane_model)
+                beam_solver.set_axial_forces(
+                    beam_solver.get_beams_normal_forces(
+                        gravity=self.gravity, accumulate=True
+                    )
+                )
+                plane_K = plane_model.get_beams_K(self._order)
+
+            sys_K: ndarray = plane_model.add_springs_to_K(plane_K.copy())
+            sys_M: ndarray = plane_model.add_masses_to_M(beams_M.copy())
+            flexural, _ = self._split_axial_dofs(
+                plane_model, self._get_free_dofs(plane_model), sys_K, sys_M
+            )
+            plane_models.append(plane_model)
+            sys_Ks.append(sys_K)
+            sys_Ms.append(sys_M)
+            dofs.append(flexural)
+
+        solutions: List[ModalSolution] = self._solve_sub_systems(
+            plane_models, sys_Ks, sys_Ms, dofs
         )
-        # 0.0 for all DOF?
-        dof_tol: float = 1.0e-12
-        start_node_dof_0: bool = all(
-            start_node.is_set(dof) and is_equal(0.0, start_node.get_dof(dof), dof_tol)
-            for dof in dofs
+        return dict(zip(model.plane_names, solutions))
+
+    def solve_scenarios(
+        self, scenarios: Sequence[BoundaryScenario]
+    ) -> Dict[str, ModalSolution]:
+        """Solves the eigenvalue problem of the model for each boundary condition scenario.
+
+        The system matrixes of the beams and the masses are assembled once, each scenario adds its springs to a
+        copy of the stiffness matrix and removes its prescribed DOF. The eigenvalue problems of all scenarios
+        are solved in one batched call, if the scenarios have equal free DOF and precision is float64.
+
+        DOF fixed by a scenario are removed from the system in addition to the boundary conditions of the
+        model, see solve_modal(). An empty scenario solves the model as it is.
+
+        :param scenarios: boundary condition scenarios with unique names
+        :type scenarios: Sequence[BoundaryScenario]
+
+        :return: eigenpairs of the first mode_count modes by scenario name, models are the models with the
+                 boundary conditions of the scenario applied
+        :rtype: Dict[str, ModalSolution]
+
+        :raises ValueError: if scenarios is empty, names are not unique or a scenario cannot be applied
+        :raises SolutionError: if boundary conditions of a scenario are insufficient or solution cannot be
+                               found
+        """
+        if len(scenarios) == 0:
+            raise ValueError("Empty sequence of scenarios")
+        names: List[str] = [scenario.name for scenario in scenarios]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Duplicate scenario names in {names}")
+
+        model: CompBeamModel = self._prepare_model()
+        beams_K: ndarray = model.get_beams_K(self._order)
+        sys_M: ndarray = model.get_M()
+
+        scenario_models: List[CompBeamModel] = []
+        sys_Ks: List[ndarray] = []
+        dofs: List[ndarray] = []
+        for scenario in scenarios:
+            fixed, scenario_springs = scenario.resolve(model)
+            springs: Dict[Node, Spring] = dict(model.springs)
+            springs.update(scenario_springs)
+
+            sys_K: ndarray = model.add_springs_to_K(beams_K.copy(), springs)
+            try:
+                free: ndarray = self._get_free_dofs(model, fixed, springs)
+            except SolutionError as e:
+                raise SolutionError(f"Scenario {scenario.name}: {str(e)}") from e
+            flexural, _ = self._split_axial_dofs(model, free, sys_K, sys_M)
+            scenario_models.append(scenario.apply(model))
+            sys_Ks.append(sys_K)
+            dofs.append(flexural)
+
+        solutions: List[ModalSolution] = self._solve_sub_systems(
+            scenario_models, sys_Ks, [sys_M] * len(scenarios), dofs
         )
-        # evaluate
-        if not spring_set and not start_node_dof_0:
-            raise SolutionError(
-                f"Insufficient boundary conditions, set spring or 0.0 for all DOF of"
-                f" start node."
-            )
+        return dict(zip(names, solutions))
+
+    def _solve_sub_system(
+        self, model: CompBeamModel, sys_K: ndarray, sys_M: ndarray, dofs: ndarray
+    ) -> ModalSolution:
+        """Solves the eigenvalue problem of the system matrixes reduced to the DOF.
 
-        # reduction of system matrixes if all start node DOF = 0.0;
-        # mode shape values will be extended by 0.0 later
-        if start_node_dof_0:
-            sys_M = delete(
-                delete(sys_M, list(range(0, dof)), 0), list(range(0, dof)), 1
+        :param model: prepared model
+        :type model: CompBeamModel
+        :param sys_K: system stiffness matrix
+        :type sys_K: ndarray
+        :param sys_M: system mass matrix
+        :type sys_M: ndarray
+        :param dofs: indexes of the DOF to solve for
+        :type dofs: ndarray
+
+        :return: eigenpairs of the first mode_count modes
+        :rtype: ModalSolution
+        """
+        return self._solve_sub_systems([model], [sys_K], [sys_M], [dofs])[0]
+
+    def _solve_sub_systems(
+        self,
+        models: List[CompBeamModel],
+        sys_Ks: List[ndarray],
+        sys_Ms: List[ndarray],
+        dofs: List[ndarray],
+    ) -> List[ModalSolution]:
+        """Solves the eigenvalue problems of system matrixes reduced to the DOF, batched if all DOF are equal.
+
+        :param models: prepared model of each system
+        :type models: List[CompBeamModel]
+        :param sys_Ks: system stiffness matrix of each system
+        :type sys_Ks: List[ndarray]
+        :param sys_Ms: system mass matrix of each system
+        :type sys_Ms: List[ndarray]
+        :param dofs: indexes of the DOF to solve for of each system
+        :type dofs: List[ndarray]
+
+        :return: eigenpairs of the first mode_count modes of each system
+        :rtype: List[ModalSolution]
+        """
+        dof_maps: List[DofMap] = [model.get_dof_map() for model in models]
+        sys_Ms = [m.gather(sys_M, d) for m, sys_M, d in zip(dof_maps, sys_Ms, dofs)]
+        sys_Ks = [m.gather(sys_K, d) for m, sys_K, d in zip(dof_maps, sys_Ks, dofs)]
+
+        # solve eigenvalue problems
+        eigenpairs: List[Tuple[ndarray, ndarray]]
+        if self._precision == "float32":
+            eigenpairs = [
+                self._solve_mixed_precision(sys_K, sys_M)
+                for sys_K, sys_M in zip(sys_Ks, sys_Ms)
+            ]
+        elif all(array_equal(d, dofs[0]) for d in dofs):
+            batch_omega_sq, batch_ms = eig(inv(stack(sys_Ms)) @ stack(sys_Ks))
+            eigenpairs = [
+                self._select_modes(omega_sq, ms, sys_M)
+                for omega_sq, ms, sys_M in zip(batch_omega_sq, batch_ms, sys_Ms)
+            ]
+        else:
+            eigenpairs = [
+                self._select_modes(*eig(inv(sys_M).dot(sys_K)), sys_M)
+                for sys_K, sys_M in zip(sys_Ks, sys_Ms)
+            ]
+
+        solutions: List[ModalSolution] = []
+        for model, dof_map, d, (omega_sq, ms) in zip(
+            models, dof_maps, dofs, eigenpairs
+        ):
+            solutions.append(
+                ModalSolution(model, omega_sq, dof_map.scatter(ms, d), d, self._order)
             )
-            sys_K = delete(
-                delete(sys_K, list(range(0, dof)), 0), list(range(0, dof)), 1
+        return solutions
+
+    def _select_modes(
+        self, omega_sq: ndarray, ms: ndarray, sys_M: ndarray
+    ) -> Tuple[ndarray, ndarray]:
+        """Selects the first mode_count eigenpairs of a general eigenvalue solution and mass normalizes them.
+
+        :param omega_sq: eigenvalues
+        :type omega_sq: ndarray
+        :param ms: eigenvectors
+        :type ms: ndarray
+        :param sys_M: system mass matrix (reduced by boundary conditions)
+        :type sys_M: ndarray
+
+        :return: Tuple of first is eigenvalues, second is mass normalized eigenvectors of the first mode_count modes
+        :rtype: Tuple[ndarray, ndarray]
+        """
+        sorted_idx: ndarray = argsort(omega_sq)[: self._mode_count]
+        omega_sq = omega_sq[sorted_idx].real
+        ms = ms[:, sorted_idx].real
+
+        # mass normalization
+        ms = ms / sqrt_array(einsum("im,ij,jm->m", ms, sys_M, ms))
+        return omega_sq, ms
+
+    def _solve_mixed_precision(
+        self, sys_K: ndarray, sys_M: ndarray
+    ) -> Tuple[ndarray, ndarray]:
+        """Solves the eigenvalue problem in single precision and refines the eigenpairs in double precision.
+
+        The single precision eigenvectors of twice the number of modes (guard vectors) are the start basis for
+        block inverse iteration against the double precision system matrixes, each step followed by a
+        Rayleigh-Ritz projection.
+
+        :param sys_K: system stiffness matrix (reduced by boundary conditions)
+        :type sys_K: ndarray
+        :param sys_M: system mass matrix (reduced by boundary conditions)
+        :type sys_M: ndarray
+
+        :return: Tuple of first is eigenvalues, second is mass normalized eigenvectors of the first mode_count modes
+        :rtype: Tuple[ndarray, ndarray]
+        """
+        block_size: int = min(2 * self._mode_count, size(sys_K, 0))
+
+        L_inv: ndarray = inv(cholesky(sys_M.astype(float32)))
+        _, vectors = eigh(L_inv.dot(sys_K.astype(float32)).dot(L_inv.T))
+        basis: ndarray = L_inv.T.dot(vectors[:, :block_size]).astype(float64)
+
+        omega_sq, basis = rayleigh_ritz(sys_K, sys_M, basis)
+        for _ in range(0, self._refinement_steps):
+            omega_sq, basis = rayleigh_ritz(
+                sys_K, sys_M, solve_linear(sys_K, sys_M.dot(basis))
             )
 
-        # solve eigenvalue problem, compute frequencies
-        omega_sq, ms = eig(inv(sys_M).dot(sys_K))
-        sorted_idx: ndarray = argsort(omega_sq)
-        freq: ndarray = array([sqrt(o.real) / (2 * pi) for o in omega_sq])
+        return omega_sq[: self._mode_count], basis[:, : self._mode_count]
+
+    def to_mode_shapes(self, solution: ModalSolution) -> Tuple[ndarray, ndarray]:
+        """Converts a modal solution to frequencies and lateral mode shape values as returned by solve().
 
-        # filter frequency and mode shapes (first specified)
-        freq = freq[sorted_idx[: self._mode_count]]
-        mode_shapes: ndarray = ms[:, sorted_idx[: self._mode_count]]
-        num_rows: int = size(mode_shapes, 0)
+        Normalization and preference of positive mode shape values are applied as set for this solver.
 
+        :param solution: modal solution
+        :type solution: ModalSolution
+
+        :return: Tuple of first is frequencies, second is mode shape values
+        :rtype: Tuple[ndarray, ndarray]
+        """
+        model: CompBeamModel = solution.model
+        freq: ndarray = solution.frequencies
+
+        # eigenvectors of unit length, unless normalized to 1.0
+        modes: ndarray = solution.modes
+        if not self._normalize_shapes:
+            modes = modes / norm(modes, axis=0)
         # interest is lateral deflection
-        lat_idx: int = model.dofs.index(DOF.W)
-        mode_shapes = mode_shapes[list(range(lat_idx, num_rows, model.dof_num)), :]
+        mode_shapes: ndarray = model.get_dof_map().get_node_values(modes, DOF.W).copy()
         # normalize
         if self._normalize_shapes:
             abs_max: float = 0.0
             for col_idx in range(0, size(mode_shapes, 1)):
                 abs_max = max(abs(mode_shapes[:, col_idx]))
                 mode_shapes[:, col_idx] = mode_shapes[:, col_idx] / abs_max
-        # adding 0.0 for base lateral deflection if all DOF of start node were set to 0.0
-        if start_node_dof_0:
-            mode_shapes = insert(mode_shapes, 0, [0.0] * len(freq), axis=0)
         # adding column of x-coordinate
         mode_shapes = insert(mode_shapes, 0, model.get_coords(AXIS.X), axis=1)
 
@@ -284,6 +889,16 @@ class FlexEigenSolver:
 
         return freq, mode_shapes
 
+    def solve(self) -> Tuple[ndarray, ndarray]:
+        """Solves the eigenvalue problem and returns frequencies and mode shape values.
+
+        :return: Tuple of first is frequencies, second is mode shape values
+        :rtype: Tuple[ndarray, ndarray]
+
+        :raises SolutionError: if solution cannot be found
+        """
+        return self.to_mode_shapes(self.solve_modal())
+
     @staticmethod
     def to_dataframe(
         freq: ndarray, mode_shapes: ndarray
@@ -4,6 +4,7 @@ from model.elements import Node
 from model.system import CompBeamModel
 from model.beams import ABeam
 from typing import List
+from typing import Tuple
 from typing import Dict
 from typing import Any
 from typing import Final
@@ -53,18 +54,18 @@ class CompBeamSolver:
         protocol_attributes: List[str] = [
             attr for attr in dir(_PSolvableBeam) if not attr.startswith("_")
         ]
-        if any(not isinstance(beam, _PSolvableBeam) for beam in model.beams):
+        beams: Tuple[ABeam, ...] = model.beams
+        if any(not isinstance(beam, _PSolvableBeam) for beam in beams):
             raise AttributeError(
                 "At least one beam is missing required attributes"
                 f" {protocol_attributes}"
             )
 
         self._model: CompBeamModel = model
-        # CompBeamModel.beams returns deepcopied list; however, the real beam-objects
-        # are required for the solver to set attributes to the actual beams of the model
+        # CompBeamModel.beams returns the actual beam-objects of the model, required for
+        # the solver to set attributes to the beams
         self._beams: Final[List[_PSolvableBeam]] = [
-            cast(_PSolvableBeam, self._model.get(idx))
-            for idx in range(0, self._model.count)
+            cast(_PSolvableBeam, beam) for beam in beams
         ]
 
     @property
@@ -115,9 +116,10 @@ class CompBeamSolver:
     def get_beams_normal_forces(
         self, gravity: float = 9.81, accumulate: bool = False
     ) -> ndarray:
-        """Returns for all beams an array of normal forces from self weight and masses applied to model nodes.
+        """Returns for all beams an array of normal forces from self weight, line masses and masses applied to
+        model nodes.
 
-        Compression forces are negative.
+        Compression forces are negative. Masses with mass moment of inertia only have no weight.
 
         :param gravity: Gravity or earth acceleration to convert mass to force
         :type gravity: float
@@ -142,9 +144,12 @@ class CompBeamSolver:
         beams_dead_weight: ndarray = self.get_beams_dead_weight(
             gravity=gravity, accumulate=False
         )
+        # line masses act in the center of their part on each beam like its self weight
+        beams_dead_weight -= self._model.get_beams_line_mass() * gravity
+        # masses with MMOI only, like MMOI of a bending plane, have no weight
         total_mass_to_nodes_defined: Dict[Node, float] = {
-            node: sum(m.get_value(DOF.U) for m in masses)
-            for node, masses in self._model._masses.items()
+            node: sum(m.get_value(DOF.U) for m in masses if DOF.U in m.dofs)
+            for node, masses in self._model.node_masses.items()
         }
         total_mass_of_model_nodes: List[float] = [
             total_mass_to_nodes_defined.get(node, 0.0) for node in self._model.nodes
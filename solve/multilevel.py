@@ -0,0 +1,314 @@
+# -*- coding: utf-8 -*-
+"""Multilevel solution of refined models starting from the modes of coarser models."""
+from model.system import CompBeamModel
+from model.beams import ABeam
+from model.core import AXIS
+from model.core import DofMap
+
+from copy import deepcopy
+from typing import List, Sequence, Tuple
+from numpy import array
+from numpy import clip
+from numpy import inf
+from numpy import ndarray
+from numpy import searchsorted
+from numpy import zeros
+from numpy.linalg import inv
+
+from solve.eigen import FlexEigenSolver
+from solve.eigen import ModalSolution
+from solve.eigen import rayleigh_ritz
+
+
+class MultilevelEigenSolver:
+    """Solves models of a refinement sequence, each starting from the modes of the previous coarser model.
+
+    The modes of the coarse model are interpolated at the nodes of the fine model by the shape functions of
+    the coarse beams (prolongation). These are the start subspace of a subspace iteration with the fine
+    system matrixes, which inverts the stiffness matrix once and then costs per iteration a product with the
+    inverse and a Rayleigh-Ritz projection of the size of the subspace. The subspace has twice the number
+    of modes (guard vectors) of the solver.
+
+    The coarsest model is solved by the solver, its configuration (order, gravity, precision, mode count)
+    applies to all levels.
+    """
+
+    def __init__(self, solver: FlexEigenSolver) -> None:
+        """Creates a new multilevel solver for the configuration of a solver.
+
+        :param solver: eigen solver with parameters, the model is only required for solve_modal()
+        :type solver: FlexEigenSolver
+
+        :raises ValueError: if solver is None
+        """
+        if solver is None:
+            raise ValueError("Undefined solver")
+        self._solver: FlexEigenSolver = solver
+        self._tol: float = 1.0e-10
+        self._max_iterations: int = 100
+        self._iterations: List[int] = []
+
+    @property
+    def solver(self) -> FlexEigenSolver:
+        """Eigen solver defining the configuration.
+
+        :return: eigen solver
+        :rtype: FlexEigenSolver
+        """
+        return self._solver
+
+    @property
+    def tol(self) -> float:
+        """Tolerance of the relative change of the eigenvalues to stop the subspace iteration.
+
+        The iteration stops as well if the change does not decrease any more, that is if it is dominated by
+        round-off of ill-conditioned system matrixes.
+
+        :return: tolerance
+        :rtype: float
+        """
+        return self._tol
+
+    def set_tol(self, tol: float) -> "MultilevelEigenSolver":
+        """Sets the tolerance of the relative change of the eigenvalues to stop the subspace iteration.
+
+        :param tol: tolerance > 0.0
+        :type tol: float
+
+        :return: self for chaining of calls
+        :rtype: MultilevelEigenSolver
+
+        :raises ValueError: if tol <= 0.0
+        """
+        if tol <= 0.0:
+            raise ValueError(f"Invalid tolerance {tol} <= 0.0")
+        self._tol = tol
+        return self
+
+    @property
+    def max_iterations(self) -> int:
+        """Maximum number of subspace iterations per level.
+
+        :return: maximum number of iterations
+        :rtype: int
+        """
+        return self._max_iterations
+
+    def set_max_iterations(self, max_iterations: int) -> "MultilevelEigenSolver":
+        """Sets the maximum number of subspace iterations per level.
+
+        :param max_iterations: maximum number of iterations >= 1
+        :type max_iterations: int
+
+        :return: self for chaining of calls
+        :rtype: MultilevelEigenSolver
+
+        :raises ValueError: if max_iterations < 1
+        """
+        if max_iterations < 1:
+            raise ValueError(
+                f"Invalid maximum number of iterations {max_iterations} < 1"
+            )
+        self._max_iterations = max_iterations
+        return self
+
+    @property
+    def iterations(self) -> List[int]:
+        """Number of subspace iterations per level of the last solution, 0 for the coarsest level.
+
+        :return: number of iterations per level
+        :rtype: List[int]
+        """
+        return list(self._iterations)
+
+    def solve_modal(self, levels: int = 3) -> ModalSolution:
+        """Solves the model of the solver by a hierarchy of coarser models.
+
+        Each coarser level removes every other node of the finer level, except nodes with DOF set or springs
+        attached, see CompBeamModel.merged().
+
+        :param levels: number of levels including the model of the solver
+        :type levels: int
+
+        :return: eigenpairs of the first mode_count modes of the model of the solver
+        :rtype: ModalSolution
+
+        :raises ValueError: if levels < 1, model of solver is not set or its beams have no shape functions
+        :raises SolutionError: if solution cannot be found
+        """
+        if levels < 1:
+            raise ValueError(f"Invalid number of levels {levels} < 1")
+        if self._solver.model is None:
+            raise ValueError("Model of solver is not set")
+        self._check_shape_functions(self._solver.model)
+
+        hierarchy: List[CompBeamModel] = [self._solver.model]
+        for _ in range(1, levels):
+            coarse: CompBeamModel = hierarchy[0].merged(
+                self._get_coarse_node_indexes(hierarchy[0])
+            )
+            if coarse.count == hierarchy[0].count:
+                break
+            hierarchy.insert(0, coarse)
+        return self.solve_levels(hierarchy)[-1]
+
+    def solve_levels(self, models: Sequence[CompBeamModel]) -> List[ModalSolution]:
+        """Solves a sequence of models from coarse to fine, each solution is the start of the next level.
+
+        :param models: models from coarse to fine
+        :type models: Sequence[CompBeamModel]
+
+        :return: eigenpairs of the first mode_count modes of each model
+        :rtype: List[ModalSolution]
+
+        :raises ValueError: if models is empty, the DOF of models differ or beams of a model except the finest
+                            have no shape functions
+        :raises SolutionError: if solution cannot be found
+        """
+        if len(models) == 0:
+            raise ValueError("Empty sequence of models")
+        for model in models[:-1]:
+            self._check_shape_functions(model)
+
+        mode_count: int = self._solver.mode_count
+        block_solver: FlexEigenSolver = (
+            deepcopy(self._solver).set_engine(None).set_mode_count(2 * mode_count)
+        )
+
+        self._iterations = []
+        solutions: List[ModalSolution] = []
+        for model in models:
+            level_solver: FlexEigenSolver = deepcopy(block_solver).set_model(model)
+            if len(solutions) == 0:
+                solutions.append(level_solver.solve_modal())
+                self._iterations.append(0)
+            else:
+                solution, iterations = self._solve_from(level_solver, solutions[-1])
+                solutions.append(solution)
+                self._iterations.append(iterations)
+
+        return [
+            ModalSolution(
+                s.model,
+                s.omega_sq[:mode_count],
+                s.modes[:, :mode_count],
+                s.free,
+                s.order,
+            )
+            for s in solutions
+        ]
+
+    @staticmethod
+    def prolongate(coarse: ModalSolution, fine: CompBeamModel) -> ndarray:
+        """Interpolates the modes of a coarse solution at the nodes of a fine model.
+
+        The shape functions of the coarse beam that contains the x-coordinate of a fine node are evaluated at
+        the node, fine nodes beyond the coarse model are evaluated by the shape functions of the start or end
+        beam.
+
+        :param coarse: modal solution of the coarse model
+        :type coarse: ModalSolution
+        :param fine: fine model
+        :type fine: CompBeamModel
+
+        :return: modes at the system DOF of the fine model [system DOF x modes]
+        :rtype: ndarray
+
+        :raises ValueError: if the DOF of the models differ or the beams of the coarse model have no shape
+                            functions
+        """
+        coarse_model: CompBeamModel = coarse.model
+        if coarse_model.dofs != fine.dofs:
+            raise ValueError(
+                f"DOF of coarse model {coarse_model.dofs} differ from fine model {fine.dofs}"
+            )
+        MultilevelEigenSolver._check_shape_functions(coarse_model)
+        fine_map: DofMap = fine.get_dof_map()
+        elem_idx: ndarray = coarse_model.get_dof_map().get_element_equations()
+        x_coarse: ndarray = array(coarse_model.get_coords(AXIS.X))
+        x_fine: ndarray = array(fine.get_coords(AXIS.X))
+        beam_idx: ndarray = clip(
+            searchsorted(x_coarse, x_fine, side="right") - 1, 0, coarse_model.count - 1
+        )
+
+        modes: ndarray = zeros((fine_map.size, coarse.mode_count))
+        for node_idx, (x, idx) in enumerate(zip(x_fine, beam_idx)):
+            beam: ABeam = coarse_model.get(int(idx))
+            xi: float = min(max((x - x_coarse[idx]) / beam.length, 0.0), 1.0)
+            modes[fine_map.get_equations(node_idx)] = beam.get_N(xi).dot(
+                coarse.modes[elem_idx[idx]]
+            )
+        return modes
+
+    @staticmethod
+    def _check_shape_functions(model: CompBeamModel) -> None:
+        """Checks that the beams of a model provide shape functions for the prolongation, see ABeam.get_N().
+
+        :param model: model to check
+        :type model: CompBeamModel
+
+        :raises ValueError: if any beam type of the model has no shape functions
+        """
+        for beam_type in {type(beam) for beam in model.beams}:
+            if not beam_type.has_shape_functions():
+                raise ValueError(
+                    f"Beam type {beam_type.__name__} has no shape functions, not supported by the multilevel"
+                    f" solution"
+                )
+
+    def _solve_from(
+        self, solver: FlexEigenSolver, coarse: ModalSolution
+    ) -> Tuple[ModalSolution, int]:
+        """Solves the model of the solver by subspace iteration starting from the prolongated coarse modes.
+
+        :param solver: solver of the level with model and block mode count
+        :type solver: FlexEigenSolver
+        :param coarse: modal solution of the coarser level
+        :type coarse: ModalSolution
+
+        :return: Tuple of first is the modal solution, second is the number of iterations
+        :rtype: Tuple[ModalSolution, int]
+        """
+        model, sys_K, sys_M, free = solver.get_reduced_system()
+
+        mode_count: int = self._solver.mode_count
+        K_inv: ndarray = inv(sys_K)
+        omega_sq, basis = rayleigh_ritz(
+            sys_K, sys_M, self.prolongate(coarse, model)[free, :]
+        )
+        iteration: int = 0
+        change_prev: float = inf
+        while iteration < self._max_iterations:
+            iteration += 1
+            omega_sq_prev: ndarray = omega_sq[:mode_count]
+            omega_sq, basis = rayleigh_ritz(sys_K, sys_M, K_inv.dot(sys_M.dot(basis)))
+            change: float = max(
+                abs(omega_sq[:mode_count] - omega_sq_prev) / omega_sq[:mode_count]
+            )
+            # stagnation: eigenvalues changes by round-off of the system matrixes only
+            if change <= self._tol or change >= change_prev:
+                break
+            change_prev = change
+
+        modes: ndarray = model.get_dof_map().scatter(basis, free)
+        return ModalSolution(model, omega_sq, modes, free, solver.order), iteration
+
+    @staticmethod
+    def _get_coarse_node_indexes(model: CompBeamModel) -> List[int]:
+        """Returns the indexes of every other node, start and end node and nodes with DOF set or springs.
+
+        :param model: model to coarsen
+        :type model: CompBeamModel
+
+        :return: ascending node indexes
+        :rtype: List[int]
+        """
+        last: int = len(model.nodes) - 1
+        return [
+            idx
+            for idx, node in enumerate(model.nodes)
+            if idx % 2 == 0
+            or idx == last
+            or node.has_set_dofs
+            or model.has_spring(node)
+        ]
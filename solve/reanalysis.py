@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+"""Re-analysis of modal solutions for modifications of few DOF, like base springs or point masses."""
+from model.system import CompBeamModel
+from model.core import DOF
+from model.core import DOF_TYPE
+from model.core import DofMap
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from numpy import array
+from numpy import ndarray
+from numpy import arange
+from numpy import cumsum
+from numpy import einsum
+from numpy import stack
+from numpy import eye
+from numpy import hstack
+from numpy import ix_
+from numpy import zeros
+from numpy.linalg import qr
+from numpy.linalg import solve as solve_linear
+
+from solve.eigen import ModalSolution
+from solve.eigen import rayleigh_ritz
+
+
+class LowRankEigenUpdate:
+    """Updates a modal solution for diagonal modifications of the stiffness and mass matrix at few DOF.
+
+    Modifications are for instance springs attached to the base node or masses added to the top node. The
+    updated eigenpairs are found in a reduced subspace spanned by the modes of the solution, one inverse
+    iteration of these modes and the static correction vectors K^-1 * e_j of each modified DOF j. The
+    projection onto the subspace is done once, each update only solves an eigenvalue problem of the size
+    2 * modes + modified DOF.
+
+    The accuracy increases with the number of modes of the solution, it is recommended to solve for more
+    modes than required.
+
+    For solutions of order 2, mass modifications of the lateral DOF (DOF.W) also change the axial forces of
+    all beams below the node by their weight. This is considered by the geometric stiffness matrixes of these
+    beams, which are projected onto the subspace as well.
+    """
+
+    def __init__(
+        self,
+        solution: ModalSolution,
+        dofs: Sequence[Tuple[int, DOF]],
+        gravity: float = 9.81,
+    ) -> None:
+        """Creates a new low rank update for a solution and the DOF to be modified.
+
+        :param solution: modal solution to update
+        :type solution: ModalSolution
+        :param dofs: DOF to be modified, each as index of the node in the model (negative values count
+                     from the end node) and the DOF of the node
+        :type dofs: Sequence[Tuple[int, DOF]]
+        :param gravity: gravity the solution was solved for, only applicable to order 2
+        :type gravity: float
+
+        :raises ValueError: if dofs is empty, a DOF is not supported by the model or the update (axial and
+                            curvature DOF) or is removed by boundary conditions
+        :raises IndexError: if a node index is out of range
+        """
+        if len(dofs) == 0:
+            raise ValueError("Empty sequence of DOF to modify")
+
+        model: CompBeamModel = solution.model
+        dof_map: DofMap = model.get_dof_map()
+        node_num: int = dof_map.node_count
+        free_idx: Dict[int, int] = {
+            int(idx): pos for pos, idx in enumerate(solution.free)
+        }
+
+        rows: List[int] = []
+        nodes: List[int] = []
+        for node_idx, dof in dofs:
+            if not -node_num <= node_idx < node_num:
+                raise IndexError(
+                    f"Node index {node_idx} out of range for {node_num} nodes"
+                )
+            if dof not in model.dofs:
+                raise ValueError(
+                    f"Unsupported DOF {dof} for model with DOF {model.dofs}"
+                )
+            # axial DOF are no part of the flexural solution, curvature has no spring or mass
+            if dof == DOF.U or dof.dof_type == DOF_TYPE.CURV:
+                raise ValueError(f"DOF type of {dof} not supported by the update")
+            sys_idx: int = int(dof_map.get_equations(node_idx % node_num, dof))
+            if sys_idx not in free_idx:
+                raise ValueError(
+                    f"DOF {dof} of node {node_idx} is removed by boundary conditions"
+                )
+            rows.append(free_idx[sys_idx])
+            nodes.append(node_idx % node_num if dof == DOF.W else -1)
+
+        sys_K: ndarray = model.get_K(solution.order)[ix_(solution.free, solution.free)]
+        sys_M: ndarray = model.get_M()[ix_(solution.free, solution.free)]
+        modes: ndarray = solution.modes[solution.free]
+
+        unit_vectors: ndarray = zeros((len(solution.free), len(rows)))
+        unit_vectors[rows, arange(len(rows))] = 1.0
+
+        basis: ndarray = hstack(
+            [modes, solve_linear(sys_K, hstack([sys_M.dot(modes), unit_vectors]))]
+        )
+        basis, _ = qr(basis)
+
+        self._solution: ModalSolution = solution
+        self._basis: ndarray = basis
+        self._K_red: ndarray = basis.T.dot(sys_K).dot(basis)
+        self._M_red: ndarray = basis.T.dot(sys_M).dot(basis)
+        self._dof_basis: ndarray = basis[rows, :]
+
+        # geometric stiffness by the weight of a mass at each node
+        self._weight_K_red: Optional[ndarray] = None
+        if solution.order == 2 and gravity > 0.0:
+            self._weight_K_red = self._get_weight_K_red(model, nodes, gravity)
+
+    @property
+    def solution(self) -> ModalSolution:
+        """Modal solution to update.
+
+        :return: modal solution
+        :rtype: ModalSolution
+        """
+        return self._solution
+
+    @property
+    def dof_num(self) -> int:
+        """Number of DOF to be modified, that is the rank of the modification.
+
+        :return: number of modified DOF
+        :rtype: int
+        """
+        return len(self._dof_basis)
+
+    def update(
+        self,
+        delta_K: Optional[Sequence[float]] = None,
+        delta_M: Optional[Sequence[float]] = None,
+    ) -> ModalSolution:
+        """Returns the modal solution for modifications of stiffness and mass at the DOF of this update.
+
+        The model of the returned solution is the model of the updated solution, that is without modifications.
+
+        :param delta_K: stiffness added to each DOF, e.g. spring values, or None for no stiffness modification
+        :type delta_K: Sequence[float]
+        :param delta_M: mass added to each DOF, e.g. mass or MMOI values, or None for no mass modification
+        :type delta_M: Sequence[float]
+
+        :return: updated modal solution with the mode count of the updated solution
+        :rtype: ModalSolution
+
+        :raises ValueError: if the number of modifications does not match the number of DOF
+        """
+        K_red: ndarray = self._K_red
+        M_red: ndarray = self._M_red
+        if delta_K is not None:
+            K_red = K_red + self._modification(delta_K)
+        if delta_M is not None:
+            M_red = M_red + self._modification(delta_M)
+            if self._weight_K_red is not None:
+                K_red = K_red + einsum(
+                    "j,jab->ab", array(delta_M, dtype=float), self._weight_K_red
+                )
+
+        omega_sq, vectors = rayleigh_ritz(K_red, M_red, eye(len(K_red)))
+        mode_count: int = self._solution.mode_count
+
+        return ModalSolution(
+            self._solution.model,
+            omega_sq[:mode_count],
+            self._solution.model.get_dof_map().scatter(
+                self._basis.dot(vectors[:, :mode_count]), self._solution.free
+            ),
+            self._solution.free,
+            self._solution.order,
+        )
+
+    def _get_weight_K_red(
+        self, model: CompBeamModel, nodes: Sequence[int], gravity: float
+    ) -> ndarray:
+        """Returns for each modified DOF the reduced geometric stiffness matrix of a unit mass at its node.
+
+        A mass at node k adds the axial force -gravity * mass to all beams 0 .. k-1.
+
+        :param model: solved model with axial forces set
+        :type model: CompBeamModel
+        :param nodes: node index of each modified DOF, or -1 if the DOF does not carry weight
+        :type nodes: Sequence[int]
+        :param gravity: gravity
+        :type gravity: float
+
+        :return: reduced geometric stiffness matrixes, one per modified DOF
+        :rtype: ndarray
+        """
+        beams: List[Any] = [model.get(idx) for idx in range(0, model.count)]
+        dof_map: DofMap = model.get_dof_map()
+        elem_basis: ndarray = dof_map.scatter(self._basis, self._solution.free)[
+            dof_map.get_element_equations()
+        ]
+
+        # geometric stiffness matrixes of unit axial force
+        K2_unit: ndarray = stack(
+            [b.get_K2() / (b.force_x if b.force_x != 0.0 else 1.0) for b in beams]
+        )
+        # accumulated from start beam: entry i is the sum of beams 0 .. i
+        K2_acc: ndarray = cumsum(
+            einsum("eia,eij,ejb->eab", elem_basis, K2_unit, elem_basis), axis=0
+        )
+
+        weight_K_red: ndarray = zeros(
+            (len(nodes), len(self._basis[0]), len(self._basis[0]))
+        )
+        for idx, node_idx in enumerate(nodes):
+            if node_idx > 0:
+                weight_K_red[idx] = -gravity * K2_acc[node_idx - 1]
+        return weight_K_red
+
+    def _modification(self, values: Sequence[float]) -> ndarray:
+        """Projects diagonal values at the modified DOF onto the reduced subspace.
+
+        :param values: value per modified DOF
+        :type values: Sequence[float]
+
+        :return: projected modification
+        :rtype: ndarray
+
+        :raises ValueError: if the number of values does not match the number of DOF
+        """
+        if len(values) != self.dof_num:
+            raise ValueError(
+                f"Invalid number of modifications {len(values)}, expected {self.dof_num}"
+            )
+        return self._dof_basis.T.dot(
+            array(values, dtype=float)[:, None] * self._dof_basis
+        )
@@ -0,0 +1,618 @@
+# -*- coding: utf-8 -*-
+"""Reduced basis engine for families of models that only differ by affine parameters."""
+
+from model.system import CompBeamModel
+from model.core import DofMap
+from model.beams import ABeam
+from model.beams import PBeamPDelta
+from model.utils import is_equal
+
+from copy import deepcopy
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from numpy import add
+from numpy import allclose
+from numpy import arange
+from numpy import argmax
+from numpy import argsort
+from numpy import array
+from numpy import array_equal
+from numpy import einsum
+from numpy import eye
+from numpy import hstack
+from numpy import maximum
+from numpy import ndarray
+from numpy import nonzero
+from numpy import ones
+from numpy import repeat
+from numpy import searchsorted
+from numpy import sqrt
+from numpy import stack
+from numpy import zeros
+from numpy.linalg import norm
+from numpy.linalg import svd
+
+from solve.eigen import FlexEigenSolver
+from solve.eigen import ModalSolution
+from solve.eigen import SolutionError
+from solve.eigen import rayleigh_ritz
+
+# parameters of a model: e_modul, mass and axial force per beam, spring and mass per system DOF
+_Parameters = Tuple[ndarray, ndarray, ndarray, ndarray, ndarray]
+
+
+class ReducedBasisEngine:
+    """Engine solving the eigenvalue problem of variants of a template model in a reduced basis.
+
+    Variants of the template may only differ by parameters that enter the system matrixes affinely:
+
+    - e_modul and mass of each beam
+    - axial forces of each beam (order 2), that is changed by masses and gravity
+    - spring values and node masses at any node and DOF
+
+    The geometry (node coordinates, area, area_moi), the beam type and the boundary conditions must be the
+    same as for the template, line masses are not supported.
+
+    In the offline stage (train) the full eigenvalue problem is solved for the training model with the
+    largest error indicator and its modes are added to the basis, until the basis size is reached or the
+    error indicator of all training models is below the tolerance. The element matrixes and the residual
+    operators are projected onto the basis per beam, in the online stage (solve_modal) the reduced system
+    matrixes are assembled by the parameters of the model and the eigenvalue problem of the size of the
+    basis is solved.
+
+    The error indicator of each mode is the relative residual ||K * x - omega^2 * M * x|| / ||omega^2 * M * x||
+    of the full system. Its square is assembled from the affine terms of K^T * K, K^T * M and M^T * M of
+    each pair of beams sharing a free DOF projected onto the basis, springs and node masses only add the
+    rows of their DOF. The online cost depends on the basis size and the number of parameters only. As the
+    square is a sum of terms that cancel, its precision is the square root of the machine precision relative
+    to the largest term, indicators of converged modes are dominated by rounding.
+    """
+
+    def __init__(self, template: CompBeamModel) -> None:
+        """Creates a new engine for variants of the template model.
+
+        :param template: template model
+        :type template: CompBeamModel
+
+        :raises ValueError: if template is None, empty or invalid, see CompBeamModel.validate()
+        :raises SolutionError: if boundary conditions of the template are insufficient
+        """
+        if template is None:
+            raise ValueError("Undefined template model")
+        if template.is_empty:
+            raise ValueError("Empty template model")
+
+        beams: List[ABeam] = [template.get(idx) for idx in range(0, template.count)]
+
+        self._template: CompBeamModel = template
+        self._geometry: ndarray = self._get_geometry(template)
+        self._fixed: ndarray = self._get_fixed(template)
+        self._free: ndarray = (
+            FlexEigenSolver().set_model(template).get_reduced_system()[3]
+        )
+        dof_map: DofMap = template.get_dof_map()
+        self._sys_size: int = dof_map.size
+        self._elem_idx: ndarray = dof_map.get_element_equations()
+        free_mask: ndarray = zeros(self._sys_size, dtype=bool)
+        free_mask[self._free] = True
+        self._free_mask: ndarray = free_mask
+        self._init_residual_rows()
+
+        # element matrixes of unit e_modul, unit mass and unit axial force
+        self._K_unit: ndarray = stack([b.get_K(1) / b.e_modul for b in beams])
+        self._M_unit: ndarray = stack([b.get_M() / b.mass for b in beams])
+        self._K2_unit: Optional[ndarray] = None
+        if isinstance(beams[0], PBeamPDelta):
+            self._K2_unit = stack(
+                [deepcopy(b).set_force_x(1.0).get_K2() for b in beams]  # type: ignore
+            )
+
+        # element matrixes of the stiffness terms [terms x beams x element DOF x element DOF]
+        self._K_terms: ndarray = (
+            self._K_unit[None]
+            if self._K2_unit is None
+            else stack([self._K_unit, self._K2_unit])
+        )
+
+        self._basis: ndarray = zeros((len(self._free), 0))
+        self._training_error: Optional[float] = None
+        self._reduced: Dict[str, Any] = {}
+
+    @property
+    def template(self) -> CompBeamModel:
+        """Template model.
+
+        :return: template model
+        :rtype: CompBeamModel
+        """
+        return self._template
+
+    @property
+    def basis_size(self) -> int:
+        """Number of basis vectors, 0 if not trained.
+
+        :return: number of basis vectors
+        :rtype: int
+        """
+        return int(self._basis.shape[1])
+
+    @property
+    def basis(self) -> ndarray:
+        """Orthonormal basis vectors of the free system DOF.
+
+        :return: basis [free DOF x basis size]
+        :rtype: ndarray
+        """
+        return self._basis
+
+    @property
+    def training_error(self) -> Optional[float]:
+        """Maximum error indicator of the training models after training.
+
+        :return: maximum error indicator or None if not trained
+        :rtype: Optional[float]
+        """
+        return self._training_error
+
+    def train(
+        self,
+        solver: FlexEigenSolver,
+        models: Sequence[CompBeamModel],
+        basis_size: int = 20,
+        tol: float = 1.0e-6,
+    ) -> "ReducedBasisEngine":
+        """Builds the basis by a greedy selection of training models.
+
+        The solver defines order, mode count and gravity, its model and engine are ignored. Each selected
+        training model adds the modes of its full solution to the basis.
+
+        :param solver: solver to prepare the training models and solve for the snapshots
+        :type solver: FlexEigenSolver
+        :param models: training models, variants of the template
+        :type models: Sequence[CompBeamModel]
+        :param basis_size: maximum number of basis vectors
+        :type basis_size: int
+        :param tol: tolerance of the error indicator to stop training
+        :type tol: float
+
+        :return: self for chaining of calls
+        :rtype: ReducedBasisEngine
+
+        :raises ValueError: if models is empty, basis_size < mode count of solver or a model is not a variant
+                            of the template
+        :raises SolutionError: if a training model cannot be solved
+        """
+        if len(models) == 0:
+            raise ValueError("Empty sequence of training models")
+        if basis_size < solver.mode_count:
+            raise ValueError(
+                f"Basis size {basis_size} less than mode count {solver.mode_count}"
+            )
+
+        training_solver: FlexEigenSolver = deepcopy(solver).set_engine(None)
+        order: int = training_solver.order
+        mode_count: int = training_solver.mode_count
+        parameters: List[_Parameters] = [
+            self._get_parameters(
+                training_solver.set_model(m).get_reduced_system()[0], order
+            )
+            for m in models
+        ]
+
+        self._set_basis(zeros((len(self._free), 0)))
+        errors: ndarray = zeros(len(parameters))
+        selected: int = 0
+        while self._extend_basis(
+            self._solve_full(parameters[selected], order, mode_count), basis_size
+        ):
+            errors = array(
+                [self._solve_reduced(p, order, mode_count)[2].max() for p in parameters]
+            )
+            selected = int(argmax(errors))
+            if errors[selected] <= tol or self.basis_size >= basis_size:
+                break
+
+        self._training_error = float(errors.max())
+        return self
+
+    def solve_modal(
+        self, model: CompBeamModel, order: int, mode_count: int
+    ) -> ModalSolution:
+        """Solves the eigenvalue problem of a variant of the template in the reduced basis.
+
+        :param model: variant of the template, axial forces must be set for order 2
+        :type model: CompBeamModel
+        :param order: order of the theory
+        :type order: int
+        :param mode_count: number of modes
+        :type mode_count: int
+
+        :return: modal solution with error indicator
+        :rtype: ModalSolution
+
+        :raises SolutionError: if the engine is not trained or mode count exceeds the basis size
+        :raises ValueError: if the model is not a variant of the template
+        """
+        if self.basis_size == 0:
+            raise SolutionError("Reduced basis engine is not trained")
+        if mode_count > self.basis_size:
+            raise SolutionError(
+                f"Mode count {mode_count} exceeds basis size {self.basis_size}"
+            )
+        omega_sq, vectors, error = self._solve_reduced(
+            self._get_parameters(model, order), order, mode_count
+        )
+        modes: ndarray = zeros((self._sys_size, mode_count))
+        modes[self._free, :] = self._basis.dot(vectors)
+        return ModalSolution(model, omega_sq, modes, self._free, order, error)
+
+    @staticmethod
+    def _get_geometry(model: CompBeamModel) -> ndarray:
+        """Returns length, area and area_moi of each beam.
+
+        :param model: model
+        :type model: CompBeamModel
+
+        :return: geometry [beams x 3]
+        :rtype: ndarray
+        """
+        return array([[b.length, b.area, b.area_moi] for b in model.beams], dtype=float)
+
+    @staticmethod
+    def _get_fixed(model: CompBeamModel) -> ndarray:
+        """Returns the DOF of each node set to 0.0, that is the DOF removed by the boundary conditions.
+
+        :param model: model
+        :type model: CompBeamModel
+
+        :return: flag of each DOF set to 0.0 [nodes x DOF]
+        :rtype: ndarray
+        """
+        return array(
+            [
+                [
+                    dof in n.set_dofs and is_equal(0.0, n.get_dof(dof))
+                    for dof in model.dofs
+                ]
+                for n in model.nodes
+            ],
+            dtype=bool,
+        )
+
+    def _get_parameters(self, model: CompBeamModel, order: int) -> _Parameters:
+        """Returns the affine parameters of a variant of the template.
+
+        :param model: variant of the template
+        :type model: CompBeamModel
+        :param order: order of the theory
+        :type order: int
+
+        :return: e_modul, mass and axial force per beam, spring and mass per system DOF
+        :rtype: _Parameters
+
+        :raises ValueError: if model is not a variant of the template or has line masses
+        """
+        if (
+            model.beam_type != self._template.beam_type
+            or model.count != self._template.count
+            or not allclose(self._get_geometry(model), self._geometry)
+        ):
+            raise ValueError("Model is not a variant of the template")
+        if not array_equal(self._get_fixed(model), self._fixed):
+            raise ValueError("Boundary conditions differ from the template")
+        if model.line_mass_count > 0:
+            raise ValueError("Line masses are not supported by the reduced basis")
+        if order == 2 and self._K2_unit is None:
+            raise SolutionError(
+                f"Order 2 is not supported by the template of {self._template.beam_type}"
+            )
+
+        beams: Tuple[ABeam, ...] = model.beams
+        e_modul: ndarray = array([b.e_modul for b in beams], dtype=float)
+        mass: ndarray = array([b.mass for b in beams], dtype=float)
+        force_x: ndarray = zeros(len(beams))
+        if order == 2:
+            force_x = array([b.force_x for b in beams], dtype=float)  # type: ignore
+
+        dof_map: DofMap = model.get_dof_map()
+        spring_diag: ndarray = dof_map.add_to_diagonal(
+            zeros(self._sys_size), *model.get_spring_table(model.springs)
+        )
+        mass_diag: ndarray = dof_map.add_to_diagonal(
+            zeros(self._sys_size), *model.get_mass_table(model.node_masses)
+        )
+
+        return e_modul, mass, force_x, spring_diag, mass_diag
+
+    def _init_residual_rows(self) -> None:
+        """Finds the element DOF of each system DOF and the pairs of beams sharing a free DOF.
+
+        Each row of the residual of a free DOF couples the element DOF of all beams at that DOF. The rows are
+        stored by pair of beams as pair index, first beam, its element DOF, second beam and its element DOF.
+        """
+        edof: int = self._elem_idx.shape[1]
+        equations: ndarray = self._elem_idx.ravel()
+        order: ndarray = argsort(equations, kind="stable")
+        # element DOF of system DOF i are _dof_elems[:, _dof_ptr[i]:_dof_ptr[i + 1]]
+        self._dof_ptr: ndarray = searchsorted(
+            equations[order], arange(self._sys_size + 1)
+        )
+        self._dof_elems: ndarray = array(divmod(order, edof))
+
+        pairs: Dict[Tuple[int, int], int] = {}
+        rows: List[Tuple[int, int, int, int, int]] = []
+        for eq in self._free.tolist():
+            elems: List[Tuple[int, int]] = list(
+                zip(
+                    *self._dof_elems[
+                        :, self._dof_ptr[eq] : self._dof_ptr[eq + 1]
+                    ].tolist()
+                )
+            )
+            for beam_1, elem_dof_1 in elems:
+                for beam_2, elem_dof_2 in elems:
+                    pair: int = pairs.setdefault((beam_1, beam_2), len(pairs))
+                    rows.append((pair, beam_1, elem_dof_1, beam_2, elem_dof_2))
+        self._pairs: ndarray = array(list(pairs), dtype=int).reshape(-1, 2)
+        self._residual_rows: ndarray = array(rows, dtype=int).reshape(-1, 5)
+
+    def _set_basis(self, basis: ndarray) -> None:
+        """Sets the basis and projects the element matrixes and the residual operators onto the basis.
+
+        :param basis: orthonormal basis [free DOF x basis size]
+        :type basis: ndarray
+        """
+        self._basis = basis
+        size: int = len(basis[0])
+        sys_basis: ndarray = zeros((self._sys_size, size))
+        sys_basis[self._free, :] = basis
+        # element basis [beams x element DOF x basis size]
+        elem_basis: ndarray = sys_basis[self._elem_idx]
+
+        def project(elem_matrixes: ndarray) -> ndarray:
+            return einsum("eia,keij,ejb->keab", elem_basis, elem_matrixes, elem_basis)
+
+        def apply(elem_matrixes: ndarray) -> ndarray:
+            # rows of DOF that are not free are no part of the residual
+            return einsum("keij,ejb->keib", elem_matrixes, elem_basis) * (
+                self._free_mask[self._elem_idx][None, :, :, None]
+            )
+
+        pair, beam_1, elem_dof_1, beam_2, elem_dof_2 = self._residual_rows.T
+
+        def gram(applied_1: ndarray, applied_2: ndarray) -> ndarray:
+            # [pairs x terms x terms x basis size x basis size]
+            products: ndarray = zeros(
+                (len(self._pairs), len(applied_1), len(applied_2), size, size)
+            )
+            add.at(
+                products,
+                pair,
+                einsum(
+                    "kra,lrb->rklab",
+                    applied_1[:, beam_1, elem_dof_1],
+                    applied_2[:, beam_2, elem_dof_2],
+                ),
+            )
+            return products
+
+        M_terms: ndarray = self._M_unit[None]
+        K_basis: ndarray = apply(self._K_terms)
+        M_basis: ndarray = apply(M_terms)
+        self._reduced = {
+            "sys_basis": sys_basis,
+            "K": project(self._K_terms),
+            "M": project(M_terms),
+            "K_basis": K_basis,
+            "M_basis": M_basis,
+            "KK": gram(K_basis, K_basis),
+            "KM": gram(K_basis, M_basis),
+            "MM": gram(M_basis, M_basis),
+        }
+
+    def _extend_basis(self, snapshot: ndarray, basis_size: int) -> bool:
+        """Extends the basis by the part of the snapshot vectors orthogonal to the basis.
+
+        :param snapshot: vectors of free DOF [free DOF x vectors]
+        :type snapshot: ndarray
+        :param basis_size: maximum number of basis vectors
+        :type basis_size: int
+
+        :return: True if the basis was extended, False if snapshot is in the span of the basis
+        :rtype: bool
+        """
+        ortho: ndarray = snapshot
+        # orthogonalize twice for numerical stability
+        for _ in range(2):
+            ortho = ortho - self._basis.dot(self._basis.T.dot(ortho))
+        vectors, values, _ = svd(ortho, full_matrices=False)
+        rank: int = int((values > 1.0e-10 * norm(snapshot, axis=0).max()).sum())
+        rank = min(rank, basis_size - self.basis_size)
+        if rank == 0:
+            return False
+        self._set_basis(hstack([self._basis, vectors[:, :rank]]))
+        return True
+
+    def _assemble_full(
+        self, parameters: _Parameters, order: int
+    ) -> Tuple[ndarray, ndarray]:
+        """Assembles the system matrixes of the free DOF.
+
+        :param parameters: parameters of the model
+        :type parameters: _Parameters
+        :param order: order of the theory
+        :type order: int
+
+        :return: Tuple of first is stiffness, second is mass matrix
+        :rtype: Tuple[ndarray, ndarray]
+        """
+        e_modul, mass, force_x, spring_diag, mass_diag = parameters
+        elem_K: ndarray = e_modul[:, None, None] * self._K_unit
+        if order == 2:
+            elem_K = elem_K + force_x[:, None, None] * self._K2_unit  # type: ignore
+        elem_M: ndarray = mass[:, None, None] * self._M_unit
+
+        rows: ndarray = self._elem_idx[:, :, None]
+        cols: ndarray = self._elem_idx[:, None, :]
+        sys_K: ndarray = zeros((self._sys_size, self._sys_size))
+        sys_M: ndarray = zeros((self._sys_size, self._sys_size))
+        add.at(sys_K, (rows, cols), elem_K)
+        add.at(sys_M, (rows, cols), elem_M)
+        diag: ndarray = arange(self._sys_size)
+        sys_K[diag, diag] += spring_diag
+        sys_M[diag, diag] += mass_diag
+        return sys_K[self._free][:, self._free], sys_M[self._free][:, self._free]
+
+    def _solve_full(
+        self, parameters: _Parameters, order: int, mode_count: int
+    ) -> ndarray:
+        """Solves the full eigenvalue problem for the snapshot modes.
+
+        :param parameters: parameters of the model
+        :type parameters: _Parameters
+        :param order: order of the theory
+        :type order: int
+        :param mode_count: number of modes
+        :type mode_count: int
+
+        :return: modes of the free DOF [free DOF x mode count]
+        :rtype: ndarray
+
+        :raises SolutionError: if the mass matrix is not positive definite
+        """
+        sys_K, sys_M = self._assemble_full(parameters, order)
+        try:
+            _, vectors = rayleigh_ritz(sys_K, sys_M, eye(len(sys_K)))
+        except Exception as ex:
+            raise SolutionError(f"Unable to solve snapshot: {ex}") from ex
+        return vectors[:, :mode_count]
+
+    def _solve_reduced(
+        self, parameters: _Parameters, order: int, mode_count: int
+    ) -> Tuple[ndarray, ndarray, ndarray]:
+        """Solves the eigenvalue problem in the reduced basis and estimates the error of each mode.
+
+        :param parameters: parameters of the model
+        :type parameters: _Parameters
+        :param order: order of the theory
+        :type order: int
+        :param mode_count: number of modes
+        :type mode_count: int
+
+        :return: Tuple of omega^2, reduced mode vectors [basis size x modes] and error indicator
+        :rtype: Tuple[ndarray, ndarray, ndarray]
+        """
+        e_modul, mass, force_x, spring_diag, mass_diag = parameters
+        reduced: Dict[str, Any] = self._reduced
+        sys_basis: ndarray = reduced["sys_basis"]
+        # coefficients of the stiffness and mass terms [terms x beams]
+        coeffs_K: ndarray = (
+            e_modul[None] if self._K2_unit is None else stack([e_modul, force_x])
+        )
+        coeffs_M: ndarray = mass[None]
+
+        K_red: ndarray = einsum("ke,keab->ab", coeffs_K, reduced["K"])
+        M_red: ndarray = einsum("ke,keab->ab", coeffs_M, reduced["M"])
+        spring_idx: ndarray = nonzero(spring_diag)[0]
+        K_red += sys_basis[spring_idx].T.dot(
+            spring_diag[spring_idx, None] * sys_basis[spring_idx]
+        )
+        mass_idx: ndarray = nonzero(mass_diag)[0]
+        M_red += sys_basis[mass_idx].T.dot(
+            mass_diag[mass_idx, None] * sys_basis[mass_idx]
+        )
+
+        omega_sq, vectors = rayleigh_ritz(K_red, M_red, eye(len(K_red)))
+        omega_sq = omega_sq[:mode_count]
+        vectors = vectors[:, :mode_count]
+
+        def residual_norm(scale_K: ndarray, scale_M: ndarray) -> ndarray:
+            return self._get_residual_norm(
+                coeffs_K, coeffs_M, spring_diag, mass_diag, vectors, scale_K, scale_M
+            )
+
+        error: ndarray = residual_norm(ones(mode_count), omega_sq) / residual_norm(
+            zeros(mode_count), omega_sq
+        )
+        return omega_sq, vectors, error
+
+    def _get_residual_norm(
+        self,
+        coeffs_K: ndarray,
+        coeffs_M: ndarray,
+        spring_diag: ndarray,
+        mass_diag: ndarray,
+        vectors: ndarray,
+        scale_K: ndarray,
+        scale_M: ndarray,
+    ) -> ndarray:
+        """Returns the norm ||scale_K * K * x - scale_M * M * x|| of the free DOF for each mode x = basis * y.
+
+        :param coeffs_K: coefficients of the stiffness terms [terms x beams]
+        :type coeffs_K: ndarray
+        :param coeffs_M: coefficients of the mass terms [terms x beams]
+        :type coeffs_M: ndarray
+        :param spring_diag: spring per system DOF
+        :type spring_diag: ndarray
+        :param mass_diag: mass per system DOF
+        :type mass_diag: ndarray
+        :param vectors: reduced mode vectors y [basis size x modes]
+        :type vectors: ndarray
+        :param scale_K: scale of the stiffness per mode
+        :type scale_K: ndarray
+        :param scale_M: scale of the mass per mode
+        :type scale_M: ndarray
+
+        :return: norm of the residual per mode
+        :rtype: ndarray
+        """
+        reduced: Dict[str, Any] = self._reduced
+        beam_1, beam_2 = self._pairs.T
+
+        def form(products: ndarray, coeffs_1: ndarray, coeffs_2: ndarray) -> ndarray:
+            operator: ndarray = einsum(
+                "kp,lp,pklab->ab", coeffs_1[:, beam_1], coeffs_2[:, beam_2], products
+            )
+            return einsum("am,ab,bm->m", vectors, operator, vectors)
+
+        # beams
+        norm_sq: ndarray = (
+            scale_K**2 * form(reduced["KK"], coeffs_K, coeffs_K)
+            - 2.0 * scale_K * scale_M * form(reduced["KM"], coeffs_K, coeffs_M)
+            + scale_M**2 * form(reduced["MM"], coeffs_M, coeffs_M)
+        )
+
+        # springs and node masses at free DOF, rows of their DOF
+        idx: ndarray = nonzero(
+            ((spring_diag != 0.0) | (mass_diag != 0.0)) & self._free_mask
+        )[0]
+        if len(idx) > 0:
+            counts: ndarray = self._dof_ptr[idx + 1] - self._dof_ptr[idx]
+            cols: ndarray = hstack(
+                [arange(self._dof_ptr[i], self._dof_ptr[i + 1]) for i in idx]
+            )
+            beams, elem_dofs = self._dof_elems[:, cols]
+            rows: ndarray = repeat(arange(len(idx)), counts)
+
+            def beam_rows(applied: ndarray, coeffs: ndarray) -> ndarray:
+                values: ndarray = zeros((len(idx), len(scale_K)))
+                add.at(
+                    values,
+                    rows,
+                    einsum(
+                        "kr,krb,bm->rm",
+                        coeffs[:, beams],
+                        applied[:, beams, elem_dofs],
+                        vectors,
+                    ),
+                )
+                return values
+
+            residual: ndarray = scale_K * beam_rows(
+                reduced["K_basis"], coeffs_K
+            ) - scale_M * beam_rows(reduced["M_basis"], coeffs_M)
+            diag: ndarray = (
+                scale_K * spring_diag[idx, None] - scale_M * mass_diag[idx, None]
+            ) * reduced["sys_basis"][idx].dot(vectors)
+            norm_sq += (2.0 * residual * diag + diag**2).sum(axis=0)
+
+        return sqrt(maximum(norm_sq, 0.0))
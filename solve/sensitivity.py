@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""Analytical sensitivities of frequencies with respect to beam and entry properties."""
+from model.system import CompBeamModel
+from model.core import DOF
+from model.core import DOF_TYPE
+from model.beams import ABeam
+
+from typing import Dict, List, Tuple
+from numpy import array
+from numpy import ndarray
+from numpy import cumsum
+from numpy import einsum
+from numpy import outer
+from numpy import stack
+from numpy import where
+from math import pi
+
+from solve.eigen import FlexEigenSolver
+from solve.eigen import ModalSolution
+
+
+class FlexEigenSensitivity:
+    """Derivatives of the frequencies found by a FlexEigenSolver with respect to the model properties.
+
+    The derivatives are computed from the mass normalized mode vectors phi of the solution and the element
+    matrices of the beams by d(omega^2)/dp = phi^T (dK/dp - omega^2 * dM/dp) phi, which is evaluated for all
+    beams at once. For solutions of order 2, the change of axial forces by mass is considered.
+
+    Derivatives are returned by name:
+
+    - "e_modul", "area_moi", "mass": derivatives per beam, shape [beams x modes]
+    - "spring": derivatives by spring values per node and DOF, shape [nodes x DOF x modes]
+    - "node_mass": derivatives by the mass value of node masses, shape [nodes x modes]
+    - "node_mmoi": derivatives by the mass moment of inertia of node masses, shape [nodes x modes]
+
+    Derivatives for springs and node masses are provided for every node, regardless whether a spring or mass
+    is attached to the node.
+    """
+
+    def __init__(self, solver: FlexEigenSolver) -> None:
+        """Creates new sensitivity object for the configuration of a solver.
+
+        :param solver: eigen solver with model and parameters
+        :type solver: FlexEigenSolver
+
+        :raises ValueError: if solver is None
+        """
+        if solver is None:
+            raise ValueError("Undefined solver")
+        self._solver: FlexEigenSolver = solver
+
+    @property
+    def solver(self) -> FlexEigenSolver:
+        """Eigen solver for which to compute sensitivities.
+
+        :return: eigen solver
+        :rtype: FlexEigenSolver
+        """
+        return self._solver
+
+    def solve(self) -> Tuple[ndarray, Dict[str, ndarray]]:
+        """Solves the eigenvalue problem and returns frequencies and their derivatives.
+
+        :return: Tuple of first is frequencies, second is derivatives of frequencies by name
+        :rtype: Tuple[ndarray, Dict[str, ndarray]]
+
+        :raises SolutionError: if solution cannot be found
+        """
+        solution: ModalSolution = self._solver.solve_modal()
+        return solution.frequencies, self.get_derivatives(solution)
+
+    def get_derivatives(self, solution: ModalSolution) -> Dict[str, ndarray]:
+        """Computes the derivatives of the frequencies of a modal solution.
+
+        :param solution: modal solution found by the solver of this object
+        :type solution: ModalSolution
+
+        :return: derivatives of frequencies by name
+        :rtype: Dict[str, ndarray]
+        """
+        model: CompBeamModel = solution.model
+        beams: List[ABeam] = [model.get(idx) for idx in range(0, model.count)]
+        dofs: Tuple[DOF, ...] = model.dofs
+        dof_num: int = model.dof_num
+        omega_sq: ndarray = solution.omega_sq
+
+        # element mode vectors [beams x element DOF x modes]
+        elem_modes: ndarray = solution.modes[
+            model.get_dof_map().get_element_equations()
+        ]
+
+        def quad(elem_matrixes: ndarray) -> ndarray:
+            return einsum("eim,eij,ejm->em", elem_modes, elem_matrixes, elem_modes)
+
+        # bending part of the stiffness matrix is all but the axial DOF
+        bending: ndarray = array([dof != DOF.U for dof in dofs] * 2, dtype=float)
+
+        K1: ndarray = stack([b.get_K(1) for b in beams])
+        M: ndarray = stack([b.get_M() for b in beams])
+        e_modul: ndarray = array([b.e_modul for b in beams])
+        area_moi: ndarray = array([b.area_moi for b in beams])
+        mass: ndarray = array([b.mass for b in beams])
+
+        d_e_modul: ndarray = quad(K1) / e_modul[:, None]
+        d_area_moi: ndarray = quad(K1 * outer(bending, bending)) / area_moi[:, None]
+        d_mass: ndarray = -omega_sq * quad(M) / mass[:, None]
+
+        # node mode vectors [nodes x DOF x modes]
+        node_modes: ndarray = solution.modes.reshape(-1, dof_num, solution.mode_count)
+        disp: List[int] = [
+            idx for idx, dof in enumerate(dofs) if dof.dof_type == DOF_TYPE.DISP
+        ]
+        rot: List[int] = [
+            idx for idx, dof in enumerate(dofs) if dof.dof_type == DOF_TYPE.ROT
+        ]
+
+        d_spring: ndarray = node_modes**2
+        d_node_mass: ndarray = -omega_sq * (node_modes[:, disp, :] ** 2).sum(axis=1)
+        d_node_mmoi: ndarray = -omega_sq * (node_modes[:, rot, :] ** 2).sum(axis=1)
+
+        # axial forces of beam i depend on all masses above: dN_i/dm_j = -gravity for j >= i
+        if self._solver.order == 2 and self._solver.gravity > 0.0:
+            force_x: ndarray = array([b.force_x for b in beams])  # type: ignore
+            K2: ndarray = stack([b.get_K2() for b in beams])  # type: ignore
+            q_K2_unit: ndarray = quad(K2) / where(force_x == 0.0, 1.0, force_x)[:, None]
+            d_force: ndarray = -self._solver.gravity * cumsum(q_K2_unit, axis=0)
+            d_mass += d_force
+            # node k loads all beams below, that is beams 0 .. k-1
+            d_node_mass[1:, :] += d_force
+
+        # d(omega^2) -> d(freq) with freq = omega / (2 pi)
+        scale: ndarray = 1.0 / (8.0 * pi**2 * solution.frequencies)
+
+        return {
+            "e_modul": d_e_modul * scale,
+            "area_moi": d_area_moi * scale,
+            "mass": d_mass * scale,
+            "spring": d_spring * scale,
+            "node_mass": d_node_mass * scale,
+            "node_mmoi": d_node_mmoi * scale,
+        }
@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+"""Solution of many models by a pool of processes, models and results are transported by shared memory."""
+from model.system import CompBeamModel
+from model.system import FrozenCompBeamModel
+from model.beams import ABeam
+
+from copy import deepcopy
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Type, Union
+from numpy import dtype
+from numpy import full
+from numpy import nan
+from numpy import ndarray
+
+from solve.eigen import FlexEigenSolver
+from solve.eigen import ModalSolution
+from solve.eigen import SolutionError
+
+# name of the shared memory block and name, offset, shape and type of each array in the block
+BlockLayout = Tuple[str, Tuple[Tuple[str, int, Tuple[int, ...], str], ...]]
+
+# layout of the block, beam type and names of bending planes of a model in a block
+ModelDescriptor = Tuple[BlockLayout, Type[ABeam], Tuple[str, ...]]
+
+
+class SharedBlock:
+    """Arrays in a shared memory block, other processes attach to these by the layout of the block.
+
+    The block is created and released by one process, use the block as context manager or call close() and
+    unlink(). Arrays are aligned to 64 bytes.
+    """
+
+    _ALIGN: int = 64
+
+    def __init__(self, arrays: Mapping[str, ndarray]) -> None:
+        """Creates a new shared memory block of copies of arrays.
+
+        :param arrays: arrays by name
+        :type arrays: Mapping[str, ndarray]
+        """
+        layout: List[Tuple[str, int, Tuple[int, ...], str]] = []
+        size: int = 0
+        for name, arr in arrays.items():
+            layout.append((name, size, arr.shape, arr.dtype.str))
+            size += -(-arr.nbytes // self._ALIGN) * self._ALIGN
+        self._shm: SharedMemory = SharedMemory(create=True, size=max(size, 1))
+        self._layout: BlockLayout = (self._shm.name, tuple(layout))
+        self._arrays: Dict[str, ndarray] = self._get_arrays(self._shm, self._layout)
+        for name, arr in arrays.items():
+            self._arrays[name][...] = arr
+
+    def __enter__(self) -> "SharedBlock":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+        self.unlink()
+
+    @property
+    def layout(self) -> BlockLayout:
+        """Layout of the block to attach to, see attach().
+
+        :return: name of the block and name, offset, shape and type of each array
+        :rtype: BlockLayout
+        """
+        return self._layout
+
+    @property
+    def arrays(self) -> Dict[str, ndarray]:
+        """Arrays in the block by name, valid until the block is closed.
+
+        :return: arrays by name
+        :rtype: Dict[str, ndarray]
+        """
+        return dict(self._arrays)
+
+    def close(self) -> None:
+        """Closes the access to the block of this process, arrays of the block must not be used afterwards."""
+        self._arrays = {}
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Releases the block, once all processes closed their access."""
+        self._shm.unlink()
+
+    @classmethod
+    def attach(cls, layout: BlockLayout) -> Tuple[SharedMemory, Dict[str, ndarray]]:
+        """Attaches to a block created by another process.
+
+        :param layout: layout of the block
+        :type layout: BlockLayout
+
+        :return: Tuple of first is the shared memory to close after use, second is the arrays by name
+        :rtype: Tuple[SharedMemory, Dict[str, ndarray]]
+
+        :raises FileNotFoundError: if the block does not exist
+        """
+        shm: SharedMemory = SharedMemory(name=layout[0])
+        return shm, cls._get_arrays(shm, layout)
+
+    @staticmethod
+    def _get_arrays(shm: SharedMemory, layout: BlockLayout) -> Dict[str, ndarray]:
+        return {
+            name: ndarray(shape, dtype=dtype(type_str), buffer=shm.buf, offset=offset)
+            for name, offset, shape, type_str in layout[1]
+        }
+
+
+def share_models(
+    models: Sequence[Union[CompBeamModel, FrozenCompBeamModel]],
+) -> Tuple[SharedBlock, List[ModelDescriptor]]:
+    """Places the arrays of models in one shared memory block, see FrozenCompBeamModel.get_arrays().
+
+    :param models: models, models that are not frozen are validated and frozen
+    :type models: Sequence[Union[CompBeamModel, FrozenCompBeamModel]]
+
+    :return: Tuple of first is the block to release after use, second is the descriptor of each model
+    :rtype: Tuple[SharedBlock, List[ModelDescriptor]]
+
+    :raises ValueError: if any model is invalid, see CompBeamModel.validate()
+    """
+    frozen: List[FrozenCompBeamModel] = [
+        m if isinstance(m, FrozenCompBeamModel) else m.freeze() for m in models
+    ]
+    block: SharedBlock = SharedBlock(
+        {
+            f"{idx}/{name}": arr
+            for idx, f in enumerate(frozen)
+            for name, arr in f.get_arrays().items()
+        }
+    )
+    name, layout = block.layout
+    descriptors: List[ModelDescriptor] = []
+    for idx, f in enumerate(frozen):
+        prefix: str = f"{idx}/"
+        descriptors.append(
+            (
+                (name, tuple(a for a in layout if a[0].startswith(prefix))),
+                f.beam_class,
+                tuple(f.plane_names),
+            )
+        )
+    return block, descriptors
+
+
+def attach_model(
+    descriptor: ModelDescriptor,
+) -> Tuple[SharedMemory, FrozenCompBeamModel]:
+    """Attaches to a model in a shared memory block, the arrays of the snapshot are not copied.
+
+    :param descriptor: descriptor of the model, see share_models()
+    :type descriptor: ModelDescriptor
+
+    :return: Tuple of first is the shared memory to close after use of the snapshot, second is the snapshot
+    :rtype: Tuple[SharedMemory, FrozenCompBeamModel]
+    """
+    layout, beam_class, plane_names = descriptor
+    shm, arrays = SharedBlock.attach(layout)
+    return shm, FrozenCompBeamModel.from_arrays(
+        beam_class,
+        plane_names,
+        {name.split("/", 1)[1]: arr for name, arr in arrays.items()},
+    )
+
+
+def _solve_shared(
+    solver: FlexEigenSolver,
+    descriptor: ModelDescriptor,
+    results: BlockLayout,
+    index: int,
+) -> Optional[str]:
+    """Solves a model in shared memory and writes the eigenpairs to the result block, runs in a worker.
+
+    :return: None or message of the error if solution failed
+    :rtype: Optional[str]
+    """
+    shm, frozen = attach_model(descriptor)
+    try:
+        solution: ModalSolution = solver.set_model(frozen.thaw()).solve_modal()
+    except ValueError as e:
+        return str(e)
+    finally:
+        # snapshot refers to the block
+        del frozen
+        shm.close()
+
+    shm, arrays = SharedBlock.attach(results)
+    try:
+        modes: ndarray = solution.modes
+        arrays["omega_sq"][index, : solution.mode_count] = solution.omega_sq
+        arrays["modes"][index, : modes.shape[0], : solution.mode_count] = modes
+    finally:
+        del arrays
+        shm.close()
+    return None
+
+
+class SharedPoolSolver:
+    """Solves many models by the configuration of a solver in a pool of worker processes.
+
+    The arrays of the models are placed in a shared memory block and workers write the eigenpairs to a shared
+    result block. Only the solver configuration and small descriptors of the blocks are passed to the workers.
+    Each worker rebuilds the model of its snapshot, see FrozenCompBeamModel.thaw().
+    """
+
+    def __init__(
+        self, solver: FlexEigenSolver, processes: Optional[int] = None
+    ) -> None:
+        """Creates a new pool solver.
+
+        :param solver: eigen solver with parameters, the model of the solver is ignored
+        :type solver: FlexEigenSolver
+        :param processes: number of worker processes or None for the number of CPUs
+        :type processes: Optional[int]
+
+        :raises ValueError: if solver is None or processes < 1
+        """
+        if solver is None:
+            raise ValueError("Undefined solver")
+        if processes is not None and processes < 1:
+            raise ValueError(f"Invalid number of processes {processes} < 1")
+        self._solver: FlexEigenSolver = deepcopy(solver)
+        self._solver._model = None
+        self._processes: Optional[int] = processes
+
+    @property
+    def processes(self) -> Optional[int]:
+        """Number of worker processes.
+
+        :return: number of processes or None for the number of CPUs
+        :rtype: Optional[int]
+        """
+        return self._processes
+
+    def solve_modal(
+        self, models: Sequence[Union[CompBeamModel, FrozenCompBeamModel]]
+    ) -> Tuple[ndarray, ndarray]:
+        """Solves the eigenpairs of the lowest modes of each model, see FlexEigenSolver.solve_modal().
+
+        Models with less modes or system DOF than others are padded with nan.
+
+        :param models: models to solve
+        :type models: Sequence[Union[CompBeamModel, FrozenCompBeamModel]]
+
+        :return: Tuple of first is the squared angular frequencies [models x modes], second is the mass
+                 normalized mode vectors [models x system DOF x modes]
+        :rtype: Tuple[ndarray, ndarray]
+
+        :raises ValueError: if models is empty or any model is invalid
+        :raises SolutionError: if solution of any model cannot be found
+        """
+        if len(models) == 0:
+            raise ValueError("Empty sequence of models")
+        mode_count: int = self._solver.mode_count
+        block, descriptors = share_models(models)
+        with block:
+            dof_count: int = max(
+                len(block.arrays[f"{idx}/coords"]) * len(beam_class.get_dofs())  # type: ignore
+                for idx, (_, beam_class, _) in enumerate(descriptors)
+            )
+            with SharedBlock(
+                {
+                    "omega_sq": full((len(models), mode_count), nan),
+                    "modes": full((len(models), dof_count, mode_count), nan),
+                }
+            ) as results:
+                with get_context().Pool(self._processes) as pool:
+                    errors: List[Optional[str]] = pool.starmap(
+                        _solve_shared,
+                        [
+                            (self._solver, descriptor, results.layout, idx)
+                            for idx, descriptor in enumerate(descriptors)
+                        ],
+                    )
+                # copies, arrays of the block must not exist when it is closed
+                omega_sq: ndarray = results.arrays["omega_sq"].copy()
+                modes: ndarray = results.arrays["modes"].copy()
+        for idx, error in enumerate(errors):
+            if error is not None:
+                raise SolutionError(f"Unable to solve model {idx}: {error}")
+        return omega_sq, modes
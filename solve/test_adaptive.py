@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+from unittest import TestCase
+from typing import List
+from math import pi
+from math import sqrt
+
+from model.system import CompBeamModel
+from model.beams import BeamB_2DOF
+from model.elements import by_axial_length
+from model.core import DOF
+from solve.eigen import FlexEigenSolver
+from solve.adaptive import AdaptiveRefinement
+from solve.adaptive import RefinementResult
+
+
+class TestAdaptiveRefinement(TestCase):
+    def setUp(self) -> None:
+        # clamped cantilever of 2 beams
+        self.length: float = 10.0
+        self.e_modul: float = 2.1e11
+        self.area_moi: float = 1.0e-4
+        self.mass_per_length: float = 100.0
+        self.model: CompBeamModel = CompBeamModel().add(
+            BeamB_2DOF(
+                *by_axial_length(BeamB_2DOF.get_dofs(), self.length / 2.0),
+                area=0.0,
+                area_moi=self.area_moi,
+                e_modul=self.e_modul,
+                mass=self.mass_per_length * self.length / 2.0,
+            )
+        )
+        self.model.append(
+            self.length / 2.0,
+            area=0.0,
+            area_moi=self.area_moi,
+            e_modul=self.e_modul,
+            mass=self.mass_per_length * self.length / 2.0,
+        )
+        self.model.start_node.set_dof(DOF.W, 0.0).set_dof(DOF.PHI, 0.0)
+
+        # analytical frequencies of the clamped cantilever
+        self.expected: List[float] = [
+            beta_l**2
+            / (2.0 * pi * self.length**2)
+            * sqrt(self.e_modul * self.area_moi / self.mass_per_length)
+            for beta_l in (1.8751040687, 4.6940911330, 7.8547574382)
+        ]
+
+    def _refine(self, mark_fraction: float, target: float) -> RefinementResult:
+        result: RefinementResult = (
+            AdaptiveRefinement(
+                FlexEigenSolver().set_model(self.model).set_mode_count(3)
+            )
+            .set_mark_fraction(mark_fraction)
+            .set_max_steps(10)
+            .refine(target)
+        )
+        self.assertTrue(result.converged)
+        self.assertLessEqual(max(result.error_estimate), target)
+        for exp, fine, extrapolated, estimate in zip(
+            self.expected,
+            result.solution.frequencies,
+            result.frequencies,
+            result.error_estimate,
+        ):
+            print(
+                f"    freq_exp={exp}, freq_fine={fine}, freq_extrapolated={extrapolated}, error={estimate}"
+            )
+            # estimate matches the actual error of the refined model
+            self.assertLess(abs(fine - exp) / exp, 2.0 * target)
+            self.assertLess(abs(extrapolated - exp) / exp, target)
+        print(f"    DOF per step: {result.dof_counts}")
+        return result
+
+    def test_uniform(self) -> None:
+        """
+        < Test uniform refinement and Richardson extrapolation against analytical frequencies
+        """
+        print(TestAdaptiveRefinement.test_uniform.__doc__.strip())  # type: ignore
+        result: RefinementResult = self._refine(0.0, 1.0e-5)
+        self.assertEqual(result.model.count, 2 ** (len(result.dof_counts) - 1) * 2)
+        print("> OK")
+
+    def test_adaptive(self) -> None:
+        """
+        < Test adaptive refinement against analytical frequencies, requires less DOF than uniform refinement
+        """
+        print(TestAdaptiveRefinement.test_adaptive.__doc__.strip())  # type: ignore
+        uniform: RefinementResult = self._refine(0.0, 1.0e-5)
+        adaptive: RefinementResult = self._refine(0.5, 1.0e-5)
+        self.assertLess(adaptive.dof_counts[-1], uniform.dof_counts[-1])
+        # model of the solver is not refined
+        self.assertEqual(self.model.count, 2)
+        print("> OK")
+
+    def test_fails(self) -> None:
+        """
+        < Test adaptive refinement fails for invalid parameters
+        """
+        print(TestAdaptiveRefinement.test_fails.__doc__.strip())  # type: ignore
+
+        with self.assertRaises(ValueError) as context:
+            AdaptiveRefinement(None)  # type: ignore
+        print(f"   EXPECTED: {str(context.exception)}")
+        refinement: AdaptiveRefinement = AdaptiveRefinement(FlexEigenSolver())
+        with self.assertRaises(ValueError) as context:
+            refinement.refine(1.0e-3)
+        print(f"   EXPECTED: {str(context.exception)}")
+        refinement.solver.set_model(self.model)
+        with self.assertRaises(ValueError) as context:
+            refinement.refine(0.0)
+        print(f"   EXPECTED: {str(context.exception)}")
+        with self.assertRaises(ValueError) as context:
+            refinement.set_mark_fraction(1.5)
+        print(f"   EXPECTED: {str(context.exception)}")
+        with self.assertRaises(ValueError) as context:
+            refinement.set_max_steps(0)
+        print(f"   EXPECTED: {str(context.exception)}")
+        with self.assertRaises(ValueError) as context:
+            refinement.set_convergence_rate(0.0)
+        print(f"   EXPECTED: {str(context.exception)}")
+        print("> OK")
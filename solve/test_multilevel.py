@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+from unittest import TestCase
+from pathlib import Path
+from typing import List
+from math import nan
+
+from model.system import CompBeamModel
+from model.beams import ABeam
+from model.beams import BeamB_2DOF
+from model.core import DOF
+from data_io.json import JsonReader
+from solve.eigen import FlexEigenSolver
+from solve.eigen import ModalSolution
+from solve.multilevel import MultilevelEigenSolver
+
+
+class _BeamWithoutShapeFunctions(BeamB_2DOF):
+    """Beam type of another package, that does not implement get_N()."""
+
+    get_N = ABeam.get_N
+
+
+class TestMultilevelEigenSolver(TestCase):
+    def setUp(self) -> None:
+        model_file: Path = Path(__file__).absolute().parent / "ut" / "dlubal_beam.json"
+        self.model: CompBeamModel = (
+            JsonReader().set_file_name(str(model_file)).read()["model"]
+        )
+
+    @staticmethod
+    def _refined(model: CompBeamModel, parts: int) -> CompBeamModel:
+        return model.subdivided([parts] * model.count)
+
+    def _solver(self, order: int) -> FlexEigenSolver:
+        return FlexEigenSolver().set_order(order).set_mode_count(4)
+
+    def test_prolongate(self) -> None:
+        """
+        < Test prolongation of modes onto the same and a refined model
+        """
+        print(TestMultilevelEigenSolver.test_prolongate.__doc__.strip())  # type: ignore
+
+        solution: ModalSolution = self._solver(1).set_model(self.model).solve_modal()
+        same = MultilevelEigenSolver.prolongate(solution, self.model)
+        self.assertAlmostEqual(abs(same - solution.modes).max(), 0.0, delta=1.0e-12)
+
+        # nodes of the coarse model keep their values in the refined model
+        refined: CompBeamModel = self._refined(self.model, 2)
+        fine = MultilevelEigenSolver.prolongate(solution, refined)
+        dof_num: int = self.model.dof_num
+        for idx in range(0, len(self.model.nodes)):
+            self.assertAlmostEqual(
+                abs(
+                    fine[2 * idx * dof_num : (2 * idx + 1) * dof_num]
+                    - solution.modes[idx * dof_num : (idx + 1) * dof_num]
+                ).max(),
+                0.0,
+                delta=1.0e-12,
+            )
+        print("> OK")
+
+    def _test_order(self, order: int) -> None:
+        models: List[CompBeamModel] = [
+            self._refined(self.model, parts) for parts in (1, 2, 4)
+        ]
+        multilevel: MultilevelEigenSolver = MultilevelEigenSolver(self._solver(order))
+        solutions: List[ModalSolution] = multilevel.solve_levels(models)
+        print(f"    order={order}: iterations={multilevel.iterations}")
+        self.assertEqual(multilevel.iterations[0], 0)
+        for iterations in multilevel.iterations[1:]:
+            self.assertLess(iterations, 10)
+
+        # mass matrixes of the refined models are ill-conditioned, eigenvalues differ by round-off
+        for model, solution in zip(models, solutions):
+            expected: ModalSolution = self._solver(order).set_model(model).solve_modal()
+            self.assertEqual(solution.mode_count, expected.mode_count)
+            for exp, act in zip(expected.frequencies, solution.frequencies):
+                self.assertAlmostEqual(exp, act, delta=exp * 1.0e-7)
+
+        # hierarchy built by merging nodes of the finest model
+        expected = self._solver(order).set_model(models[-1]).solve_modal()
+        actual: ModalSolution = MultilevelEigenSolver(
+            self._solver(order).set_model(models[-1])
+        ).solve_modal(levels=3)
+        for exp, act in zip(expected.frequencies, actual.frequencies):
+            print(f"    order={order}: freq_exp={exp}, freq_act={act}")
+            self.assertAlmostEqual(exp, act, delta=exp * 1.0e-7)
+
+    def test_solve_order_1(self) -> None:
+        """
+        < Test multilevel solution of refined models against full solution, no pDelta effect
+        """
+        print(TestMultilevelEigenSolver.test_solve_order_1.__doc__.strip())  # type: ignore
+        self._test_order(1)
+        print("> OK")
+
+    def test_solve_order_2(self) -> None:
+        """
+        < Test multilevel solution of refined models against full solution, with pDelta effect
+        """
+        print(TestMultilevelEigenSolver.test_solve_order_2.__doc__.strip())  # type: ignore
+        self._test_order(2)
+        print("> OK")
+
+    def test_merged(self) -> None:
+        """
+        < Test merging beams of a refined model restores the coarse model
+        """
+        print(TestMultilevelEigenSolver.test_merged.__doc__.strip())  # type: ignore
+
+        refined: CompBeamModel = self._refined(self.model, 2)
+        merged: CompBeamModel = refined.merged(range(0, len(refined.nodes), 2))
+        self.assertEqual(merged.count, self.model.count)
+        self.assertAlmostEqual(merged.length, self.model.length, delta=1.0e-9)
+        self.assertEqual(merged.spring_count, 1)
+        self.assertEqual(merged.mass_count(), self.model.mass_count())
+        for idx in range(0, self.model.count):
+            exp, act = self.model.get(idx), merged.get(idx)
+            self.assertAlmostEqual(exp.mass, act.mass, delta=exp.mass * 1.0e-12)
+            self.assertAlmostEqual(
+                exp.area_moi, act.area_moi, delta=exp.area_moi * 1.0e-12
+            )
+            self.assertAlmostEqual(
+                exp.e_modul, act.e_modul, delta=exp.e_modul * 1.0e-12
+            )
+
+        with self.assertRaises(ValueError) as context:
+            refined.merged([0, 2])
+        print(f"   EXPECTED: {str(context.exception)}")
+        with self.assertRaises(ValueError) as context:
+            refined.merged([0, 2, 1, len(refined.nodes) - 1])
+        print(f"   EXPECTED: {str(context.exception)}")
+        print("> OK")
+
+    def test_fails(self) -> None:
+        """
+        < Test multilevel solver fails for invalid parameters
+        """
+        print(TestMultilevelEigenSolver.test_fails.__doc__.strip())  # type: ignore
+
+        with self.assertRaises(ValueError) as context:
+            MultilevelEigenSolver(None)  # type: ignore
+        print(f"   EXPECTED: {str(context.exception)}")
+        multilevel: MultilevelEigenSolver = MultilevelEigenSolver(self._solver(1))
+        with self.assertRaises(ValueError) as context:
+            multilevel.solve_modal()
+        print(f"   EXPECTED: {str(context.exception)}")
+        with self.assertRaises(ValueError) as context:
+            multilevel.solve_levels([])
+        print(f"   EXPECTED: {str(context.exception)}")
+        with self.assertRaises(ValueError) as context:
+            multilevel.set_tol(0.0)
+        print(f"   EXPECTED: {str(context.exception)}")
+        with self.assertRaises(ValueError) as context:
+            multilevel.set_max_iterations(0)
+        print(f"   EXPECTED: {str(context.exception)}")
+
+        # beam type without shape functions
+        model: CompBeamModel = CompBeamModel.from_arrays(
+            _BeamWithoutShapeFunctions,
+            [10.0] * 4,
+            0.5,
+            0.2,
+            2.1e11,
+            4000.0,
+            dof_values={DOF.W: [0.0] + [nan] * 4, DOF.PHI: [0.0] + [nan] * 4},
+        )
+        self.assertFalse(_BeamWithoutShapeFunctions.has_shape_functions())
+        self.assertTrue(BeamB_2DOF.has_shape_functions())
+        with self.assertRaises(NotImplementedError) as context_n:
+            model.start_beam.get_N(0.5)
+        print(f"   EXPECTED: {str(context_n.exception)}")
+        with self.assertRaises(ValueError) as context:
+            MultilevelEigenSolver(self._solver(1).set_model(model)).solve_modal()
+        print(f"   EXPECTED: {str(context.exception)}")
+        print("> OK")
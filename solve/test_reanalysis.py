@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+from unittest import TestCase
+from pathlib import Path
+from typing import List, Tuple
+from copy import deepcopy
+from math import nan
+
+from model.system import CompBeamModel
+from model.entry import Mass
+from model.entry import Spring
+from model.core import DOF
+from model.beams import BeamB_3DOF
+from model.beams import BeamBQ_3DOF
+from data_io.json import JsonReader
+from solve.eigen import FlexEigenSolver
+from solve.eigen import ModalSolution
+from solve.reanalysis import LowRankEigenUpdate
+
+
+class TestLowRankEigenUpdate(TestCase):
+    def setUp(self) -> None:
+        model_file: Path = (
+            Path(__file__).absolute().parent / "ut" / "wind_tower3_noBC.json"
+        )
+        self.model: CompBeamModel = (
+            JsonReader().set_file_name(str(model_file)).read()["model"]
+        )
+        self.model.attach_spring(
+            self.model.start_node,
+            Spring().set_value(DOF.W, 3.0e8).set_value(DOF.PHI, 2.0e10),
+        )
+        self.dofs: List[Tuple[int, DOF]] = [(0, DOF.W), (0, DOF.PHI), (-1, DOF.W)]
+        # spring values of base, top mass
+        self.sweep: List[Tuple[float, float, float]] = [
+            (4.0e8, 2.0e10, 0.0),
+            (1.0e8, 7.0e10, 0.0),
+            (3.0e8, 2.0e10, 2.0e5),
+            (8.0e8, 2.1e10, 1.0e5),
+        ]
+
+    def _solve_modified(
+        self, solver: FlexEigenSolver, spring_w: float, spring_phi: float, mass: float
+    ) -> ModalSolution:
+        model: CompBeamModel = deepcopy(self.model)
+        model.get_spring(model.start_node).set_value(DOF.W, spring_w).set_value(
+            DOF.PHI, spring_phi
+        )
+        if mass > 0.0:
+            model.add_mass(model.end_node, Mass().set_mass(mass))
+        return deepcopy(solver).set_model(model).solve_modal()
+
+    def _test_order(self, order: int) -> None:
+        solver: FlexEigenSolver = (
+            FlexEigenSolver().set_model(self.model).set_order(order).set_mode_count(5)
+        )
+        update: LowRankEigenUpdate = LowRankEigenUpdate(
+            solver.solve_modal(), self.dofs, gravity=solver.gravity
+        )
+
+        for spring_w, spring_phi, mass in self.sweep:
+            updated: ModalSolution = update.update(
+                [spring_w - 3.0e8, spring_phi - 2.0e10, 0.0], [0.0, 0.0, mass]
+            )
+            expected: ModalSolution = self._solve_modified(
+                solver, spring_w, spring_phi, mass
+            )
+            for exp, act in zip(expected.frequencies, updated.frequencies):
+                print(
+                    f"    order={order}, spring=({spring_w}, {spring_phi}), mass={mass}:"
+                    f" freq_exp={exp}, freq_act={act}"
+                )
+                # update and default solver (eigenvalues of M^-1 * K) agree to a few 1.0e-6
+                self.assertAlmostEqual(exp, act, delta=exp * 1.0e-5)
+
+    def test_update_order_1(self) -> None:
+        """
+        < Test low rank update of base spring and top mass against full solution, no pDelta effect
+        """
+        print(TestLowRankEigenUpdate.test_update_order_1.__doc__.strip())  # type: ignore
+        self._test_order(1)
+        print("> OK")
+
+    def test_update_order_2(self) -> None:
+        """
+        < Test low rank update of base spring and top mass against full solution, with pDelta effect
+        """
+        print(TestLowRankEigenUpdate.test_update_order_2.__doc__.strip())  # type: ignore
+        self._test_order(2)
+        print("> OK")
+
+    def test_fails(self) -> None:
+        """
+        < Test low rank update fails for DOF removed by boundary conditions, unsupported DOF and invalid modifications
+        """
+        print(TestLowRankEigenUpdate.test_fails.__doc__.strip())  # type: ignore
+
+        model: CompBeamModel = deepcopy(self.model)
+        model.start_node.set_dof(DOF.W, 0.0).set_dof(DOF.PHI, 0.0)
+        solution: ModalSolution = FlexEigenSolver().set_model(model).solve_modal()
+
+        with self.assertRaises(ValueError) as context:
+            LowRankEigenUpdate(solution, [(0, DOF.W)])
+        print(f"   EXPECTED: {str(context.exception)}")
+
+        with self.assertRaises(IndexError) as context_idx:
+            LowRankEigenUpdate(solution, [(len(model.nodes), DOF.W)])
+        print(f"   EXPECTED: {str(context_idx.exception)}")
+
+        update: LowRankEigenUpdate = LowRankEigenUpdate(solution, [(-1, DOF.W)])
+        with self.assertRaises(ValueError) as context:
+            update.update(delta_M=[1.0, 2.0])
+        print(f"   EXPECTED: {str(context.exception)}")
+
+        # axial and curvature DOF
+        for beam_type, dof in ((BeamB_3DOF, DOF.U), (BeamBQ_3DOF, DOF.KAPPA)):
+            beam_model: CompBeamModel = CompBeamModel.from_arrays(
+                beam_type,
+                [10.0] * 5,
+                0.5,
+                0.2,
+                2.1e11,
+                4000.0,
+                dof_values={d: [0.0] + [nan] * 5 for d in beam_type.get_dofs()},
+            )
+            beam_solution: ModalSolution = (
+                FlexEigenSolver().set_model(beam_model).set_mode_count(3).solve_modal()
+            )
+            with self.assertRaises(ValueError) as context:
+                LowRankEigenUpdate(beam_solution, [(-1, dof)])
+            print(f"   EXPECTED: {str(context.exception)}")
+
+        print("> OK")
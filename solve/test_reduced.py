@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+from unittest import TestCase
+from pathlib import Path
+from typing import List
+from copy import deepcopy
+from numpy import allclose
+from numpy import ix_
+from numpy import ndarray
+from numpy.linalg import norm
+
+from model.system import CompBeamModel
+from model.entry import Mass
+from model.entry import Spring
+from model.core import DOF
+from data_io.json import JsonReader
+from solve.eigen import FlexEigenSolver
+from solve.eigen import ModalSolution
+from solve.eigen import SolutionError
+from solve.reduced import ReducedBasisEngine
+
+
+class TestReducedBasisEngine(TestCase):
+    def setUp(self) -> None:
+        model_file: Path = (
+            Path(__file__).absolute().parent / "ut" / "wind_tower3_noBC.json"
+        )
+        self.model: CompBeamModel = (
+            JsonReader().set_file_name(str(model_file)).read()["model"]
+        )
+        self.model.attach_spring(
+            self.model.start_node,
+            Spring().set_value(DOF.W, 3.0e8).set_value(DOF.PHI, 2.0e10),
+        )
+        self.training: List[CompBeamModel] = [
+            self._variant(e_factor, mass_factor, spring_w, spring_phi, top_mass)
+            for e_factor in (0.9, 1.1)
+            for mass_factor in (0.9, 1.1)
+            for spring_w, spring_phi in ((1.0e8, 1.0e10), (8.0e8, 7.0e10))
+            for top_mass in (0.0, 2.0e5)
+        ]
+
+    def _variant(
+        self,
+        e_factor: float,
+        mass_factor: float,
+        spring_w: float,
+        spring_phi: float,
+        top_mass: float,
+    ) -> CompBeamModel:
+        model: CompBeamModel = deepcopy(self.model)
+        for beam in model._beams:
+            beam.set_e_modul(beam.e_modul * e_factor).set_mass(beam.mass * mass_factor)
+        model.get_spring(model.start_node).set_value(DOF.W, spring_w).set_value(
+            DOF.PHI, spring_phi
+        )
+        if top_mass > 0.0:
+            model.add_mass(model.end_node, Mass().set_mass(top_mass))
+        return model
+
+    def _test_order(self, order: int) -> None:
+        solver: FlexEigenSolver = FlexEigenSolver().set_order(order).set_mode_count(5)
+        engine: ReducedBasisEngine = ReducedBasisEngine(self.model).train(
+            solver, self.training, basis_size=20
+        )
+        self.assertLessEqual(engine.basis_size, 20)
+        self.assertIsNotNone(engine.training_error)
+
+        for model in [
+            self._variant(1.0, 1.0, 3.0e8, 2.0e10, 1.0e5),
+            self._variant(0.95, 1.05, 5.0e8, 4.0e10, 5.0e4),
+        ]:
+            expected: ModalSolution = deepcopy(solver).set_model(model).solve_modal()
+            reduced: ModalSolution = (
+                deepcopy(solver).set_model(model).set_engine(engine).solve_modal()
+            )
+            assert reduced.error_indicator is not None
+            # error indicator of the reduced operators is the residual of the full system, up to rounding
+            free: ndarray = reduced.free
+            sys_K: ndarray = reduced.model.get_K(order)[ix_(free, free)]
+            sys_M: ndarray = reduced.model.get_M()[ix_(free, free)]
+            modes: ndarray = reduced.modes[free]
+            omega_sq_M_x: ndarray = reduced.omega_sq * sys_M.dot(modes)
+            residual: ndarray = norm(sys_K.dot(modes) - omega_sq_M_x, axis=0) / norm(
+                omega_sq_M_x, axis=0
+            )
+            self.assertTrue(
+                allclose(residual, reduced.error_indicator, rtol=1.0e-2, atol=1.0e-4)
+            )
+            for exp, act, error in zip(
+                expected.frequencies, reduced.frequencies, reduced.error_indicator
+            ):
+                print(
+                    f"    order={order}: freq_exp={exp}, freq_act={act}, error={error}"
+                )
+                # reduced and default solver (eigenvalues of M^-1 * K) agree to a few 1.0e-6
+                self.assertAlmostEqual(exp, act, delta=exp * 1.0e-5)
+                self.assertLess(error, 1.0e-3)
+
+    def test_solve_order_1(self) -> None:
+        """
+        < Test reduced basis solution of variants against full solution, no pDelta effect
+        """
+        print(TestReducedBasisEngine.test_solve_order_1.__doc__.strip())  # type: ignore
+        self._test_order(1)
+        print("> OK")
+
+    def test_solve_order_2(self) -> None:
+        """
+        < Test reduced basis solution of variants against full solution, with pDelta effect
+        """
+        print(TestReducedBasisEngine.test_solve_order_2.__doc__.strip())  # type: ignore
+        self._test_order(2)
+        print("> OK")
+
+    def test_fails(self) -> None:
+        """
+        < Test reduced basis engine fails if not trained and for models that are no variant of the template
+        """
+        print(TestReducedBasisEngine.test_fails.__doc__.strip())  # type: ignore
+
+        engine: ReducedBasisEngine = ReducedBasisEngine(self.model)
+        solver: FlexEigenSolver = FlexEigenSolver().set_model(self.model)
+        with self.assertRaises(SolutionError) as context:
+            deepcopy(solver).set_engine(engine).solve_modal()
+        print(f"   EXPECTED: {str(context.exception)}")
+
+        with self.assertRaises(ValueError) as context:
+            engine.train(solver, [])
+        print(f"   EXPECTED: {str(context.exception)}")
+
+        engine.train(solver, self.training[:2], basis_size=6)
+        model: CompBeamModel = deepcopy(self.model)
+        model.start_beam.set_area_moi(model.start_beam.area_moi * 1.1)
+        with self.assertRaises(ValueError) as context:
+            deepcopy(solver).set_model(model).set_engine(engine).solve_modal()
+        print(f"   EXPECTED: {str(context.exception)}")
+
+        print("> OK")
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+from unittest import TestCase
+from typing import Callable
+from copy import deepcopy
+
+from model.system import CompBeamModel
+from model.entry import Mass
+from model.entry import Spring
+from model.core import DOF
+from model.beams import BeamB_2DOF_II
+from model.elements import by_axial_length
+from solve.eigen import FlexEigenSolver
+from solve.sensitivity import FlexEigenSensitivity
+
+from numpy import ndarray
+
+
+class TestFlexEigenSensitivity(TestCase):
+    def setUp(self) -> None:
+        self.model: CompBeamModel = CompBeamModel().add(
+            BeamB_2DOF_II(
+                *by_axial_length(BeamB_2DOF_II.get_dofs(), 2.5),
+                area=0.12,
+                area_moi=0.35,
+                e_modul=2.1e11,
+                mass=2400.0,
+            )
+        )
+        for idx in range(1, 12):
+            self.model.append(
+                2.5,
+                area=0.12,
+                area_moi=0.35 - 0.02 * idx,
+                e_modul=2.1e11,
+                mass=2400.0 - 100.0 * idx,
+            )
+        self.model.attach_spring(
+            self.model.start_node,
+            Spring().set_value(DOF.W, 3.0e8).set_value(DOF.PHI, 2.0e10),
+        )
+        self.model.add_mass(self.model.end_node, Mass().set_mass(8.0e4))
+        self.node_idx: int = 6
+        self.model.add_mass(self.model.nodes[self.node_idx], Mass().set_mass(5.0e3))
+        self.mode_count: int = 3
+
+    def _solve(self, model: CompBeamModel, order: int) -> ndarray:
+        freq, _ = (
+            FlexEigenSolver()
+            .set_model(model)
+            .set_order(order)
+            .set_mode_count(self.mode_count)
+            .solve()
+        )
+        return freq
+
+    def _central_difference(
+        self,
+        order: int,
+        value: float,
+        apply: Callable[[CompBeamModel, float], None],
+    ) -> ndarray:
+        step: float = value * 1.0e-4
+        model_plus: CompBeamModel = deepcopy(self.model)
+        apply(model_plus, value + step)
+        model_minus: CompBeamModel = deepcopy(self.model)
+        apply(model_minus, value - step)
+        return (self._solve(model_plus, order) - self._solve(model_minus, order)) / (
+            2.0 * step
+        )
+
+    def _assert_derivative(
+        self, name: str, value: float, expected: ndarray, actual: ndarray
+    ) -> None:
+        # compare derivatives scaled by value, that is the change of frequency by relative change of value
+        for mode, (exp, act) in enumerate(zip(expected * value, actual * value)):
+            print(f"    {name}, mode {mode + 1}: fd={exp:.6e}, analytical={act:.6e}")
+            self.assertAlmostEqual(
+                exp, act, delta=abs(exp) * 1.0e-3 + 1.0e-9, msg=f"{name} mode {mode}"
+            )
+
+    def _test_order(self, order: int) -> None:
+        solver: FlexEigenSolver = (
+            FlexEigenSolver()
+            .set_model(self.model)
+            .set_order(order)
+            .set_mode_count(self.mode_count)
+        )
+        freq, derivatives = FlexEigenSensitivity(solver).solve()
+        self.assertEqual((self.model.count, self.mode_count), derivatives["mass"].shape)
+        self.assertEqual(
+            (self.model.count + 1, self.model.dof_num, self.mode_count),
+            derivatives["spring"].shape,
+        )
+
+        beam_idx: int = 4
+        beam = self.model.get(beam_idx)
+        self._assert_derivative(
+            "e_modul",
+            beam.e_modul,
+            self._central_difference(
+                order, beam.e_modul, lambda m, v: m.get(beam_idx).set_e_modul(v) and None
+            ),
+            derivatives["e_modul"][beam_idx],
+        )
+        self._assert_derivative(
+            "area_moi",
+            beam.area_moi,
+            self._central_difference(
+                order,
+                beam.area_moi,
+                lambda m, v: m.get(beam_idx).set_area_moi(v) and None,
+            ),
+            derivatives["area_moi"][beam_idx],
+        )
+        self._assert_derivative(
+            "mass",
+            beam.mass,
+            self._central_difference(
+                order, beam.mass, lambda m, v: m.get(beam_idx).set_mass(v) and None
+            ),
+            derivatives["mass"][beam_idx],
+        )
+        self._assert_derivative(
+            "spring",
+            3.0e8,
+            self._central_difference(
+                order,
+                3.0e8,
+                lambda m, v: m.get_spring(m.start_node).set_value(DOF.W, v) and None,
+            ),
+            derivatives["spring"][0, self.model.dofs.index(DOF.W)],
+        )
+        self._assert_derivative(
+            "node_mass",
+            5.0e3,
+            self._central_difference(
+                order,
+                5.0e3,
+                lambda m, v: m.get_masses_of_node(m.nodes[self.node_idx])[0].set_mass(v)
+                and None,
+            ),
+            derivatives["node_mass"][self.node_idx],
+        )
+
+    def test_order_1(self) -> None:
+        """
+        < Test analytical frequency derivatives against finite differences, no pDelta effect.
+        """
+        print(TestFlexEigenSensitivity.test_order_1.__doc__.strip())  # type: ignore
+        self._test_order(1)
+        print("> OK")
+
+    def test_order_2(self) -> None:
+        """
+        < Test analytical frequency derivatives against finite differences, with pDelta effect.
+        """
+        print(TestFlexEigenSensitivity.test_order_2.__doc__.strip())  # type: ignore
+        self._test_order(2)
+        print("> OK")
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+from unittest import TestCase
+from typing import List
+
+from model.system import CompBeamModel
+from model.beams import BeamB_2DOF_II
+from model.core import DOF
+from numpy import arange
+from numpy import isnan
+from numpy import nan
+from solve.eigen import FlexEigenSolver
+from solve.eigen import ModalSolution
+from solve.shared import SharedBlock
+from solve.shared import SharedPoolSolver
+from solve.shared import attach_model
+from solve.shared import share_models
+
+
+class TestSharedPoolSolver(TestCase):
+    def setUp(self) -> None:
+        # clamped cantilevers of different number of beams
+        self.models: List[CompBeamModel] = []
+        for count in (4, 6, 5):
+            model: CompBeamModel = CompBeamModel.from_arrays(
+                BeamB_2DOF_II,
+                [10.0 / count] * count,
+                0.0,
+                1.0e-4,
+                2.1e11,
+                1000.0 / count,
+                masses=[0.0] * count + [50.0],
+                dof_values={
+                    DOF.W: [0.0] + [nan] * count,
+                    DOF.PHI: [0.0] + [nan] * count,
+                },
+            )
+            self.models.append(model)
+
+    def test_shared_block(self) -> None:
+        """
+        < Test arrays and models in shared memory blocks
+        """
+        print(TestSharedPoolSolver.test_shared_block.__doc__.strip())  # type: ignore
+
+        with SharedBlock({"a": arange(5.0), "b": arange(6).reshape(2, 3)}) as block:
+            shm, arrays = SharedBlock.attach(block.layout)
+            self.assertEqual(arrays["a"].tolist(), [0.0, 1.0, 2.0, 3.0, 4.0])
+            self.assertEqual(arrays["b"].shape, (2, 3))
+            # writes are visible to all processes attached
+            arrays["b"][1, 2] = 10
+            self.assertEqual(block.arrays["b"][1, 2], 10)
+            del arrays
+            shm.close()
+
+        block, descriptors = share_models(self.models)
+        with block:
+            for model, descriptor in zip(self.models, descriptors):
+                shm, frozen = attach_model(descriptor)
+                self.assertEqual(frozen, model.freeze())
+                self.assertTrue((frozen.get_K(2) == model.get_K(2)).all())
+                del frozen
+                shm.close()
+        print("> OK")
+
+    def test_solve_modal(self) -> None:
+        """
+        < Test solution of models in worker processes against solution of each model
+        """
+        print(TestSharedPoolSolver.test_solve_modal.__doc__.strip())  # type: ignore
+
+        solver: FlexEigenSolver = FlexEigenSolver().set_order(2).set_mode_count(3)
+        omega_sq, modes = SharedPoolSolver(solver, processes=2).solve_modal(
+            [self.models[0], self.models[1].freeze(), self.models[2]]
+        )
+        self.assertEqual(omega_sq.shape, (3, 3))
+        self.assertEqual(modes.shape, (3, 14, 3))
+        for idx, model in enumerate(self.models):
+            expected: ModalSolution = solver.set_model(model).solve_modal()
+            dof_count: int = len(expected.modes)
+            print(f"    model {idx}: omega_sq={omega_sq[idx]}")
+            self.assertTrue((omega_sq[idx] == expected.omega_sq).all())
+            self.assertTrue((modes[idx, :dof_count] == expected.modes).all())
+            self.assertTrue(isnan(modes[idx, dof_count:]).all())
+        print("> OK")
+
+    def test_fails(self) -> None:
+        """
+        < Test pool solver fails for invalid parameters and models
+        """
+        print(TestSharedPoolSolver.test_fails.__doc__.strip())  # type: ignore
+
+        with self.assertRaises(ValueError) as context:
+            SharedPoolSolver(None)  # type: ignore
+        print(f"   EXPECTED: {str(context.exception)}")
+        with self.assertRaises(ValueError) as context:
+            SharedPoolSolver(FlexEigenSolver(), processes=0)
+        print(f"   EXPECTED: {str(context.exception)}")
+        with self.assertRaises(ValueError) as context:
+            SharedPoolSolver(FlexEigenSolver()).solve_modal([])
+        print(f"   EXPECTED: {str(context.exception)}")
+        self.models[1].get(2).set_mass(0.0)
+        with self.assertRaises(ValueError) as context:
+            SharedPoolSolver(FlexEigenSolver()).solve_modal(self.models)
+        print(f"   EXPECTED: {str(context.exception)}")
+        print("> OK")
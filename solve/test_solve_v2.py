@@ -2,10 +2,25 @@ from unittest import TestCase
 from unittest import main
 
 from model.system import CompBeamModel
+from model.system import BoundaryScenario
 from model.beams import PBeamPDelta
+from model.beams import BeamB_2DOF
+from model.beams import BeamB_3DOF
+from model.elements import by_axial_length
+from model.core import DOF
+from model.core import AXIS
+from model.entry import Mass
+from model.entry import Spring
+from model.beams import BeamB_2DOF_II
+from model.beams import BeamBT_2DOF
+from model.beams import BeamBT_2DOF_II
+from model.beams import BeamBQ_3DOF
+from model.beams import BeamBQ_3DOF_II
 from data_io.json import JsonReader
 from solve.forces import CompBeamSolver
 from solve.eigen import FlexEigenSolver
+from solve.eigen import ModalSolution
+from solve.eigen import SolutionError
 
 from pathlib import Path
 from typing import Any
@@ -13,9 +28,21 @@ from typing import Dict
 from typing import List
 from typing import Optional
 from copy import copy
+from copy import deepcopy
+from pickle import dumps
+from pickle import loads
+from math import pi
+from math import sqrt
 
 from numpy import ndarray
 from numpy import array
+from numpy import allclose
+from numpy import array_equal
+from numpy import ix_
+from numpy import argsort
+from numpy.linalg import eig
+from numpy.linalg import inv
+from numpy.linalg import norm
 
 
 wind_tower_model: Optional[CompBeamModel] = None
@@ -273,6 +300,60 @@ class TestBeamSolver(TestCase):
 
         print("> OK")
 
+    def test_get_beams_normal_forces_mmoi(self) -> None:
+        """
+        < Test normal forces of all beams of model without weight of masses with MMOI only.
+        """
+        print(TestBeamSolver.test_get_beams_normal_forces_mmoi.__doc__.strip())  # type: ignore
+
+        # shared model is not changed
+        model: CompBeamModel = deepcopy(self.model)
+        model.add_mass(model.end_node, Mass().set_mmoi(DOF.PHI, 2.0e6))
+        model.add_mass(model.nodes[3], Mass().set_mmoi(DOF.PHI, 1.0e5))
+        solver: CompBeamSolver = CompBeamSolver(model)
+        for accumulate, expected in (
+            (False, self.beams_normal_force_expected),
+            (True, self.beams_normal_force_acc_expected),
+        ):
+            actual: ndarray = solver.get_beams_normal_forces(
+                gravity=10.0, accumulate=accumulate
+            )
+            for exp, act in zip(expected, actual):
+                self.assertAlmostEqual(exp, act, delta=1.0e-9)
+
+        print("> OK")
+
+    def test_get_beams_normal_forces_line_masses(self) -> None:
+        """
+        < Test normal forces of all beams of model include the weight of line masses.
+        """
+        print(TestBeamSolver.test_get_beams_normal_forces_line_masses.__doc__.strip())  # type: ignore
+
+        # shared model is not changed
+        model: CompBeamModel = deepcopy(self.model)
+        model.add_line_mass(10.0, 50.0, 100.0)
+        line_mass: ndarray = model.get_beams_line_mass()
+        print(f"   line mass per beam = {line_mass}")
+        self.assertAlmostEqual(4000.0, line_mass.sum(), delta=1.0e-9)
+
+        solver: CompBeamSolver = CompBeamSolver(model)
+        for accumulate in (False, True):
+            weight: ndarray = -10.0 * line_mass
+            if accumulate:
+                weight = weight[::-1].cumsum()[::-1]
+            actual: ndarray = solver.get_beams_normal_forces(
+                gravity=10.0, accumulate=accumulate
+            )
+            expected: List[float] = (
+                self.beams_normal_force_acc_expected
+                if accumulate
+                else self.beams_normal_force_expected
+            )
+            for exp, w, act in zip(expected, weight, actual):
+                self.assertAlmostEqual(exp + w, act, delta=1.0e-9)
+
+        print("> OK")
+
     def test_set_beams_axial_force(self) -> None:
         """
         < Test setting normal forces for all beams of model.
@@ -340,6 +421,28 @@ class TestDlubalBeam_I(TestCase):
 
         print("> OK")
 
+    def test_mode_shapes_not_normalized(self) -> None:
+        """
+        < Test mode shapes of dlubal beam not normalized to 1.0, eigenvectors of unit length
+        """
+        print(TestDlubalBeam_I.test_mode_shapes_not_normalized.__doc__.strip())  # type: ignore
+
+        self.eigen_solver.set_normalize_shapes(False)
+        _, mode_shapes = self.eigen_solver.solve()
+
+        # eigenvectors of the system reduced by the DOF of the start node
+        dof_num: int = self.model.dof_num
+        sys_M: ndarray = self.model.get_M()[dof_num:, dof_num:]
+        sys_K: ndarray = self.model.get_K(1)[dof_num:, dof_num:]
+        omega_sq, vectors = eig(inv(sys_M).dot(sys_K))
+        vectors = vectors[:, argsort(omega_sq.real)[:5]].real
+        expected: ndarray = vectors[self.model.dofs.index(DOF.W) :: dof_num, :]
+
+        self.assertTrue(allclose(0.0, mode_shapes[0, 1:]))
+        self.assertTrue(allclose(abs(expected), abs(mode_shapes[1:, 1:]), atol=1.0e-8))
+
+        print("> OK")
+
 
 class TestDlubalBeam_II(TestCase):
     def setUp(self) -> None:
@@ -428,5 +531,627 @@ class TestTowerMunich_II(TestCase):
         print("> OK")
 
 
+class TestMixedPrecision(TestCase):
+    def setUp(self) -> None:
+
+        self.model: CompBeamModel = get_tower_munich_model()
+        self.eigen_solver: FlexEigenSolver = FlexEigenSolver()
+        self.eigen_solver.set_gravity(9.81)
+        self.eigen_solver.set_mode_count(4)
+        self.eigen_solver.set_model(self.model)
+        self.eigen_solver.set_normalize_shapes(True)
+
+    def test_frequencies(self) -> None:
+        """
+        < Test frequency and mode shapes of radio tower munich, single precision with refinement
+        """
+        print(TestMixedPrecision.test_frequencies.__doc__.strip())  # type: ignore
+
+        for order in (1, 2):
+            self.eigen_solver.set_order(order)
+            freq_64, msv_64 = self.eigen_solver.set_precision("float64").solve()
+            freq_32, msv_32 = self.eigen_solver.set_precision("float32").solve()
+
+            for f_64, f_32 in zip(freq_64, freq_32):
+                print(f"    order={order}: float64={f_64}, float32={f_32}   -> ok")
+                self.assertAlmostEqual(f_64, f_32, delta=f_64 * 1.0e-8)
+            self.assertTrue(allclose(abs(msv_64), abs(msv_32), atol=1.0e-6))
+
+        print("> OK")
+
+    def test_residuals(self) -> None:
+        """
+        < Test residuals of refined eigenpairs of wind tower, single precision with refinement
+        """
+        print(TestMixedPrecision.test_residuals.__doc__.strip())  # type: ignore
+
+        model: CompBeamModel = get_wind_tower_model()
+        self.eigen_solver.set_model(model)
+
+        def get_residuals(solution: ModalSolution) -> ndarray:
+            sys_K: ndarray = model.get_K()[ix_(solution.free, solution.free)]
+            sys_M: ndarray = model.get_M()[ix_(solution.free, solution.free)]
+            modes: ndarray = solution.modes[solution.free]
+            return norm(
+                sys_K.dot(modes) - sys_M.dot(modes) * solution.omega_sq, axis=0
+            ) / norm(sys_M.dot(modes) * solution.omega_sq, axis=0)
+
+        residuals_64: ndarray = get_residuals(
+            self.eigen_solver.set_precision("float64").solve_modal()
+        )
+        residuals_32: ndarray = get_residuals(
+            self.eigen_solver.set_precision("float32").solve_modal()
+        )
+
+        for mode, (res_64, res_32) in enumerate(zip(residuals_64, residuals_32)):
+            print(
+                f"    mode {mode + 1}: relative residual float64={res_64},"
+                f" float32={res_32}"
+            )
+            self.assertLess(res_32, res_64)
+
+        with self.assertRaises(ValueError) as context:
+            self.eigen_solver.set_precision("float16")
+        print(f"   EXPECTED: {str(context.exception)}")
+
+        print("> OK")
+
+
+class TestDecoupledAxial(TestCase):
+    def setUp(self) -> None:
+        self.length: float = 2.0
+        self.beam_count: int = 40
+        self.beam_data: Dict[str, float] = {
+            "area": 0.2,
+            "area_moi": 0.05,
+            "e_modul": 2.1e11,
+            "mass": 3140.0,
+        }
+
+    def _get_model(self, beam_type: Any) -> CompBeamModel:
+        model: CompBeamModel = CompBeamModel().add(
+            beam_type(
+                *by_axial_length(beam_type.get_dofs(), self.length), **self.beam_data
+            )
+        )
+        for _ in range(1, self.beam_count):
+            model.append(self.length, **self.beam_data)
+        for dof in model.dofs:
+            model.start_node.set_dof(dof, 0.0)
+        return model
+
+    def test_flexural_frequencies(self) -> None:
+        """
+        < Test frequencies of 3DOF beam equal 2DOF beam, axial DOF are decoupled
+        """
+        print(TestDecoupledAxial.test_flexural_frequencies.__doc__.strip())  # type: ignore
+
+        solver: FlexEigenSolver = FlexEigenSolver().set_mode_count(4)
+        for precision in ("float64", "float32"):
+            solver.set_precision(precision)
+            solution_2: ModalSolution = (
+                solver.set_model(self._get_model(BeamB_2DOF)).solve_modal()
+            )
+            solution_3: ModalSolution = (
+                solver.set_model(self._get_model(BeamB_3DOF)).solve_modal()
+            )
+            self.assertEqual(2 * self.beam_count, len(solution_3.free))
+            for f_2, f_3 in zip(solution_2.frequencies, solution_3.frequencies):
+                print(f"    {precision}: 2DOF={f_2}, 3DOF={f_3}   -> ok")
+                self.assertAlmostEqual(f_2, f_3, delta=f_2 * 1.0e-8)
+
+        print("> OK")
+
+    def test_reduced_system(self) -> None:
+        """
+        < Test reduced system of 3DOF beam is the flexural system solved by solve_modal()
+        """
+        print(TestDecoupledAxial.test_reduced_system.__doc__.strip())  # type: ignore
+
+        model: CompBeamModel = self._get_model(BeamB_3DOF)
+        solver: FlexEigenSolver = FlexEigenSolver().set_model(model).set_mode_count(4)
+        prepared, sys_K, sys_M, free = solver.get_reduced_system()
+        self.assertIsNot(prepared, model)
+        self.assertFalse(model.is_validated)
+        self.assertTrue(array_equal(solver.solve_modal().free, free))
+        self.assertTrue(array_equal(prepared.get_K()[ix_(free, free)], sys_K))
+        self.assertTrue(array_equal(prepared.get_M()[ix_(free, free)], sys_M))
+
+        with self.assertRaises(SolutionError) as context:
+            FlexEigenSolver().get_reduced_system()
+        print(f"   EXPECTED: {str(context.exception)}")
+
+        print("> OK")
+
+    def test_axial_frequencies(self) -> None:
+        """
+        < Test axial frequencies of 3DOF beam against analytical solution of clamped rod
+        """
+        print(TestDecoupledAxial.test_axial_frequencies.__doc__.strip())  # type: ignore
+
+        solution: ModalSolution = (
+            FlexEigenSolver()
+            .set_model(self._get_model(BeamB_3DOF))
+            .set_mode_count(3)
+            .solve_axial()
+        )
+        self.assertEqual(self.beam_count, len(solution.free))
+
+        # f_n = (2n - 1) / (4 L) * sqrt(E A / (mass / length))
+        wave_speed: float = sqrt(
+            self.beam_data["e_modul"]
+            * self.beam_data["area"]
+            * self.length
+            / self.beam_data["mass"]
+        )
+        total_length: float = self.length * self.beam_count
+        # discretization error of linear axial shape functions increases with mode number
+        for n, freq in enumerate(solution.frequencies, 1):
+            expected: float = (2 * n - 1) / (4.0 * total_length) * wave_speed
+            print(f"    mode {n}: expected={expected}, actual={freq}")
+            self.assertAlmostEqual(expected, freq, delta=expected * 5.0e-3)
+
+        with self.assertRaises(SolutionError) as context:
+            FlexEigenSolver().set_model(self._get_model(BeamB_2DOF)).solve_axial()
+        print(f"   EXPECTED: {str(context.exception)}")
+
+        print("> OK")
+
+
+class TestBendingPlanes(TestCase):
+    def setUp(self) -> None:
+        self.model: CompBeamModel = CompBeamModel().add(
+            BeamB_2DOF_II(
+                *by_axial_length(BeamB_2DOF_II.get_dofs(), 4.0),
+                area=0.3,
+                area_moi=0.8,
+                e_modul=2.1e11,
+                mass=9000.0,
+            )
+        )
+        for idx in range(1, 20):
+            self.model.append(
+                4.0,
+                area=0.3,
+                area_moi=0.8 - 0.03 * idx,
+                e_modul=2.1e11,
+                mass=9000.0 - 300.0 * idx,
+            )
+        self.model.attach_spring(
+            self.model.start_node,
+            Spring().set_value(DOF.W, 2.0e9).set_value(DOF.PHI, 8.0e11),
+        )
+        self.model.add_mass(self.model.end_node, Mass().set_mass(1.2e5))
+        self.model.attach_plane_spring(
+            "fore_aft",
+            self.model.start_node,
+            Spring().set_value(DOF.W, 1.0e9).set_value(DOF.PHI, 3.0e11),
+        )
+        self.model.add_plane_mass(
+            "fore_aft", self.model.end_node, Mass().set_mmoi(DOF.PHI, 4.0e6)
+        )
+        self.model.add_plane_mass(
+            "side_side", self.model.end_node, Mass().set_mass(2.0e4)
+        )
+
+    def test_plane_model(self) -> None:
+        """
+        < Test model of bending plane replaces springs and adds masses
+        """
+        print(TestBendingPlanes.test_plane_model.__doc__.strip())  # type: ignore
+
+        self.assertEqual(["fore_aft", "side_side"], self.model.plane_names)
+        fore_aft: CompBeamModel = self.model.get_plane_model("fore_aft")
+        self.assertEqual([], fore_aft.plane_names)
+        self.assertEqual(
+            3.0e11, fore_aft.get_spring(fore_aft.start_node).get_value(DOF.PHI)
+        )
+        self.assertEqual(2, fore_aft.mass_count())
+        side_side: CompBeamModel = self.model.get_plane_model("side_side")
+        self.assertEqual(
+            8.0e11, side_side.get_spring(side_side.start_node).get_value(DOF.PHI)
+        )
+        self.assertAlmostEqual(1.4e5, side_side.total_node_masses, delta=1.0e-6)
+        # model itself is unchanged
+        self.assertEqual(1, self.model.mass_count())
+
+        with self.assertRaises(KeyError) as context:
+            self.model.get_plane_model("vertical")
+        print(f"   EXPECTED: {str(context.exception)}")
+
+        print("> OK")
+
+    def test_pickle_solution(self) -> None:
+        """
+        < Test pickled modal solution equals the solution, including the solved model
+        """
+        print(TestBendingPlanes.test_pickle_solution.__doc__.strip())  # type: ignore
+
+        solution: ModalSolution = (
+            FlexEigenSolver().set_order(2).set_model(self.model).solve_modal()
+        )
+        # the solver validates its copy, the model set is not changed
+        self.assertFalse(self.model.is_validated)
+        self.assertTrue(solution.model.is_validated)
+        copied: ModalSolution = loads(dumps(solution))
+        self.assertTrue((copied.omega_sq == solution.omega_sq).all())
+        self.assertTrue((copied.modes == solution.modes).all())
+        self.assertTrue((copied.free == solution.free).all())
+        self.assertEqual(copied.order, 2)
+        self.assertIsNone(copied.error_indicator)
+        # axial forces of the solved model are kept
+        self.assertEqual(copied.model.freeze(), solution.model.freeze())
+        self.assertTrue((copied.model.get_K(2) == solution.model.get_K(2)).all())
+
+        print("> OK")
+
+    def test_solve_planes(self) -> None:
+        """
+        < Test solution of bending planes in one call against solution of each plane model
+        """
+        print(TestBendingPlanes.test_solve_planes.__doc__.strip())  # type: ignore
+
+        solver: FlexEigenSolver = FlexEigenSolver().set_mode_count(4)
+        for order in (1, 2):
+            for precision in ("float64", "float32"):
+                solver.set_order(order).set_precision(precision)
+                solutions: Dict[str, ModalSolution] = solver.set_model(
+                    self.model
+                ).solve_planes()
+                self.assertEqual(["fore_aft", "side_side"], list(solutions.keys()))
+                for name, solution in solutions.items():
+                    expected: ModalSolution = solver.set_model(
+                        self.model.get_plane_model(name)
+                    ).solve_modal()
+                    for exp, act in zip(expected.frequencies, solution.frequencies):
+                        print(
+                            f"    order={order}, {precision}, {name}: freq_exp={exp},"
+                            f" freq_act={act}"
+                        )
+                        self.assertAlmostEqual(exp, act, delta=exp * 1.0e-10)
+
+        with self.assertRaises(SolutionError) as context:
+            solver.set_model(self.model.get_plane_model("fore_aft")).solve_planes()
+        print(f"   EXPECTED: {str(context.exception)}")
+
+        print("> OK")
+
+
+class TestBoundaryScenarios(TestCase):
+    def setUp(self) -> None:
+        model_file: Path = (
+            Path(__file__).absolute().parent / "ut" / "wind_tower3_noBC.json"
+        )
+        self.model: CompBeamModel = (
+            JsonReader().set_file_name(str(model_file)).read()["model"]
+        )
+        x_top: float = self.model.end_node.get_coord(AXIS.X)
+        self.scenarios: List[BoundaryScenario] = [
+            BoundaryScenario("fixed").fix(0.0),
+            BoundaryScenario("soft").attach_spring(
+                0.0, Spring().set_value(DOF.W, 3.0e8).set_value(DOF.PHI, 2.0e10)
+            ),
+            BoundaryScenario("stiff").attach_spring(
+                0.0, Spring().set_value(DOF.W, 3.0e10).set_value(DOF.PHI, 2.0e12)
+            ),
+            BoundaryScenario("guyed").fix(0.0).fix(x_top, DOF.W),
+        ]
+
+    def test_solve_scenarios(self) -> None:
+        """
+        < Test solution of boundary condition scenarios in one call against solution of each scenario model
+        """
+        print(TestBoundaryScenarios.test_solve_scenarios.__doc__.strip())  # type: ignore
+
+        solver: FlexEigenSolver = (
+            FlexEigenSolver().set_model(self.model).set_mode_count(3)
+        )
+        for order in (1, 2):
+            solver.set_order(order)
+            solutions: Dict[str, ModalSolution] = solver.solve_scenarios(self.scenarios)
+            self.assertEqual(
+                ["fixed", "soft", "stiff", "guyed"], list(solutions.keys())
+            )
+            for scenario in self.scenarios:
+                expected: ModalSolution = (
+                    copy(solver).set_model(scenario.apply(self.model)).solve_modal()
+                )
+                actual: ModalSolution = solutions[scenario.name]
+                for exp, act in zip(expected.frequencies, actual.frequencies):
+                    print(
+                        f"    order={order}, {scenario.name}: freq_exp={exp},"
+                        f" freq_act={act}"
+                    )
+                    self.assertAlmostEqual(exp, act, delta=exp * 1.0e-10)
+
+            # stiffer foundation, higher frequencies
+            freq: Dict[str, ndarray] = {
+                name: solution.frequencies for name, solution in solutions.items()
+            }
+            self.assertTrue(all(freq["soft"] < freq["stiff"]))
+            self.assertTrue(all(freq["stiff"] < freq["fixed"]))
+            self.assertTrue(all(freq["fixed"] < freq["guyed"]))
+            # top lateral DOF removed for guyed
+            self.assertEqual(
+                len(solutions["fixed"].free) - 1, len(solutions["guyed"].free)
+            )
+
+        print("> OK")
+
+    def test_empty_scenario(self) -> None:
+        """
+        < Test empty scenario reproduces the solution of the model with boundary conditions at any node
+        """
+        print(TestBoundaryScenarios.test_empty_scenario.__doc__.strip())  # type: ignore
+
+        self.model.start_node.set_dof(DOF.W, 0.0).set_dof(DOF.PHI, 0.0)
+        self.model.nodes[5].set_dof(DOF.W, 0.0)
+        solver: FlexEigenSolver = (
+            FlexEigenSolver().set_model(self.model).set_mode_count(3)
+        )
+        expected: ModalSolution = solver.solve_modal()
+        actual: ModalSolution = solver.solve_scenarios([BoundaryScenario("as-is")])[
+            "as-is"
+        ]
+        self.assertTrue(array_equal(expected.free, actual.free))
+        for exp, act in zip(expected.frequencies, actual.frequencies):
+            print(f"    freq_exp={exp}, freq_act={act}")
+            self.assertAlmostEqual(exp, act, delta=exp * 1.0e-10)
+        self.assertAlmostEqual(
+            solver.solve()[0][0], expected.frequencies[0], delta=1.0e-9
+        )
+
+        print("> OK")
+
+    def test_fails(self) -> None:
+        """
+        < Test solution of boundary condition scenarios fails for insufficient or invalid scenarios
+        """
+        print(TestBoundaryScenarios.test_fails.__doc__.strip())  # type: ignore
+
+        solver: FlexEigenSolver = FlexEigenSolver().set_model(self.model)
+        with self.assertRaises(SolutionError) as context:
+            solver.solve_scenarios([BoundaryScenario("pinned").fix(0.0, DOF.W)])
+        print(f"   EXPECTED: {str(context.exception)}")
+
+        with self.assertRaises(ValueError) as context_names:
+            solver.solve_scenarios([self.scenarios[0], BoundaryScenario("fixed")])
+        print(f"   EXPECTED: {str(context_names.exception)}")
+
+        with self.assertRaises(ValueError) as context_x:
+            solver.solve_scenarios([BoundaryScenario("off").fix(-1.0)])
+        print(f"   EXPECTED: {str(context_x.exception)}")
+
+        print("> OK")
+
+
+class TestTaperedBeams(TestCase):
+    def setUp(self) -> None:
+        # conical cans: length, diameters, thicknesses, mass
+        self.cans: List[Any] = [
+            (20.0, 6.0, 5.0, 0.05, 0.04, 2.0e5),
+            (25.0, 5.0, 4.2, 0.04, 0.03, 1.5e5),
+            (30.0, 4.2, 3.0, 0.03, 0.02, 1.0e5),
+        ]
+
+    def _get_tapered(self, beam_type: Any) -> CompBeamModel:
+        model: CompBeamModel = CompBeamModel()
+        for length, d_1, d_2, t_1, t_2, mass in self.cans:
+            data: Dict[str, float] = {
+                "diameter_1": d_1,
+                "diameter_2": d_2,
+                "thickness_1": t_1,
+                "thickness_2": t_2,
+                "e_modul": 2.1e11,
+                "mass": mass,
+            }
+            if model.is_empty:
+                model.add(
+                    beam_type(*by_axial_length(beam_type.get_dofs(), length), **data)
+                )
+            else:
+                model.append(length, **data)
+        model.start_node.set_dof(DOF.W, 0.0).set_dof(DOF.PHI, 0.0)
+        model.add_mass(model.end_node, Mass().set_mass(3.0e5))
+        return model
+
+    def _get_prismatic(
+        self, tapered: CompBeamModel, beam_type: Any, parts: int
+    ) -> CompBeamModel:
+        """Chops each can into prismatic segments with the mean section of the segment."""
+        model: CompBeamModel = CompBeamModel()
+        for beam in tapered.subdivided([parts] * tapered.count).beams:
+            data: Dict[str, float] = {
+                "area": beam.area,
+                "area_moi": beam.area_moi,
+                "e_modul": beam.e_modul,
+                "mass": beam.mass,
+            }
+            if model.is_empty:
+                model.add(
+                    beam_type(
+                        *by_axial_length(beam_type.get_dofs(), beam.length), **data
+                    )
+                )
+            else:
+                model.append(beam.length, **data)
+        model.start_node.set_dof(DOF.W, 0.0).set_dof(DOF.PHI, 0.0)
+        model.add_mass(model.end_node, Mass().set_mass(3.0e5))
+        return model
+
+    def _solve(self, model: CompBeamModel) -> ndarray:
+        return (
+            FlexEigenSolver()
+            .set_model(model)
+            .set_order(model.order)
+            .set_mode_count(3)
+            .solve_modal()
+            .frequencies
+        )
+
+    def test_cans(self) -> None:
+        """
+        < Test tapered beams of conical cans against prismatic segments, with and without pDelta effect
+        """
+        print(TestTaperedBeams.test_cans.__doc__.strip())  # type: ignore
+
+        for tapered_type, prismatic_type in (
+            (BeamBT_2DOF, BeamB_2DOF),
+            (BeamBT_2DOF_II, BeamB_2DOF_II),
+        ):
+            tapered: CompBeamModel = self._get_tapered(tapered_type)
+            converged: ndarray = self._solve(tapered.subdivided([32] * tapered.count))
+            # prismatic segments converge to the tapered beam
+            for exp, act in zip(
+                converged, self._solve(self._get_prismatic(tapered, prismatic_type, 64))
+            ):
+                print(f"    {tapered_type.__name__}: tapered={exp}, prismatic={act}")
+                self.assertAlmostEqual(exp, act, delta=exp * 1.0e-4)
+
+            # 3 tapered beams per can are more accurate than 5 prismatic segments
+            for exp, act_tapered, act_prismatic in zip(
+                converged,
+                self._solve(tapered.subdivided([3] * tapered.count)),
+                self._solve(self._get_prismatic(tapered, prismatic_type, 5)),
+            ):
+                self.assertLess(abs(act_tapered - exp), abs(act_prismatic - exp))
+
+        print("> OK")
+
+
+class TestQuinticBeams(TestCase):
+    def setUp(self) -> None:
+        self.length: float = 80.0
+        self.e_modul: float = 2.1e11
+        self.area_moi: float = 0.5
+        self.mass_per_length: float = 4000.0
+
+    def _get_model(
+        self, beam_type: Any, count: int, top_mass: float = 0.0
+    ) -> CompBeamModel:
+        data: Dict[str, float] = {
+            "area": 0.5,
+            "area_moi": self.area_moi,
+            "e_modul": self.e_modul,
+            "mass": self.mass_per_length * self.length / count,
+        }
+        model: CompBeamModel = CompBeamModel().add(
+            beam_type(
+                *by_axial_length(beam_type.get_dofs(), self.length / count), **data
+            )
+        )
+        for _ in range(1, count):
+            model.append(self.length / count, **data)
+        model.start_node.set_dof(DOF.W, 0.0).set_dof(DOF.PHI, 0.0)
+        if top_mass > 0.0:
+            model.add_mass(model.end_node, Mass().set_mass(top_mass))
+        return model
+
+    def _solve(self, model: CompBeamModel) -> ModalSolution:
+        return (
+            FlexEigenSolver()
+            .set_model(model)
+            .set_order(model.order)
+            .set_mode_count(8)
+            .solve_modal()
+        )
+
+    def test_cantilever(self) -> None:
+        """
+        < Test quintic beams against analytical frequencies of 8 modes, less DOF than cubic beams
+        """
+        print(TestQuinticBeams.test_cantilever.__doc__.strip())  # type: ignore
+
+        expected: List[float] = [
+            beta_l**2
+            / (2.0 * pi * self.length**2)
+            * sqrt(self.e_modul * self.area_moi / self.mass_per_length)
+            for beta_l in (
+                1.8751040687,
+                4.6940911330,
+                7.8547574382,
+                10.9955407349,
+                14.1371683910,
+                17.2787595321,
+                20.4203522459,
+                23.5619449020,
+            )
+        ]
+        quintic: ModalSolution = self._solve(self._get_model(BeamBQ_3DOF, 8))
+        cubic: ModalSolution = self._solve(self._get_model(BeamB_2DOF, 32))
+        print(f"    DOF: quintic={len(quintic.free)}, cubic={len(cubic.free)}")
+        self.assertLess(len(quintic.free), len(cubic.free))
+        for exp, act_quintic, act_cubic in zip(
+            expected, quintic.frequencies, cubic.frequencies
+        ):
+            print(f"    freq_exp={exp}, quintic={act_quintic}, cubic={act_cubic}")
+            self.assertAlmostEqual(exp, act_quintic, delta=exp * 1.0e-4)
+            self.assertLessEqual(abs(act_quintic - exp), abs(act_cubic - exp))
+
+        # curvature of the clamped start node is free
+        self.assertEqual(len(quintic.free), 8 * 3 + 1)
+
+        print("> OK")
+
+    def test_pdelta(self) -> None:
+        """
+        < Test quintic beams with pDelta effect against refined cubic beams
+        """
+        print(TestQuinticBeams.test_pdelta.__doc__.strip())  # type: ignore
+
+        # light tower with heavy top mass, axial forces are almost constant
+        self.mass_per_length = 10.0
+        expected: ndarray = self._solve(
+            self._get_model(BeamB_2DOF_II, 256, 3.0e6)
+        ).frequencies
+        first_order: ndarray = self._solve(
+            self._get_model(BeamBQ_3DOF, 8, 3.0e6)
+        ).frequencies
+        actual: ndarray = self._solve(
+            self._get_model(BeamBQ_3DOF_II, 8, 3.0e6)
+        ).frequencies
+        for exp, act, act_1 in zip(expected, actual, first_order):
+            print(f"    freq_exp={exp}, freq_act={act}, freq_1st_order={act_1}")
+            self.assertAlmostEqual(exp, act, delta=exp * 2.0e-4)
+            self.assertLess(act, act_1)
+
+        print("> OK")
+
+
+class TestCoarsen(TestCase):
+    def setUp(self) -> None:
+        model_file: Path = (
+            Path(__file__).absolute().parent / ".." / "exe" / "ut" / "wind_tower_2.json"
+        )
+        self.model: CompBeamModel = (
+            JsonReader().set_file_name(str(model_file)).read()["model"]
+        )
+
+    def test_frequencies(self) -> None:
+        """
+        < Test frequencies of coarsened models against the estimated error, with and without pDelta effect
+        """
+        print(TestCoarsen.test_frequencies.__doc__.strip())  # type: ignore
+
+        for order in (1, 2):
+            solver: FlexEigenSolver = (
+                FlexEigenSolver().set_order(order).set_mode_count(4)
+            )
+            expected: ndarray = solver.set_model(self.model).solve_modal().frequencies
+            for tolerance in (0.02, 0.1):
+                coarse, error = self.model.coarsen(tolerance)
+                actual: ndarray = solver.set_model(coarse).solve_modal().frequencies
+                print(
+                    f"    order={order}, tolerance={tolerance}: beams={coarse.count}, error={error},"
+                    f" max. rel. error={max(abs(actual - expected) / expected)}"
+                )
+                self.assertLess(coarse.count, self.model.count)
+                self.assertLessEqual(error, tolerance)
+                for exp, act in zip(expected, actual):
+                    self.assertAlmostEqual(exp, act, delta=exp * error)
+
+        print("> OK")
+
+
 if __name__ == "__main__":
     main()